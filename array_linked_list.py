@@ -0,0 +1,278 @@
+from array import array as _array
+from typing import Any, Iterable, Optional
+
+# Link value used for "no node" on next/prev arrays
+NIL = -1
+# Prev value used to mark a slot that is on the free list
+FREE = -2
+
+
+class ArrayDoubleLinkedList:
+    """
+    Double linked list that stores elements and next/prev links in parallel arrays instead of one
+    _Node object per element. Nodes are referenced by integer handles (slot indexes); handles stay
+    valid until their element is removed, after which the slot is recycled through a free list.
+    """
+    def __init__(self, array: Optional[Iterable] = None, typecode: Optional[str] = None):
+        """
+        :param array: None or iterable, elements appended to the list in order
+        :param typecode: None or array typecode (e.g. 'q', 'd'), store elements in a typed array
+        """
+        self._typecode = typecode
+        self._elements = _array(typecode) if typecode else []
+        self._next = _array('q')
+        self._prev = _array('q')
+        self._head = NIL
+        self._tail = NIL
+        self._free = NIL
+        self._size = 0
+
+        if array is not None:
+            for x in array:
+                self.append(x)
+
+    @property
+    def head(self) -> Optional[int]:
+        return None if self._head == NIL else self._head
+
+    @property
+    def tail(self) -> Optional[int]:
+        return None if self._tail == NIL else self._tail
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        nxt = self._next
+        cursor = self._head
+        while cursor != NIL:
+            yield cursor
+            cursor = nxt[cursor]
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def capacity(self) -> int:
+        """
+        Returns the number of allocated slots, including the ones on the free list
+        """
+        return len(self._next)
+
+    # Slot management
+    def _allocate(self, e: Any, nxt: int, prv: int) -> int:
+        """
+        Takes a slot from the free list or grows the arrays by one slot
+        :returns: int, handle of the new slot
+        """
+        if self._free != NIL:
+            handle = self._free
+            self._free = self._next[handle]
+            self._elements[handle] = e
+            self._next[handle] = nxt
+            self._prev[handle] = prv
+        else:
+            handle = len(self._next)
+            self._elements.append(e)
+            self._next.append(nxt)
+            self._prev.append(prv)
+        self._size += 1
+        return handle
+
+    def _release(self, handle: int) -> Any:
+        """
+        Puts a slot back on the free list
+        :returns: element stored in the slot
+        """
+        e = self._elements[handle]
+        if self._typecode is None:
+            # Drop the reference so the element can be collected
+            self._elements[handle] = None
+        self._next[handle] = self._free
+        self._prev[handle] = FREE
+        self._free = handle
+        self._size -= 1
+        return e
+
+    def _check(self, handle: int) -> None:
+        if not isinstance(handle, int) or not 0 <= handle < len(self._prev) or self._prev[handle] == FREE:
+            raise TypeError('Invalid node handle')
+
+    # Node accessors
+    def get(self, handle: int) -> Any:
+        self._check(handle)
+        return self._elements[handle]
+
+    def set(self, handle: int, e: Any) -> None:
+        self._check(handle)
+        self._elements[handle] = e
+
+    def next(self, handle: int) -> Optional[int]:
+        self._check(handle)
+        nxt = self._next[handle]
+        return None if nxt == NIL else nxt
+
+    def prev(self, handle: int) -> Optional[int]:
+        self._check(handle)
+        prv = self._prev[handle]
+        return None if prv == NIL else prv
+
+    # List interface
+    def push(self, e: Any) -> int:
+        """
+        Creates a new head slot at the beginning of the list with element "e"
+        :param e: Any, element stored in the slot
+        :returns: int, handle of the new slot
+        """
+        handle = self._allocate(e, self._head, NIL)
+        if self._head == NIL:
+            self._tail = handle
+        else:
+            self._prev[self._head] = handle
+        self._head = handle
+        return handle
+
+    def append(self, e: Any) -> int:
+        """
+        Creates a new tail slot at the end of the list with element "e"
+        :param e: Any, element stored in the slot
+        :returns: int, handle of the new slot
+        """
+        handle = self._allocate(e, NIL, self._tail)
+        if self._tail == NIL:
+            self._head = handle
+        else:
+            self._next[self._tail] = handle
+        self._tail = handle
+        return handle
+
+    def insert_after(self, e: Any, node: int) -> int:
+        """
+        Inserts new element after specified handle, if handle is last on list, creates new tail
+        :param e: Any, element stored in the slot
+        :param node: int, handle for position reference in linked list
+        :returns: int, handle of the new slot
+        """
+        self._check(node)
+        if node == self._tail:
+            return self.append(e)
+        fwd = self._next[node]
+        handle = self._allocate(e, fwd, node)
+        self._prev[fwd] = handle
+        self._next[node] = handle
+        return handle
+
+    def insert_before(self, e: Any, node: int) -> int:
+        """
+        Inserts new element before specified handle, if handle is first on list, creates new head
+        :param e: Any, element stored in the slot
+        :param node: int, handle for position reference in linked list
+        :returns: int, handle of the new slot
+        """
+        self._check(node)
+        if node == self._head:
+            return self.push(e)
+        bef = self._prev[node]
+        handle = self._allocate(e, node, bef)
+        self._next[bef] = handle
+        self._prev[node] = handle
+        return handle
+
+    def remove(self, node: int) -> Any:
+        """
+        Unlinks the specified handle from the list and frees its slot
+        :param node: int, handle to be removed
+        :returns: element stored in the slot
+        """
+        self._check(node)
+        nxt, prv = self._next[node], self._prev[node]
+        if prv == NIL:
+            self._head = nxt
+        else:
+            self._next[prv] = nxt
+        if nxt == NIL:
+            self._tail = prv
+        else:
+            self._prev[nxt] = prv
+        return self._release(node)
+
+    def pop(self) -> Any:
+        """
+        Returns and deletes the last element of the list
+        """
+        if self._tail == NIL:
+            raise ValueError('Linked list is empty')
+        return self.remove(self._tail)
+
+    def pull(self) -> Any:
+        """
+        Returns and deletes the first element of the list
+        """
+        if self._head == NIL:
+            raise ValueError('Linked list is empty')
+        return self.remove(self._head)
+
+    # Getters
+    def first(self) -> Any:
+        if self._head == NIL:
+            raise ValueError('List is empty or does not have a head')
+        return self._elements[self._head]
+
+    def last(self) -> Any:
+        if self._tail == NIL:
+            raise ValueError('List is empty or does not have a tail')
+        return self._elements[self._tail]
+
+    def get_median(self, start: Optional[int] = None) -> int:
+        """
+        Returns the median handle of the linked list
+        """
+        if start is None:
+            start = self._head
+        nxt = self._next
+        slow, fast = start, nxt[start]
+        while fast != NIL and nxt[fast] != NIL:
+            slow = nxt[slow]
+            fast = nxt[nxt[fast]]
+        return slow
+
+    def find(self, value: Any) -> int:
+        """
+        :param value: Any, value to be found inside the list
+        :return: int, handle where value is found
+        """
+        if self._size == 0:
+            raise TypeError('List is empty')
+
+        elements, nxt = self._elements, self._next
+        cursor = self._head
+        while cursor != NIL:
+            if elements[cursor] == value:
+                return cursor
+            cursor = nxt[cursor]
+
+        raise ValueError('Value not found')
+
+    # Sorting
+    def sort_values(self, method='merge', ascending=True):
+        """
+        Sorts the list by relinking slots, handles keep pointing to the same elements
+        :param method: 'merge' or 'insertion', both relink through the same stable sort
+        :param ascending: order of values
+        """
+        if method not in ('merge', 'insertion'):
+            raise ValueError(f'Unknown sort method {method}')
+        if self._size < 2:
+            return self
+
+        handles = sorted(self, key=self._elements.__getitem__, reverse=not ascending)
+        nxt, prv = self._next, self._prev
+        # Relink slots following the sorted handle order
+        previous = NIL
+        for handle in handles:
+            prv[handle] = previous
+            if previous != NIL:
+                nxt[previous] = handle
+            previous = handle
+        nxt[previous] = NIL
+        self._head, self._tail = handles[0], previous
+        return self
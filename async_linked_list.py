@@ -0,0 +1,198 @@
+import asyncio
+from typing import Any, Iterable, List, Optional
+
+from concurrent_linked_list import Empty, Full
+from linked_list import DoubleLinkedList
+
+
+class AsyncDequeQueue:
+    """
+    asyncio queue over a DoubleLinkedList with awaitable operations at both ends. Waiting
+    coroutines are parked on futures and woken one at a time, get_many lets a consumer take a
+    batch of elements per wakeup and async for drains the queue until it is closed
+    """
+    def __init__(self, array: Optional[Iterable] = None, maxsize: int = 0):
+        """
+        :param array: None or iterable, elements appended to the queue in order
+        :param maxsize: int, maximum number of elements, 0 for an unbounded queue
+        """
+        self._list = DoubleLinkedList(array)
+        self._maxsize = maxsize
+        if 0 < maxsize < len(self._list):
+            raise Full('More initial elements than maxsize')
+        # Futures of coroutines waiting for an element or for a free slot
+        self._getters = DoubleLinkedList()
+        self._putters = DoubleLinkedList()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._list)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def empty(self) -> bool:
+        return self._list.is_empty()
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= len(self._list)
+
+    def close(self) -> None:
+        """
+        Stops accepting elements and wakes every waiting coroutine. Consumers still get the
+        remaining elements, then pull raises Empty and async for finishes
+        """
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while not waiters.is_empty():
+                waiter = waiters.pull()
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    # Waiting
+    @staticmethod
+    def _wakeup(waiters: DoubleLinkedList) -> None:
+        """
+        Wakes the oldest waiter that is still pending
+        """
+        while not waiters.is_empty():
+            waiter = waiters.pull()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters: DoubleLinkedList, ready) -> None:
+        """
+        Parks the current coroutine on waiters until ready() is true
+        """
+        while not ready():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                # Handle case where this waiter was woken, pass the wakeup to the next one
+                if ready() and not waiter.cancelled():
+                    self._wakeup(waiters)
+                raise
+
+    async def _wait_items(self) -> None:
+        await self._wait(self._getters, lambda: not self.empty() or self._closed)
+
+    async def _wait_slot(self) -> None:
+        await self._wait(self._putters, lambda: not self.full() or self._closed)
+
+    # Producers
+    def push_nowait(self, e: Any) -> None:
+        """
+        Adds element at the head of the queue, raises Full if there is no free slot
+        """
+        self._check_open()
+        if self.full():
+            raise Full('Queue is full')
+        self._list.push(e)
+        self._wakeup(self._getters)
+
+    def append_nowait(self, e: Any) -> None:
+        """
+        Adds element at the tail of the queue, raises Full if there is no free slot
+        """
+        self._check_open()
+        if self.full():
+            raise Full('Queue is full')
+        self._list.append(e)
+        self._wakeup(self._getters)
+
+    async def push(self, e: Any) -> None:
+        """
+        Adds element at the head of the queue, waiting for a free slot
+        """
+        await self._wait_slot()
+        self.push_nowait(e)
+
+    async def append(self, e: Any) -> None:
+        """
+        Adds element at the tail of the queue, waiting for a free slot
+        """
+        await self._wait_slot()
+        self.append_nowait(e)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError('Queue is closed')
+
+    # Consumers
+    def pull_nowait(self) -> Any:
+        """
+        Returns and deletes the first element, raises Empty if there is none
+        """
+        if self.empty():
+            raise Empty('Queue is empty')
+        e = self._list.pull()
+        self._wakeup(self._putters)
+        return e
+
+    def pop_nowait(self) -> Any:
+        """
+        Returns and deletes the last element, raises Empty if there is none
+        """
+        if self.empty():
+            raise Empty('Queue is empty')
+        e = self._list.pop()
+        self._wakeup(self._putters)
+        return e
+
+    async def pull(self) -> Any:
+        """
+        Returns and deletes the first element, waiting for one to arrive. Raises Empty once the
+        queue is closed and drained
+        """
+        await self._wait_items()
+        return self.pull_nowait()
+
+    async def pop(self) -> Any:
+        """
+        Returns and deletes the last element, waiting for one to arrive. Raises Empty once the
+        queue is closed and drained
+        """
+        await self._wait_items()
+        return self.pop_nowait()
+
+    async def get_many(self, n: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Waits for at least one element and returns up to n elements from the head in one wakeup
+        :param n: int, maximum number of elements to return
+        :param timeout: None or float, seconds to wait for the first element
+        :returns: list of elements, empty if the timeout expired or the queue was closed and drained
+        """
+        if n < 1:
+            raise ValueError('n must be a positive integer')
+        try:
+            await asyncio.wait_for(self._wait_items(), timeout)
+        except asyncio.TimeoutError:
+            return []
+
+        batch = []
+        while len(batch) < n and not self._list.is_empty():
+            batch.append(self._list.pull())
+        # Every freed slot can take a waiting producer
+        for _ in batch:
+            self._wakeup(self._putters)
+        return batch
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return await self.pull()
+        except Empty:
+            raise StopAsyncIteration
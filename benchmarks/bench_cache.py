@@ -0,0 +1,84 @@
+"""
+Cache benchmark: LRUCache/LFUCache/memoize against functools.lru_cache and an OrderedDict LRU
+
+Run from the repository root:
+    python -m benchmarks.bench_cache [operations] [maxsize]
+"""
+import functools
+import random
+import sys
+import time
+from collections import OrderedDict
+
+from cache import LFUCache, LRUCache, memoize
+
+
+class OrderedDictLRU:
+    """
+    Reference LRU cache written on top of collections.OrderedDict
+    """
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+def workload(operations: int, maxsize: int):
+    """
+    Skewed key stream where a quarter of the keys takes most of the requests
+    """
+    rnd = random.Random(0)
+    universe = maxsize * 4
+    return [int(rnd.paretovariate(1.2) * universe) % universe for _ in range(operations)]
+
+
+def run_cache(cache, keys):
+    get, put = cache.get, cache.put
+    start = time.perf_counter()
+    for key in keys:
+        if get(key) is None:
+            put(key, key)
+    return time.perf_counter() - start
+
+
+def run_function(func, keys):
+    start = time.perf_counter()
+    for key in keys:
+        func(key)
+    return time.perf_counter() - start
+
+
+def identity(x):
+    return x
+
+
+def main(operations: int, maxsize: int):
+    keys = workload(operations, maxsize)
+    results = [
+        ('LRUCache', run_cache(LRUCache(maxsize), keys)),
+        ('LFUCache', run_cache(LFUCache(maxsize), keys)),
+        ('OrderedDict LRU', run_cache(OrderedDictLRU(maxsize), keys)),
+        ('memoize', run_function(memoize(maxsize)(identity), keys)),
+        ('functools.lru_cache', run_function(functools.lru_cache(maxsize)(identity), keys)),
+    ]
+    print(f'{operations} operations, maxsize {maxsize}')
+    print(f'{"cache":<22}{"seconds":>10}{"ns/op":>10}')
+    for name, elapsed in results:
+        print(f'{name:<22}{elapsed:>10.3f}{elapsed / operations * 1e9:>10.0f}')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(*(args + [10 ** 6, 1024][len(args):]))
@@ -0,0 +1,56 @@
+"""
+Churn benchmark: queue-style append/pull cycles with and without the node pool
+
+Run from the repository root:
+    python -m benchmarks.bench_churn [cycles ...]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from linked_list import DoubleLinkedList
+
+# Elements kept on the queue between cycles
+DEPTH = 1000
+
+
+def churn(lst: DoubleLinkedList, cycles: int):
+    """
+    Runs "cycles" append/pull pairs on a queue of DEPTH elements and returns
+    (bytes allocated above the starting point at the peak, seconds without tracing)
+    """
+    append, pull = lst.append, lst.pull
+    for x in range(DEPTH):
+        append(x)
+    # Warm up the pool so it holds the node one cycle needs
+    append(DEPTH)
+    pull()
+
+    gc.collect()
+    start = time.perf_counter()
+    for x in range(cycles):
+        append(x)
+        pull()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    for x in range(cycles):
+        append(x)
+        pull()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - base, elapsed
+
+
+def main(cycles_list):
+    print(f'{"engine":<12}{"cycles":>10}{"peak B":>10}{"ns/cycle":>10}')
+    for cycles in cycles_list:
+        for name, pool in (('no pool', 0), ('pool=64', 64)):
+            peak, elapsed = churn(DoubleLinkedList(pool=pool), cycles)
+            print(f'{name:<12}{cycles:>10}{peak:>10}{elapsed / cycles * 1e9:>10.0f}')
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [10 ** 4, 10 ** 5])
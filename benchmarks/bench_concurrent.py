@@ -0,0 +1,92 @@
+"""
+Multi-threaded throughput benchmark: ConcurrentDoubleLinkedList against queue.Queue and
+collections.deque with producers appending and consumers pulling
+
+Run from the repository root:
+    python -m benchmarks.bench_concurrent [items per producer] [producers] [consumers]
+"""
+import collections
+import queue
+import sys
+import threading
+import time
+
+from concurrent_linked_list import ConcurrentDoubleLinkedList
+
+# Marker telling a consumer to stop
+_DONE = object()
+
+
+def run(put, get, items: int, producers: int, consumers: int) -> float:
+    """
+    Runs producer and consumer threads over put/get callables and returns the elapsed seconds
+    """
+    def produce():
+        for x in range(items):
+            put(x)
+
+    def consume():
+        while get() is not _DONE:
+            pass
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    readers = [threading.Thread(target=consume) for _ in range(consumers)]
+    start = time.perf_counter()
+    for thread in threads + readers:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for _ in readers:
+        put(_DONE)
+    for thread in readers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def linked_list(maxsize: int):
+    lst = ConcurrentDoubleLinkedList(maxsize=maxsize)
+    return lst.append, lambda: lst.pull(block=True)
+
+
+def stdlib_queue(maxsize: int):
+    q = queue.Queue(maxsize=maxsize)
+    return q.put, q.get
+
+
+def stdlib_deque(maxsize: int):
+    # deque has no blocking get, consumers spin until an element arrives
+    d = collections.deque()
+
+    def get():
+        while True:
+            try:
+                return d.popleft()
+            except IndexError:
+                time.sleep(0)
+    return d.append, get
+
+
+QUEUES = (
+    ('ConcurrentDoubleLinkedList', linked_list),
+    ('queue.Queue', stdlib_queue),
+    ('collections.deque', stdlib_deque),
+)
+
+
+def main(items: int, producers: int, consumers: int):
+    total = items * producers
+    print(f'{producers} producers, {consumers} consumers, {total} items')
+    print(f'{"queue":<30}{"maxsize":>8}{"seconds":>10}{"items/s":>12}')
+    for maxsize in (0, 1024):
+        for name, factory in QUEUES:
+            # deque cannot be bounded without dropping items
+            if maxsize and factory is stdlib_deque:
+                continue
+            put, get = factory(maxsize)
+            elapsed = run(put, get, items, producers, consumers)
+            print(f'{name:<30}{maxsize:>8}{elapsed:>10.3f}{total / elapsed:>12.0f}')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(*(args + [100000, 4, 4][len(args):]))
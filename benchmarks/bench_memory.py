@@ -0,0 +1,73 @@
+"""
+Memory benchmark: node-per-element DoubleLinkedList against the array backed engine
+
+Run from the repository root:
+    python -m benchmarks.bench_memory [size ...]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from array_linked_list import ArrayDoubleLinkedList
+from linked_list import DoubleLinkedList
+
+
+def measure(factory, size: int):
+    """
+    Builds a list with "size" integers and returns (bytes allocated, build seconds, gc seconds)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    lst = factory(size)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    gc.collect()
+    collect = time.perf_counter() - start
+    del lst
+    return current, elapsed, collect
+
+
+def build_nodes(size: int):
+    lst = DoubleLinkedList()
+    for x in range(size):
+        lst.append(x)
+    return lst
+
+
+def build_array(size: int):
+    lst = ArrayDoubleLinkedList()
+    for x in range(size):
+        lst.append(x)
+    return lst
+
+
+def build_typed_array(size: int):
+    lst = ArrayDoubleLinkedList(typecode='q')
+    for x in range(size):
+        lst.append(x)
+    return lst
+
+
+ENGINES = (
+    ('DoubleLinkedList', build_nodes),
+    ('ArrayDoubleLinkedList', build_array),
+    ("ArrayDoubleLinkedList('q')", build_typed_array),
+)
+
+
+def main(sizes):
+    print(f'{"engine":<28}{"size":>10}{"MiB":>10}{"B/elem":>10}{"build s":>10}{"gc s":>10}')
+    for size in sizes:
+        for name, factory in ENGINES:
+            memory, elapsed, collect = measure(factory, size)
+            print(f'{name:<28}{size:>10}{memory / 2 ** 20:>10.2f}{memory / size:>10.1f}'
+                  f'{elapsed:>10.3f}{collect:>10.4f}')
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [10 ** 4, 10 ** 5, 10 ** 6])
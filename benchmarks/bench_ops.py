@@ -0,0 +1,214 @@
+"""
+Benchmarks of the DoubleLinkedList operations against list, collections.deque and sorted
+
+Run from the repository root:
+    python -m benchmarks.bench_ops [--sizes 1000 10000 ...] [--save results.json] [--compare results.json]
+
+Every operation is timed at every size on each engine that has an equivalent operation and reported
+in nanoseconds per call. Quadratic operations run on a capped number of elements, shown in the n
+column. Results saved from one version can be compared against another one to catch regressions.
+"""
+import argparse
+import bisect
+import json
+import random
+import timeit
+from collections import deque
+
+from linked_list import DoubleLinkedList
+
+# Largest list reverse_rec accepts
+RECURSIVE_LIMIT = 900
+# Largest input for the quadratic insertion sort
+INSERTION_LIMIT = 2000
+# Calls per sample for operations that change one element
+CALLS = 1000
+
+
+def values(n: int) -> list:
+    rnd = random.Random(0)
+    return [rnd.random() for _ in range(n)]
+
+
+def dll(n: int) -> DoubleLinkedList:
+    return DoubleLinkedList(range(n))
+
+
+# Every setup takes the size and returns (callable, number of calls, elements used)
+def end_operations(linked_call, list_call, deque_call):
+    """
+    Setups for operations at one end of the list, every *_call(lst) returns the callable to time
+    """
+    def linked(size):
+        return linked_call(dll(size)), CALLS, size
+
+    def array(size):
+        return list_call(list(range(size))), CALLS, size
+
+    def double_ended(size):
+        return deque_call(deque(range(size))), CALLS, size
+
+    return {'DoubleLinkedList': linked, 'list': array, 'deque': double_ended}
+
+
+def middle_insert(method: str):
+    def linked(size):
+        lst = dll(size)
+        node = lst.get_median()
+        return lambda: getattr(lst, method)(1, node), CALLS, size
+
+    def array(size):
+        lst = list(range(size))
+        middle = size // 2
+        return lambda: lst.insert(middle, 1), CALLS, size
+
+    def double_ended(size):
+        lst = deque(range(size))
+        middle = size // 2
+        return lambda: lst.insert(middle, 1), CALLS, size
+
+    return {'DoubleLinkedList': linked, 'list': array, 'deque': double_ended}
+
+
+def whole_list(linked_call, list_call, deque_call):
+    """
+    Setups for operations that walk the whole list once per call
+    """
+    def linked(size):
+        lst = dll(size)
+        return lambda: linked_call(lst, size), 1, size
+
+    def array(size):
+        lst = list(range(size))
+        return lambda: list_call(lst, size), 1, size
+
+    def double_ended(size):
+        lst = deque(range(size))
+        return lambda: deque_call(lst, size), 1, size
+
+    return {'DoubleLinkedList': linked, 'list': array, 'deque': double_ended}
+
+
+def reverse_rec(size):
+    n = min(size, RECURSIVE_LIMIT)
+    lst = dll(n)
+    return lambda: lst.reverse_rec(lst.head), 1, n
+
+
+def insert_sorted():
+    def linked(size):
+        lst = DoubleLinkedList(sorted(values(size)))
+        rnd = random.Random(1)
+        return lambda: lst.insert_sorted(rnd.random()), CALLS, size
+
+    def array(size):
+        lst = sorted(values(size))
+        rnd = random.Random(1)
+        return lambda: bisect.insort(lst, rnd.random()), CALLS, size
+
+    return {'DoubleLinkedList': linked, 'list': array}
+
+
+def sort_merge():
+    def linked(size):
+        data = values(size)
+        return lambda: DoubleLinkedList(data).sort_values(), 1, size
+
+    def builtin(size):
+        data = values(size)
+        return lambda: sorted(data), 1, size
+
+    return {'DoubleLinkedList': linked, 'sorted': builtin}
+
+
+def sort_insertion():
+    def linked(size):
+        data = values(min(size, INSERTION_LIMIT))
+        return lambda: DoubleLinkedList(data).sort_values(method='insertion'), 1, len(data)
+
+    def builtin(size):
+        data = values(min(size, INSERTION_LIMIT))
+        return lambda: sorted(data), 1, len(data)
+
+    return {'DoubleLinkedList': linked, 'sorted': builtin}
+
+
+BENCHMARKS = {
+    'push': end_operations(lambda lst: lambda: lst.push(1), lambda lst: lambda: lst.insert(0, 1),
+                           lambda lst: lambda: lst.appendleft(1)),
+    'append': end_operations(lambda lst: lambda: lst.append(1), lambda lst: lambda: lst.append(1),
+                             lambda lst: lambda: lst.append(1)),
+    'pull': end_operations(lambda lst: lst.pull, lambda lst: lambda: lst.pop(0), lambda lst: lst.popleft),
+    'pop': end_operations(lambda lst: lst.pop, lambda lst: lst.pop, lambda lst: lst.pop),
+    'insert_after': middle_insert('insert_after'),
+    'insert_before': middle_insert('insert_before'),
+    'move_to_front': end_operations(lambda lst: lambda: lst.move_to_front(lst.tail),
+                                    lambda lst: lambda: lst.insert(0, lst.pop()), lambda lst: lambda: lst.rotate(1)),
+    'find': whole_list(lambda lst, n: lst.find(n - 1), lambda lst, n: lst.index(n - 1),
+                       lambda lst, n: lst.index(n - 1)),
+    'reverse': whole_list(lambda lst, n: lst.reverse(), lambda lst, n: lst.reverse(),
+                          lambda lst, n: lst.reverse()),
+    'reverse_rec': {'DoubleLinkedList': reverse_rec},
+    'get_median': whole_list(lambda lst, n: lst.get_median(), lambda lst, n: lst[n // 2],
+                             lambda lst, n: lst[n // 2]),
+    'insert_sorted': insert_sorted(),
+    'sort merge': sort_merge(),
+    'sort insertion': sort_insertion(),
+}
+
+
+def run(sizes, repeat: int = 3) -> dict:
+    """
+    Returns {size: {operation: {engine: [best ns per call, elements used]}}}
+    """
+    results = {}
+    for size in sizes:
+        results[str(size)] = by_operation = {}
+        for name, engines in BENCHMARKS.items():
+            by_operation[name] = {}
+            for engine, setup in engines.items():
+                best = None
+                for _ in range(repeat):
+                    func, calls, n = setup(size)
+                    elapsed = timeit.timeit(func, number=calls) / calls * 1e9
+                    best = elapsed if best is None else min(best, elapsed)
+                by_operation[name][engine] = [best, n]
+    return results
+
+
+def report(results: dict, previous: dict) -> None:
+    header = f'{"size":>10}  {"operation":<16}{"engine":<18}{"n":>10}{"ns/call":>14}'
+    print(header + (f'{"before":>14}{"change":>10}' if previous else ''))
+    for size, by_operation in results.items():
+        for name, engines in by_operation.items():
+            for engine, (elapsed, n) in engines.items():
+                line = f'{size:>10}  {name:<16}{engine:<18}{n:>10}{elapsed:>14.0f}'
+                before = previous.get(size, {}).get(name, {}).get(engine)
+                if before is not None and before[1] == n:
+                    line += f'{before[0]:>14.0f}{elapsed / before[0] - 1:>+10.1%}'
+                print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** 3, 10 ** 4, 10 ** 5],
+                        help='elements per list, up to 10 ** 7')
+    parser.add_argument('--repeat', type=int, default=3, help='samples per benchmark, the best is kept')
+    parser.add_argument('--save', help='write the results to a JSON file')
+    parser.add_argument('--compare', help='JSON file with results to compare against')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)['results']
+    report(results, previous)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'sizes': args.sizes, 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
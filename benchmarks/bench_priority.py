@@ -0,0 +1,131 @@
+"""
+Priority queue benchmark: PriorityDoubleLinkedList against heapq and insert_sorted plus pull
+
+Run from the repository root:
+    python -m benchmarks.bench_priority [size ...]
+
+Three scheduler style workloads are timed at every size:
+    fill+drain   push size tasks, then pop them all in priority order
+    hold         keep size pending tasks, every step pops the next one and schedules it again later
+    reschedule   keep size pending tasks, every step moves a random task earlier and pops the next one.
+                 heapq has no decrease key, so it pushes a new entry and skips stale ones on pop
+The insert_sorted plus pull pattern is quadratic and only runs up to INSERT_SORTED_LIMIT tasks.
+"""
+import heapq
+import random
+import sys
+import timeit
+
+from linked_list import DoubleLinkedList
+from priority_linked_list import PriorityDoubleLinkedList
+
+# Largest queue the linear insert_sorted runs on
+INSERT_SORTED_LIMIT = 10 ** 4
+# Steps per size of the hold and reschedule workloads
+STEPS = 10 ** 5
+
+
+def times(size: int, seed: int = 0) -> list:
+    rnd = random.Random(seed)
+    return [rnd.random() * size for _ in range(size)]
+
+
+# fill+drain
+def drain_priority(size: int) -> None:
+    heap = PriorityDoubleLinkedList()
+    for t in times(size):
+        heap.push(t)
+    while heap._size:
+        heap.pop_min()
+
+
+def drain_heapq(size: int) -> None:
+    heap = []
+    for t in times(size):
+        heapq.heappush(heap, t)
+    while heap:
+        heapq.heappop(heap)
+
+
+def drain_sorted(size: int) -> None:
+    lst = DoubleLinkedList()
+    for t in times(size):
+        lst.insert_sorted(t)
+    while lst._size:
+        lst.pull()
+
+
+# hold
+def hold_priority(size: int) -> None:
+    rnd = random.Random(1)
+    heap = PriorityDoubleLinkedList(times(size))
+    for _ in range(STEPS):
+        heap.push(heap.pop_min() + rnd.random() * size)
+
+
+def hold_heapq(size: int) -> None:
+    rnd = random.Random(1)
+    heap = times(size)
+    heapq.heapify(heap)
+    for _ in range(STEPS):
+        heapq.heappush(heap, heapq.heappop(heap) + rnd.random() * size)
+
+
+def hold_sorted(size: int) -> None:
+    rnd = random.Random(1)
+    lst = DoubleLinkedList(sorted(times(size)))
+    for _ in range(STEPS):
+        lst.insert_sorted(lst.pull() + rnd.random() * size)
+
+
+# reschedule
+def reschedule_priority(size: int) -> None:
+    rnd = random.Random(2)
+    heap = PriorityDoubleLinkedList()
+    tasks = [heap.push(i, t) for i, t in enumerate(times(size))]
+    for _ in range(STEPS):
+        task = tasks[rnd.randrange(size)]
+        heap.decrease_key(task, task.priority - rnd.random())
+        i = heap.pop_min()
+        tasks[i] = heap.push(i, rnd.random() * size)
+
+
+def reschedule_heapq(size: int) -> None:
+    rnd = random.Random(2)
+    current = times(size)
+    heap = [(t, i) for i, t in enumerate(current)]
+    heapq.heapify(heap)
+    for _ in range(STEPS):
+        i = rnd.randrange(size)
+        current[i] -= rnd.random()
+        heapq.heappush(heap, (current[i], i))
+        # Skip entries left behind by earlier reschedules
+        while True:
+            t, i = heapq.heappop(heap)
+            if t == current[i]:
+                break
+        current[i] = rnd.random() * size
+        heapq.heappush(heap, (current[i], i))
+
+
+WORKLOADS = {
+    'fill+drain': {'PriorityDoubleLinkedList': drain_priority, 'heapq': drain_heapq,
+                   'insert_sorted+pull': drain_sorted},
+    'hold': {'PriorityDoubleLinkedList': hold_priority, 'heapq': hold_heapq, 'insert_sorted+pull': hold_sorted},
+    'reschedule': {'PriorityDoubleLinkedList': reschedule_priority, 'heapq': reschedule_heapq},
+}
+
+
+def main(sizes):
+    print(f'{"size":>10}  {"workload":<12}{"engine":<26}{"ms":>12}')
+    for size in sizes:
+        for workload, engines in WORKLOADS.items():
+            for engine, func in engines.items():
+                if engine == 'insert_sorted+pull' and size > INSERT_SORTED_LIMIT:
+                    continue
+                elapsed = min(timeit.repeat(lambda: func(size), number=1, repeat=3))
+                print(f'{size:>10}  {workload:<12}{engine:<26}{elapsed * 1e3:>12.1f}')
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [10 ** 3, 10 ** 4, 10 ** 5])
@@ -0,0 +1,59 @@
+"""
+Unrolled benchmark: block-per-node UnrolledDoubleLinkedList against the node-per-element layout
+
+Run from the repository root:
+    python -m benchmarks.bench_unrolled [size ...]
+"""
+import gc
+import sys
+import timeit
+import tracemalloc
+from collections import deque
+
+from linked_list import DoubleLinkedList
+from unrolled_linked_list import UnrolledDoubleLinkedList
+
+BLOCK_SIZES = (32, 64, 128)
+
+
+def memory(factory, size: int) -> int:
+    """
+    Returns the bytes allocated to build a list with "size" integers
+    """
+    values = list(range(size))
+    gc.collect()
+    tracemalloc.start()
+    lst = factory(values)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lst
+    return current
+
+
+def timings(lst, size: int):
+    """
+    Returns the milliseconds to iterate, find the last element and get the median
+    """
+    iterate = min(timeit.repeat(lambda: deque(lst.values(), maxlen=0), number=1, repeat=3))
+    find = min(timeit.repeat(lambda: lst.find(size - 1), number=1, repeat=3))
+    median = min(timeit.repeat(lst.get_median, number=1, repeat=3))
+    return iterate * 1e3, find * 1e3, median * 1e3
+
+
+def engines():
+    yield 'DoubleLinkedList', DoubleLinkedList
+    for block_size in BLOCK_SIZES:
+        yield f'Unrolled({block_size})', lambda values, b=block_size: UnrolledDoubleLinkedList(values, b)
+
+
+def main(sizes):
+    print(f'{"engine":<18}{"size":>10}{"B/elem":>10}{"iter ms":>10}{"find ms":>10}{"median ms":>11}')
+    for size in sizes:
+        for name, factory in engines():
+            allocated = memory(factory, size)
+            iterate, find, median = timings(factory(range(size)), size)
+            print(f'{name:<18}{size:>10}{allocated / size:>10.1f}{iterate:>10.2f}{find:>10.2f}{median:>11.2f}')
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [10 ** 4, 10 ** 5, 10 ** 6])
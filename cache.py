@@ -0,0 +1,270 @@
+import time
+from collections import namedtuple
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+
+from linked_list import DoubleLinkedList
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+# Sentinel returned by lookups that miss
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Least recently used cache. Entries live on a DoubleLinkedList ordered from most to least
+    recently used and a dict maps every key to its node, so get, put and move-to-front are O(1)
+    """
+    class _Entry:
+        __slots__ = 'key', 'value', 'expires'
+
+        def __init__(self, key: Hashable, value: Any, expires: Optional[float]) -> None:
+            self.key = key
+            self.value = value
+            self.expires = expires
+
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None,
+                 timer: Callable[[], float] = time.monotonic):
+        """
+        :param maxsize: None or int, maximum number of entries, None for an unbounded cache
+        :param ttl: None or float, seconds an entry stays valid after it is stored
+        :param timer: Callable, clock used to expire entries
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be None or a positive integer')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be None or a positive number')
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._timer = timer
+        self._map = {}
+        self._order = DoubleLinkedList()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not None
+
+    def _lookup(self, key: Hashable):
+        """
+        Returns the node stored under key, dropping it if it has expired
+        """
+        node = self._map.get(key)
+        if node is None:
+            return None
+        expires = node.get().expires
+        if expires is not None and expires <= self._timer():
+            self._discard(node)
+            self.evictions += 1
+            return None
+        return node
+
+    def _discard(self, node) -> None:
+        entry = self._order.remove_node(node)
+        del self._map[entry.key]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value stored under key and moves it to the front as the most recently used
+        :param key: Hashable, key of the entry
+        :param default: Any, value returned when key is not cached
+        """
+        node = self._lookup(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_front(node)
+        return node.get().value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores value under key as the most recently used entry, evicting the least recently used
+        entry when the cache is full
+        :param key: Hashable, key of the entry
+        :param value: Any, value to be cached
+        """
+        expires = None if self._ttl is None else self._timer() + self._ttl
+        node = self._map.get(key)
+        # Handle case where key is already cached
+        if node is not None:
+            entry = node.get()
+            entry.value = value
+            entry.expires = expires
+            self._order.move_to_front(node)
+            return
+
+        self._order.push(self._Entry(key, value, expires))
+        self._map[key] = self._order.head
+        if self._maxsize is not None and len(self._map) > self._maxsize:
+            del self._map[self._order.pop().key]
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Removes key from the cache
+        """
+        node = self._map.get(key)
+        if node is None:
+            raise KeyError(key)
+        self._discard(node)
+
+    def clear(self) -> None:
+        self._map = {}
+        self._order = DoubleLinkedList()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self._maxsize, len(self._map))
+
+
+class LFUCache:
+    """
+    Least frequently used cache. Entries with the same use count share a DoubleLinkedList ordered
+    from most to least recently used, so eviction picks the least recently used entry among the
+    least frequently used ones. get and put are O(1)
+    """
+    class _Entry:
+        __slots__ = 'key', 'value', 'count', 'node'
+
+        def __init__(self, key: Hashable, value: Any) -> None:
+            self.key = key
+            self.value = value
+            self.count = 1
+            self.node = None
+
+    def __init__(self, maxsize: int = 128):
+        """
+        :param maxsize: int, maximum number of entries
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        self._maxsize = maxsize
+        self._map = {}
+        self._buckets = {}
+        self._min_count = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._map
+
+    def _link(self, entry: _Entry) -> None:
+        """
+        Pushes entry on the bucket matching its use count
+        """
+        bucket = self._buckets.get(entry.count)
+        if bucket is None:
+            bucket = self._buckets[entry.count] = DoubleLinkedList()
+        bucket.push(entry)
+        entry.node = bucket.head
+
+    def _unlink(self, entry: _Entry) -> bool:
+        """
+        Removes entry from the bucket matching its use count, dropping the bucket when empty
+        :returns: True if the bucket was dropped
+        """
+        bucket = self._buckets[entry.count]
+        bucket.remove_node(entry.node)
+        entry.node = None
+        if bucket.is_empty():
+            del self._buckets[entry.count]
+            return True
+        return False
+
+    def _touch(self, entry: _Entry) -> None:
+        """
+        Moves entry to the bucket of the next use count
+        """
+        # Handle case where entry was the only one with the minimum count
+        if self._unlink(entry) and self._min_count == entry.count:
+            self._min_count += 1
+        entry.count += 1
+        self._link(entry)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value stored under key and increases its use count
+        :param key: Hashable, key of the entry
+        :param default: Any, value returned when key is not cached
+        """
+        entry = self._map.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores value under key, evicting the least frequently used entry when the cache is full
+        :param key: Hashable, key of the entry
+        :param value: Any, value to be cached
+        """
+        entry = self._map.get(key)
+        # Handle case where key is already cached
+        if entry is not None:
+            entry.value = value
+            self._touch(entry)
+            return
+
+        if len(self._map) >= self._maxsize:
+            bucket = self._buckets[self._min_count]
+            del self._map[bucket.pop().key]
+            if bucket.is_empty():
+                del self._buckets[self._min_count]
+            self.evictions += 1
+
+        entry = self._map[key] = self._Entry(key, value)
+        self._link(entry)
+        self._min_count = 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Removes key from the cache
+        """
+        entry = self._map.pop(key)
+        if self._unlink(entry) and self._min_count == entry.count:
+            self._min_count = min(self._buckets, default=0)
+
+    def clear(self) -> None:
+        self._map = {}
+        self._buckets = {}
+        self._min_count = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self._maxsize, len(self._map))
+
+
+def memoize(maxsize: Optional[int] = 128, ttl: Optional[float] = None):
+    """
+    Decorator that caches the results of a function on an LRUCache
+    :param maxsize: None or int, maximum number of cached results, None for an unbounded cache
+    :param ttl: None or float, seconds a result stays valid after it is computed
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_MISSING,) + tuple(kwargs.items())
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
@@ -0,0 +1,305 @@
+import threading
+from typing import Any, Iterable, List, Optional, Union
+
+from linked_list import CHUNK, DoubleLinkedList
+
+# Lists shorter than this take both locks, so the two ends never touch the same nodes
+_SHARED_ENDS = 4
+
+
+class Empty(ValueError):
+    """
+    Raised by pull and pop when the list stays empty
+    """
+
+
+class Full(Exception):
+    """
+    Raised by push and append when a bounded list stays full
+    """
+
+
+class ConcurrentDoubleLinkedList(DoubleLinkedList):
+    """
+    Thread safe double linked list for producer/consumer use. The head and the tail have their own
+    lock so operations on opposite ends run in parallel, both locks are taken when the list is
+    short enough for the ends to share nodes. pull and pop can block until an element arrives and
+    a maxsize bounds the list, blocking producers until consumers free a slot
+    """
+    def __init__(self, array: Optional[Iterable] = None, maxsize: int = 0):
+        """
+        :param array: None or iterable, elements appended to the list in order
+        :param maxsize: int, maximum number of elements, 0 for an unbounded list
+        """
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._size_lock = threading.Lock()
+        self._maxsize = maxsize
+        # Count of elements consumers can take and of free slots producers can fill
+        self._items = threading.Semaphore(0)
+        self._slots = threading.Semaphore(maxsize) if maxsize > 0 else None
+        super().__init__()
+        if array is not None:
+            for x in array:
+                self.append(x, block=False)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def _options(self) -> dict:
+        return {'maxsize': self._maxsize}
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= self._size
+
+    # Locking
+    def _lock_head(self) -> bool:
+        """
+        Acquires the head lock, and the tail lock too when the ends may share nodes
+        :returns: True if both locks are held
+        """
+        self._head_lock.acquire()
+        if self._size < _SHARED_ENDS:
+            self._tail_lock.acquire()
+            return True
+        return False
+
+    def _lock_tail(self) -> bool:
+        """
+        Acquires the tail lock, and the head lock too when the ends may share nodes
+        :returns: True if both locks are held
+        """
+        self._tail_lock.acquire()
+        if self._size < _SHARED_ENDS:
+            # Locks are always taken head first to avoid deadlocks
+            self._tail_lock.release()
+            self._head_lock.acquire()
+            self._tail_lock.acquire()
+            return True
+        return False
+
+    def _unlock(self, head: bool, both: bool) -> None:
+        if head or both:
+            self._head_lock.release()
+        if not head or both:
+            self._tail_lock.release()
+
+    def _resize(self, delta: int) -> None:
+        with self._size_lock:
+            self._size += delta
+
+    def _reserve(self, semaphore: Optional[threading.Semaphore], block: bool, timeout: Optional[float]) -> bool:
+        if semaphore is None:
+            return True
+        if block or timeout is not None:
+            return semaphore.acquire(True, timeout)
+        return semaphore.acquire(False)
+
+    # List interface
+    def push(self, e: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Creates a new head node with element "e", waiting for a free slot on a full bounded list
+        :param e: Any, element inside node's container
+        :param block: if false, raises Full at once instead of waiting
+        :param timeout: None or float, seconds to wait before raising Full
+        """
+        if not self._reserve(self._slots, block, timeout):
+            raise Full('Linked list is full')
+        both = self._lock_head()
+        try:
+            if both:
+                super().push(e)
+            else:
+                successor = self._head
+                new = self._Node(e, nxt=successor, prv=None)
+                successor._prev = new
+                self._head = new
+                self._resize(1)
+        finally:
+            self._unlock(True, both)
+        self._items.release()
+
+    def append(self, e: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Creates a new tail node with element "e", waiting for a free slot on a full bounded list
+        :param e: Any, element inside node's container
+        :param block: if false, raises Full at once instead of waiting
+        :param timeout: None or float, seconds to wait before raising Full
+        """
+        if not self._reserve(self._slots, block, timeout):
+            raise Full('Linked list is full')
+        both = self._lock_tail()
+        try:
+            if both:
+                super().append(e)
+            else:
+                predecessor = self._tail
+                new = self._Node(e, nxt=None, prv=predecessor)
+                predecessor._next = new
+                self._tail = new
+                self._resize(1)
+        finally:
+            self._unlock(False, both)
+        self._items.release()
+
+    def extend(self, iterable: Iterable) -> None:
+        for x in iterable:
+            self.append(x)
+
+    def extendleft(self, iterable: Iterable) -> None:
+        for x in iterable:
+            self.push(x)
+
+    def pull(self, block: bool = False, timeout: Optional[float] = None) -> Any:
+        """
+        Returns and deletes the first element of the list
+        :param block: if true, waits for an element instead of raising Empty at once
+        :param timeout: None or float, seconds to wait before raising Empty
+        """
+        if not self._reserve(self._items, block, timeout):
+            raise Empty('Linked list is empty')
+        both = self._lock_head()
+        try:
+            if both:
+                e = super().pull()
+            else:
+                old = self._head
+                successor = old._next
+                successor._prev = None
+                old._next = None
+                self._head = successor
+                self._resize(-1)
+                e = old._element
+        finally:
+            self._unlock(True, both)
+        if self._slots is not None:
+            self._slots.release()
+        return e
+
+    def pop(self, block: bool = False, timeout: Optional[float] = None) -> Any:
+        """
+        Returns and deletes the last element of the list
+        :param block: if true, waits for an element instead of raising Empty at once
+        :param timeout: None or float, seconds to wait before raising Empty
+        """
+        if not self._reserve(self._items, block, timeout):
+            raise Empty('Linked list is empty')
+        both = self._lock_tail()
+        try:
+            if both:
+                e = super().pop()
+            else:
+                old = self._tail
+                predecessor = old._prev
+                predecessor._next = None
+                old._prev = None
+                self._tail = predecessor
+                self._resize(-1)
+                e = old._element
+        finally:
+            self._unlock(False, both)
+        if self._slots is not None:
+            self._slots.release()
+        return e
+
+    def remove(self, value: Any) -> None:
+        """
+        Deletes the first node holding value
+        :param value: Any, value to be removed
+        """
+        # Reserve an element so no consumer expects the one being removed
+        if not self._items.acquire(False):
+            raise Empty('Linked list is empty')
+        with self._head_lock, self._tail_lock:
+            cursor = self._head
+            while cursor is not None and cursor._element != value:
+                cursor = cursor._next
+            if cursor is None:
+                self._items.release()
+                raise ValueError('Value not found')
+            # Call the base class directly, the locked end operations would wait on the held locks
+            if cursor is self._head:
+                DoubleLinkedList.pull(self)
+            elif cursor is self._tail:
+                DoubleLinkedList.pop(self)
+            else:
+                DoubleLinkedList._unlink(self, cursor)
+        if self._slots is not None:
+            self._slots.release()
+
+    def clear(self) -> None:
+        """
+        Deletes every element that is not already reserved by a waiting consumer
+        """
+        while True:
+            try:
+                self.pull()
+            except Empty:
+                return
+
+    # Consistent reads
+    def snapshot(self) -> List[Any]:
+        """
+        Returns a list with the elements, taken while both ends are locked
+        """
+        with self._head_lock, self._tail_lock:
+            return [x._element for x in super().__iter__()]
+
+    def __iter__(self):
+        with self._head_lock, self._tail_lock:
+            nodes = list(super().__iter__())
+        return iter(nodes)
+
+    def values(self):
+        return iter(self.snapshot())
+
+    def __reversed__(self):
+        with self._head_lock, self._tail_lock:
+            nodes = list(super().__reversed__())
+        return iter(nodes)
+
+    def _batches(self, chunk: int = CHUNK):
+        """
+        Returns the element batches taken while both ends are locked, so sum, min, max, map and
+        to_numpy read a consistent list without holding the locks while they run
+        """
+        with self._head_lock, self._tail_lock:
+            return list(super()._batches(chunk))
+
+    def find(self, value: Any) -> DoubleLinkedList._Node:
+        with self._head_lock, self._tail_lock:
+            return super().find(value)
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        with self._head_lock, self._tail_lock:
+            return super().__getitem__(key)
+
+    def get_median(self, start: DoubleLinkedList._Node = None) -> DoubleLinkedList._Node:
+        with self._head_lock, self._tail_lock:
+            return super().get_median(start)
+
+    def drain(self, from_end: bool = False):
+        take = self.pop if from_end else self.pull
+        while True:
+            try:
+                yield take()
+            except Empty:
+                return
+
+    def sort_values(self, *args, **kwargs):
+        with self._head_lock, self._tail_lock:
+            return super().sort_values(*args, **kwargs)
+
+    def reverse(self):
+        with self._head_lock, self._tail_lock:
+            return super().reverse()
+
+    # Operations that bypass the end locks and the capacity accounting
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError('Concurrent lists only change at their ends')
+
+    insert = insert_after = insert_before = insert_sorted = remove_node = _unsupported
+    move_to_front = move_to_end = reverse_rec = filter_inplace = __setitem__ = __delitem__ = _unsupported
+    splice = concat = split_at = _cut = _reset = _unsupported
+    _movable = False
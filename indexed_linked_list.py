@@ -0,0 +1,418 @@
+import random
+from typing import Any, Iterable, List, Optional, Tuple
+
+from linked_list import DoubleLinkedList
+
+# Highest skip level, enough for 4 ** 32 elements
+MAX_LEVEL = 32
+# Probability of a node reaching the next skip level
+PROMOTION = 0.25
+
+
+class IndexedDoubleLinkedList(DoubleLinkedList):
+    """
+    Double linked list with an indexable skip list layered over its nodes. Nodes are promoted to
+    higher levels at random, every level link stores how many nodes it skips, so positional access,
+    insert(i, e) and del lst[i] run in O(log n) expected time instead of walking the list. With
+    order_stats on, a pointer to the median node moves at most one step on every change, so
+    get_median runs in O(1)
+    """
+    class _Node(DoubleLinkedList._Node):
+        __slots__ = '_nexts', '_prevs', '_widths'
+
+        def __init__(self, element: Any, nxt, prv) -> None:
+            """
+            :param element: Any, element inside container
+            :param nxt: None or Node object, next in list order
+            :param prv: None or Node object, previous in list order
+            """
+            self._element = element
+            self._next = nxt
+            self._prev = prv
+            # Skip links for levels 1 and above, None for nodes that only live on the list level
+            self._nexts = None
+            self._prevs = None
+            self._widths = None
+
+    def __init__(self, array: Optional[Iterable] = None, index: bool = False, order_stats: bool = False):
+        """
+        :param array: None or iterable, elements appended to the list in order
+        :param index: if true, keeps a value -> nodes hash index, see DoubleLinkedList
+        :param order_stats: if true, keeps a pointer to the median node up to date
+        """
+        # Header tower placed before the first node (position -1)
+        self._header = self._Node(None, None, None)
+        self._level = 0
+        self._reset_header()
+        # Median node, at position (len(self) - 1) // 2, and its position
+        self._order_stats = order_stats
+        self._median = None
+        self._median_position = -1
+        super().__init__(array, index=index)
+
+    def _options(self) -> dict:
+        return {'index': self._index is not None, 'order_stats': self._order_stats}
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._reset_header()
+        self._median = None
+        self._median_position = -1
+
+    @classmethod
+    def merge_sorted(cls, *lists, **kwargs):
+        lst = super().merge_sorted(*lists, **kwargs)
+        lst._rebuild()
+        return lst
+
+    # Skip list maintenance
+    def _reset_header(self) -> None:
+        self._header._nexts = [None] * MAX_LEVEL
+        self._header._widths = [0] * MAX_LEVEL
+        self._level = 0
+
+    @staticmethod
+    def _random_height() -> int:
+        height = 0
+        while height < MAX_LEVEL and random.random() < PROMOTION:
+            height += 1
+        return height
+
+    def _predecessors(self, node: _Node, top: int) -> Tuple[List[_Node], List[int]]:
+        """
+        Finds the closest node before node on every skip level by walking backwards
+        :param node: Node object linked on the list level
+        :param top: int, highest level to search
+        :returns: tuple with the predecessor and its distance to node for levels 0 to top, level 0
+            entries are unused
+        """
+        header = self._header
+        update = [header] * (top + 1)
+        distance = [0] * (top + 1)
+
+        # Walk the list level back to the first node with skip links
+        cursor, steps = node._prev, 1
+        while cursor is not None and cursor._nexts is None:
+            cursor = cursor._prev
+            steps += 1
+        if cursor is None:
+            cursor = header
+
+        for level in range(1, top + 1):
+            update[level] = cursor
+            distance[level] = steps
+            if level == top:
+                break
+            # Walk this level back to the first node reaching the next one
+            while cursor is not header and len(cursor._nexts) <= level:
+                previous = cursor._prevs[level - 1]
+                if previous is None:
+                    previous = header
+                steps += previous._widths[level - 1]
+                cursor = previous
+        return update, distance
+
+    def _skip_link(self, node: _Node) -> None:
+        """
+        Adds skip links for a node that was just linked on the list level and counted in the size
+        """
+        height = self._random_height()
+        # Handle case where node raises the skip list, new header levels span the whole list
+        if height > self._level:
+            for level in range(self._level + 1, height + 1):
+                self._header._widths[level - 1] = self._size
+            self._level = height
+
+        update, distance = self._predecessors(node, self._level)
+        if height:
+            node._nexts = [None] * height
+            node._prevs = [None] * height
+            node._widths = [0] * height
+        for level in range(1, self._level + 1):
+            before = update[level]
+            # Handle case where node is below this level, the predecessor link skips one more node
+            if level > height:
+                before._widths[level - 1] += 1
+                continue
+            after = before._nexts[level - 1]
+            node._nexts[level - 1] = after
+            node._prevs[level - 1] = None if before is self._header else before
+            node._widths[level - 1] = before._widths[level - 1] + 1 - distance[level]
+            if after is not None:
+                after._prevs[level - 1] = node
+            before._nexts[level - 1] = node
+            before._widths[level - 1] = distance[level]
+
+        if self._order_stats:
+            self._median_add(node)
+
+    def _skip_unlink(self, node: _Node) -> None:
+        """
+        Removes skip links for a node that is still linked on the list level
+        """
+        if self._order_stats:
+            self._median_discard(node)
+        update, _ = self._predecessors(node, self._level)
+        height = len(node._nexts) if node._nexts is not None else 0
+        for level in range(1, self._level + 1):
+            before = update[level]
+            # Handle case where node is below this level, the predecessor link skips one less node
+            if level > height:
+                before._widths[level - 1] -= 1
+                continue
+            after = node._nexts[level - 1]
+            before._nexts[level - 1] = after
+            before._widths[level - 1] += node._widths[level - 1] - 1
+            if after is not None:
+                after._prevs[level - 1] = node._prevs[level - 1]
+        node._nexts = node._prevs = node._widths = None
+        # Drop empty levels from the top
+        while self._level and self._header._nexts[self._level - 1] is None:
+            self._level -= 1
+
+    def _rebuild(self) -> None:
+        """
+        Rebuilds every skip link in one pass, used after nodes are reordered
+        """
+        self._reset_header()
+        header = self._header
+        last = [header] * (MAX_LEVEL + 1)
+        last_position = [-1] * (MAX_LEVEL + 1)
+        position = 0
+        cursor = self._head
+        while cursor is not None:
+            height = self._random_height()
+            if height:
+                cursor._nexts = [None] * height
+                cursor._prevs = [None] * height
+                cursor._widths = [0] * height
+                for level in range(1, height + 1):
+                    before = last[level]
+                    before._nexts[level - 1] = cursor
+                    before._widths[level - 1] = position - last_position[level]
+                    cursor._prevs[level - 1] = None if before is header else before
+                    last[level] = cursor
+                    last_position[level] = position
+                self._level = max(self._level, height)
+            else:
+                cursor._nexts = cursor._prevs = cursor._widths = None
+            position += 1
+            cursor = cursor._next
+        # Links reaching the end of the list span up to position len(self)
+        for level in range(1, self._level + 1):
+            last[level]._widths[level - 1] = self._size - last_position[level]
+
+        if self._order_stats:
+            # The old median node moved with the reorder, drop it before descending the skip levels
+            self._median = None
+            self._median_position = (self._size - 1) // 2
+            if self._size:
+                self._median = self._node_at(self._median_position)
+
+    def _node_at(self, index: int) -> _Node:
+        """
+        Returns the node at position index descending the skip levels
+        :param index: int, position between 0 and len(self) - 1
+        """
+        # Handle case where the median pointer is closer than an expected descent of the skip levels
+        if self._median is not None and abs(index - self._median_position) <= self._level / PROMOTION:
+            cursor, position = self._median, self._median_position
+            while position < index:
+                cursor = cursor._next
+                position += 1
+            while position > index:
+                cursor = cursor._prev
+                position -= 1
+            return cursor
+
+        cursor, position = self._header, -1
+        # Skip level lists are indexed from 0 for level 1
+        for level in range(self._level - 1, -1, -1):
+            nexts, widths = cursor._nexts, cursor._widths
+            while nexts[level] is not None and position + widths[level] <= index:
+                position += widths[level]
+                cursor = nexts[level]
+                nexts, widths = cursor._nexts, cursor._widths
+        if cursor is self._header:
+            cursor, position = self._head, 0
+        while position < index:
+            cursor = cursor._next
+            position += 1
+        return cursor
+
+    def position_of(self, node: _Node) -> int:
+        """
+        Returns the position of node on the list in O(log n) expected time
+        :param node: Node object on this list
+        """
+        if not isinstance(node, self._Node):
+            raise TypeError('Invalid node')
+        _, distance = self._predecessors(node, self._level + 1)
+        return distance[-1] - 1
+
+    # Median pointer
+    def _fast_position(self, node: _Node) -> int:
+        """
+        Returns the position of a linked node, in O(1) for the head and the last node
+        """
+        if node is self._head:
+            return 0
+        if node._next is None:
+            return self._size - 1
+        return self.position_of(node)
+
+    def _median_step(self, size: int, skip: Optional[_Node] = None) -> None:
+        """
+        Moves the median pointer to position (size - 1) // 2, at most one step away
+        :param size: int, size of the list once the current change is done
+        :param skip: None or Node object being removed, stepped over
+        """
+        target = (size - 1) // 2
+        if self._median_position < target:
+            median = self._median._next
+            self._median = median._next if median is skip else median
+            self._median_position += 1
+        elif self._median_position > target:
+            median = self._median._prev
+            self._median = median._prev if median is skip else median
+            self._median_position -= 1
+
+    def _median_add(self, node: _Node) -> None:
+        """
+        Updates the median pointer for a node that was just linked and counted in the size
+        """
+        # Handle case where node is the only one
+        if self._median is None:
+            self._median, self._median_position = node, 0
+            return
+        if self._fast_position(node) <= self._median_position:
+            self._median_position += 1
+        self._median_step(self._size)
+
+    def _median_discard(self, node: _Node) -> None:
+        """
+        Updates the median pointer for a node about to be unlinked, still counted in the size
+        """
+        # Handle case where node is the median, a neighbour takes its place
+        if node is self._median:
+            if node._next is not None:
+                self._median = node._next
+            else:
+                self._median = node._prev
+                self._median_position -= 1
+            # Handle case where node is the only one
+            if self._median is None:
+                self._median_position = -1
+                return
+        elif self._fast_position(node) < self._median_position:
+            self._median_position -= 1
+        self._median_step(self._size - 1, node)
+
+    def get_median(self, start: Optional[_Node] = None) -> _Node:
+        """
+        Returns the median node of the linked list, in O(1) with order_stats on
+        """
+        if self._order_stats and start is None:
+            if self._median is None:
+                raise ValueError('Linked list is empty')
+            return self._median
+        return super().get_median(start)
+
+    # List interface
+    def push(self, e: Any) -> None:
+        super().push(e)
+        self._skip_link(self._head)
+
+    def append(self, e: Any) -> None:
+        super().append(e)
+        self._skip_link(self._tail if self._tail is not None else self._head)
+
+    def extend(self, iterable: Iterable) -> None:
+        values = list(iterable)
+        # Handle case where the new nodes are a large share of the list, one rebuild is cheaper
+        if len(values) * 8 > self._size + len(values):
+            super().extend(values)
+            self._rebuild()
+        else:
+            for e in values:
+                self.append(e)
+
+    def extendleft(self, iterable: Iterable) -> None:
+        values = list(iterable)
+        # Handle case where the new nodes are a large share of the list, one rebuild is cheaper
+        if len(values) * 8 > self._size + len(values):
+            super().extendleft(values)
+            self._rebuild()
+        else:
+            for e in values:
+                self.push(e)
+
+    def insert_after(self, e: Any, node: _Node) -> None:
+        # The base class appends when node is the last node, append links the new node itself
+        if node is self._tail or node is self._head and self._size == 1:
+            self.append(e)
+        else:
+            super().insert_after(e, node)
+            self._skip_link(node._next)
+
+    def insert_before(self, e: Any, node: _Node) -> None:
+        # The base class pushes when node is the head, push links the new node itself
+        if node is self._head:
+            self.push(e)
+        else:
+            super().insert_before(e, node)
+            self._skip_link(node._prev)
+
+    def pop(self) -> Any:
+        if self._size:
+            self._skip_unlink(self._tail if self._tail is not None else self._head)
+        return super().pop()
+
+    def pull(self) -> Any:
+        if self._size:
+            self._skip_unlink(self._head)
+        return super().pull()
+
+    def _unlink(self, node: DoubleLinkedList._Node) -> Any:
+        # Head and tail are removed through pull and pop, which unlink the skip levels themselves
+        if node is not self._head and node is not self._tail:
+            self._skip_unlink(node)
+        return super()._unlink(node)
+
+    def move_to_front(self, node: _Node) -> None:
+        self._skip_unlink(node)
+        super().move_to_front(node)
+        self._skip_link(node)
+
+    def move_to_end(self, node: _Node) -> None:
+        self._skip_unlink(node)
+        super().move_to_end(node)
+        self._skip_link(node)
+
+    def reverse_rec(self, start: _Node):
+        super().reverse_rec(start)
+        self._rebuild()
+
+    # Chain transfers relink whole ranges, the skip levels are rebuilt in O(n)
+    def _cut(self, start: _Node, end: _Node, count: int) -> None:
+        super()._cut(start, end, count)
+        self._rebuild()
+
+    def _paste(self, after: Optional[_Node], start: _Node, end: _Node, count: int) -> None:
+        super()._paste(after, start, end, count)
+        self._rebuild()
+
+    def reverse(self):
+        super().reverse()
+        self._rebuild()
+        return self
+
+    def filter_inplace(self, mask):
+        super().filter_inplace(mask)
+        self._rebuild()
+        return self
+
+    def sort_values(self, *args, **kwargs):
+        super().sort_values(*args, **kwargs)
+        self._rebuild()
+        return self
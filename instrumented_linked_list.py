@@ -0,0 +1,247 @@
+from collections import defaultdict
+from typing import Any, Callable, Iterable, Optional
+
+from linked_list import DoubleLinkedList
+
+# Operations counted by calls
+CALLS = ('push', 'append', 'pull', 'pop', 'insert', 'find', 'get_median', 'insert_sorted', 'sort')
+# Operations that walk the list, counted by nodes traversed
+WALKS = ('find', 'get_median', 'insert_sorted')
+
+
+class _Counted:
+    """
+    Wraps a value counting every comparison made with another wrapped value
+    """
+    __slots__ = 'value', 'counter'
+
+    def __init__(self, value: Any, counter: list):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter[0] += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.counter[0] += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.counter[0] += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.counter[0] += 1
+        return self.value >= other.value
+
+
+class InstrumentedDoubleLinkedList(DoubleLinkedList):
+    """
+    Double linked list that counts its operations: calls per operation, nodes traversed by the
+    walking operations, comparisons and relinks made by the sorts and the peak size. Hooks registered
+    with on are called after every counted operation and snapshot returns the counters as a dict.
+    Instrumentation lives in this subclass only, so plain DoubleLinkedList objects pay nothing for it
+    """
+    def __init__(self, array: Optional[Iterable] = None, index: bool = False, pool: int = 0):
+        """
+        :param array: None or iterable, elements appended to the list in order
+        :param index: if true, keeps a value -> nodes hash index, see DoubleLinkedList
+        :param pool: int, maximum number of removed nodes kept for reuse, see DoubleLinkedList
+        """
+        self._hooks = defaultdict(list)
+        self._walking = None
+        self.reset_stats()
+        super().__init__(array, index=index, pool=pool)
+
+    # Counters
+    def reset_stats(self) -> None:
+        self._calls = dict.fromkeys(CALLS, 0)
+        self._traversed = dict.fromkeys(WALKS, 0)
+        # Single item lists so the _Counted wrappers can share them
+        self._merge_comparisons = [0]
+        self._insertion_comparisons = [0]
+        self._relinks = 0
+        self._peak_size = getattr(self, '_size', 0)
+
+    def snapshot(self) -> dict:
+        """
+        Returns a copy of every counter, ready to be exported to a metrics system
+        """
+        return {
+            'calls': dict(self._calls),
+            'traversed': dict(self._traversed),
+            'comparisons': {'merge': self._merge_comparisons[0], 'insertion': self._insertion_comparisons[0]},
+            'relinks': self._relinks,
+            'size': self._size,
+            'peak_size': self._peak_size,
+        }
+
+    # Hooks
+    def on(self, event: str, callback: Callable[[str, dict], Any]) -> None:
+        """
+        Registers callback(event, info) to be called after every event operation
+        :param event: str, one of the counted operations, or '*' for all of them
+        :param callback: Callable, gets the event name and a dict with the size and the counts of the call
+        """
+        if event != '*' and event not in CALLS:
+            raise ValueError(f'Unknown event {event}')
+        self._hooks[event].append(callback)
+
+    def _count(self, event: str, **info) -> None:
+        self._calls[event] += 1
+        if self._size > self._peak_size:
+            self._peak_size = self._size
+        # Handle case where no hook is registered, skip building the info dict
+        if self._hooks:
+            info['size'] = self._size
+            for callback in self._hooks.get(event, []) + self._hooks.get('*', []):
+                callback(event, info)
+
+    # Counted operations
+    def push(self, e: Any) -> None:
+        super().push(e)
+        self._count('push')
+
+    def append(self, e: Any) -> None:
+        super().append(e)
+        self._count('append')
+
+    def pull(self) -> Any:
+        e = super().pull()
+        self._count('pull')
+        return e
+
+    def pop(self) -> Any:
+        e = super().pop()
+        self._count('pop')
+        return e
+
+    def insert_after(self, e: Any, node) -> None:
+        # Handle case where insert_sorted walked back from the median to node, its walk counts it
+        if self._walking is not None:
+            self._walking[0] += self._distance(node, self._walking[1]) - 1
+            super().insert_after(e, node)
+            return
+        appended = node is (self._tail if self._tail is not None else self._head)
+        super().insert_after(e, node)
+        # Handle case where the node was the last one, already counted as an append
+        if not appended:
+            self._count('insert')
+
+    def insert_before(self, e: Any, node) -> None:
+        # Handle case where insert_sorted walked forward from the median to node, its walk counts it
+        if self._walking is not None:
+            self._walking[0] += self._distance(self._walking[1], node) - 1
+            super().insert_before(e, node)
+            return
+        pushed = node is self._head
+        super().insert_before(e, node)
+        # Handle case where the node was the head, already counted as a push
+        if not pushed:
+            self._count('insert')
+
+    def extend(self, iterable: Iterable) -> None:
+        super().extend(iterable)
+        self._peak_size = max(self._peak_size, self._size)
+
+    def extendleft(self, iterable: Iterable) -> None:
+        super().extendleft(iterable)
+        self._peak_size = max(self._peak_size, self._size)
+
+    def _paste(self, after, start, end, count: int) -> None:
+        super()._paste(after, start, end, count)
+        self._peak_size = max(self._peak_size, self._size)
+
+    # Walks, the base class walks and the nodes they traversed are counted from where they stopped
+    @staticmethod
+    def _distance(start, end) -> int:
+        """
+        Returns the number of links followed from start to end
+        """
+        steps = 0
+        while start is not end:
+            start = start._next
+            steps += 1
+        return steps
+
+    def find(self, value: Any):
+        # Handle case where the hash index answers without walking the list
+        if self._index is not None or self._size == 0:
+            node = super().find(value)
+            self._count('find', traversed=0)
+            return node
+
+        try:
+            node = super().find(value)
+        except ValueError:
+            steps = self._size
+            raise
+        else:
+            steps = self._distance(self._head, node) + 1
+            return node
+        finally:
+            self._traversed['find'] += steps
+            self._count('find', traversed=steps)
+
+    def get_median(self, start=None):
+        median = super().get_median(start)
+        # The fast cursor moves two nodes for every node the slow one moves
+        steps = 1 + 3 * self._distance(self._head if start is None else start, median)
+        # Handle case where insert_sorted looks for the median, the nodes count for its walk
+        if self._walking is not None:
+            self._walking[0] += steps
+            self._walking[1] = median
+            return median
+        self._traversed['get_median'] += steps
+        self._count('get_median', traversed=steps)
+        return median
+
+    def insert_sorted(self, e: Any, ascending: bool = True) -> None:
+        # Nodes traversed so far and the median the walk starts from, read by the calls insert_sorted makes
+        self._walking = [0, None]
+        try:
+            super().insert_sorted(e, ascending)
+            steps = self._walking[0]
+        finally:
+            self._walking = None
+        self._traversed['insert_sorted'] += steps
+        self._count('insert_sorted', traversed=steps)
+
+    # Sorts, comparisons are counted by wrapping the sort values
+    def _merge_sort(self, start, ascending: bool = True, threshold: int = 16, key: Optional[Callable] = None):
+        counter = self._merge_comparisons
+        if key is None:
+            counted = lambda e: _Counted(e, counter)
+        else:
+            counted = lambda e: _Counted(key(e), counter)
+        return super()._merge_sort(start, ascending, threshold, counted)
+
+    def _inplace_merge(self, l1, t1, l2, t2, ascending: bool = True, key: Optional[Callable] = None):
+        # Every comparison but the one picking the first node links one node, the final splice links one more
+        before = self._merge_comparisons[0]
+        merged = super()._inplace_merge(l1, t1, l2, t2, ascending, key)
+        self._relinks += self._merge_comparisons[0] - before
+        return merged
+
+    def _insertion_sort(self, start, ascending=True):
+        counter = self._insertion_comparisons
+        cursor = start
+        while cursor is not None:
+            cursor._element = _Counted(cursor._element, counter)
+            cursor = cursor._next
+        try:
+            return super()._insertion_sort(start, ascending)
+        finally:
+            cursor = start
+            while cursor is not None:
+                cursor._element = cursor._element.value
+                cursor = cursor._next
+
+    def sort_values(self, method='merge', *args, **kwargs):
+        before = self._merge_comparisons[0] + self._insertion_comparisons[0]
+        relinks = self._relinks
+        result = super().sort_values(method, *args, **kwargs)
+        self._count('sort', method=method, relinks=self._relinks - relinks,
+                    comparisons=self._merge_comparisons[0] + self._insertion_comparisons[0] - before)
+        return result
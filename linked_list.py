@@ -1,4 +1,34 @@
-from typing import Any, List, Optional, Union
+import heapq
+import mmap
+import os
+from array import array as _array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+# Elements moved per batch by the bulk operations
+CHUNK = 1 << 16
+
+
+def _numpy():
+    """
+    Imports NumPy on first use, it is an optional dependency only needed for the NumPy interop
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('NumPy is required for to_numpy and from_numpy, install it with pip install numpy') from None
+    return numpy
+
+
+def _argsort(values: list, key: Optional[Callable], reverse: bool) -> List[int]:
+    """
+    Returns the positions of values in stable sorted order, run by the parallel sort workers
+    """
+    if key is None:
+        return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+    return sorted(range(len(values)), key=lambda i: key(values[i]), reverse=reverse)
 
 
 class DoubleLinkedList:
@@ -72,35 +102,107 @@ class DoubleLinkedList:
             else:
                 return self._element <= other
 
-        def __del__(self):
-            nxt = self.next
-            prv = self.prev
-            # Handle case where node is only one on the list (prv, nxt is None)
-            if prv is None and nxt is None:
-                # No switch is necessary
-                pass
-            # Handle case where node is head (prv is None)
-            elif prv is None:
-                nxt.prev = None
-            # Handle case where node is tail (nxt is None)
-            elif nxt is None:
-                prv.next = None
-            # Handle regular case where node has next and prev
-            else:
-                nxt.prev, prv.next = prv, nxt
-            self._element = self.next = self.prev = None
-
         def get(self):
             return self._element
 
-    def __init__(self, array: Optional[List] = None):
+    # Whether nodes can be moved out to another list, subclasses that keep state about their nodes turn it off
+    _movable = True
+
+    def __init__(self, array: Optional[Iterable] = None, index: bool = False, pool: int = 0):
+        """
+        :param array: None or iterable, elements appended to the list in order
+        :param index: if true, keeps a value -> nodes hash index for O(1) find, membership and remove.
+            Unhashable elements are left out of the index and looked up with a linear scan. Elements
+            of an indexed list are changed with item assignment: a node whose element is set directly
+            stays indexed under its old element until it is removed
+        :param pool: int, maximum number of removed nodes kept for reuse by new elements, 0 disables
+            the pool. Nodes removed from a pooled list must not be used after their removal
+        """
         self._head = None
         self._tail = None
         self._size = 0
+        self._index = {} if index else None
+        self._unindexed = 0
+        # Free list of removed nodes threaded through their next links
+        self._pool = None
+        self._pool_size = 0
+        self._pool_max = pool
+
+        if array is not None:
+            self.extend(array)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable, **kwargs) -> 'DoubleLinkedList':
+        """
+        Builds a new linked list from any iterable or generator in a single pass
+        :param iterable: Iterable, elements added in iteration order
+        :param kwargs: keyword arguments passed to the constructor
+        """
+        lst = cls(**kwargs)
+        lst.extend(iterable)
+        return lst
+
+    # Serialization
+    def _options(self) -> dict:
+        """
+        Returns the constructor keyword arguments that rebuild an empty list like this one
+        """
+        return {'index': self._index is not None, 'pool': self._pool_max}
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the list as a flat sequence of elements, nodes are never pickled
+        """
+        return {'options': self._options(), 'elements': [x._element for x in self]}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state['options'])
+        self.extend(state['elements'])
+
+    def __reduce__(self):
+        return self.__class__, (), self.__getstate__()
+
+    def to_bytes(self, typecode: str = 'q') -> bytes:
+        """
+        Returns the elements packed as machine values of an array typecode
+        :param typecode: array typecode of the elements (e.g. 'q', 'd')
+        """
+        return _array(typecode, [x._element for x in self]).tobytes()
+
+    @classmethod
+    def from_buffer(cls, buffer, typecode: str = 'q', **kwargs) -> 'DoubleLinkedList':
+        """
+        Builds a new linked list reading the elements straight from a buffer written by to_bytes,
+        the buffer is read through a memoryview without being copied
+        :param buffer: bytes-like object with machine values of typecode
+        :param typecode: array typecode of the elements (e.g. 'q', 'd')
+        :param kwargs: keyword arguments passed to the constructor
+        """
+        with memoryview(buffer) as view, view.cast('B').cast(typecode) as values:
+            return cls.from_iterable(values, **kwargs)
+
+    def to_file(self, path: str, typecode: str = 'q') -> None:
+        """
+        Writes the elements to path as machine values of typecode, see from_file
+        """
+        with open(path, 'wb') as f:
+            _array(typecode, [x._element for x in self]).tofile(f)
 
-        if isinstance(array, list):
-            for x in array:
-                self.append(x)
+    @classmethod
+    def from_file(cls, path: str, typecode: str = 'q', **kwargs) -> 'DoubleLinkedList':
+        """
+        Builds a new linked list from a file written by to_file, memory-mapping it instead of reading
+        it into memory first
+        :param path: str, file with machine values of typecode
+        :param typecode: array typecode of the elements (e.g. 'q', 'd')
+        :param kwargs: keyword arguments passed to the constructor
+        """
+        with open(path, 'rb') as f:
+            # Handle case where the file is empty, mmap does not accept empty files
+            if f.seek(0, 2) == 0:
+                return cls(**kwargs)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return cls.from_buffer(mapped, typecode, **kwargs)
 
     @property
     def head(self):
@@ -128,17 +230,155 @@ class DoubleLinkedList:
         return self._size
 
     def __iter__(self):
+        cursor = self._head
+        while cursor is not None:
+            yield cursor
+            cursor = cursor._next
+
+    def values(self):
+        """
+        Yields the elements from the head, without going through the nodes' get method
+        """
+        cursor = self._head
+        while cursor is not None:
+            yield cursor._element
+            cursor = cursor._next
+
+    def drain(self, from_end: bool = False):
+        """
+        Yields the elements removing each one as it goes, so a large list is freed while it is read
+        :param from_end: if true, elements are popped from the end instead of pulled from the head
+        """
+        take = self.pop if from_end else self.pull
+        while self._size:
+            yield take()
+
+    def stream(self, drain: bool = False) -> 'Stream':
+        """
+        Returns a lazy pipeline over the elements, see Stream
+        :param drain: if true, elements are removed from the list as the pipeline reads them
+        """
+        return Stream(self.drain() if drain else self.values())
+
+    def __contains__(self, value: Any) -> bool:
         if self._size == 0:
-            pass
-        elif self._head:
-            cursor = self._head
-            while cursor is not None:
-                yield cursor
-                cursor = cursor.next
+            return False
+        try:
+            self.find(value)
+        except ValueError:
+            return False
+        return True
 
     def is_empty(self) -> bool:
         return self._size == 0
 
+    def _reset(self) -> None:
+        """
+        Empties the list without touching its nodes, used when they are moved to another list
+        """
+        self._head = None
+        self._tail = None
+        self._size = 0
+        if self._index is not None:
+            self._index = {}
+            self._unindexed = 0
+
+    # Hash index
+    def _index_add(self, node: _Node) -> None:
+        """
+        Registers node under its element in the hash index
+        """
+        try:
+            bucket = self._index.get(node._element)
+        except TypeError:
+            # Unhashable elements opt out of the index
+            self._unindexed += 1
+            return
+        if bucket is None:
+            self._index[node._element] = {id(node): node}
+        else:
+            bucket[id(node)] = node
+
+    def _index_discard(self, node: _Node) -> None:
+        """
+        Removes node from the hash index
+        """
+        try:
+            bucket = self._index.get(node._element)
+        except TypeError:
+            bucket = None
+        if bucket is not None and id(node) in bucket:
+            del bucket[id(node)]
+            if not bucket:
+                del self._index[node._element]
+            return
+
+        # Handle case where the element was set on the node directly, it is looked for under any key
+        for value, bucket in self._index.items():
+            if id(node) in bucket:
+                del bucket[id(node)]
+                if not bucket:
+                    del self._index[value]
+                return
+        self._unindexed -= 1
+
+    def _index_chain(self, start: _Node, count: int) -> None:
+        """
+        Registers count nodes following start in the hash index
+        """
+        for _ in range(count):
+            self._index_add(start)
+            start = start._next
+
+    def _reindex(self) -> None:
+        """
+        Rebuilds the hash index from scratch, used after elements are moved between nodes
+        """
+        self._index = {}
+        self._unindexed = 0
+        if self._size:
+            self._index_chain(self._head, self._size)
+
+    # Node pool
+    def _new_node(self, e: Any, nxt: Optional[_Node], prv: Optional[_Node]) -> _Node:
+        """
+        Returns a node for element e, reusing a pooled node when there is one
+        """
+        node = self._pool
+        # Handle case where no removed node is waiting for reuse
+        if node is None:
+            return self._Node(e, nxt, prv)
+        self._pool = node._next
+        self._pool_size -= 1
+        node._element = e
+        node._next = nxt
+        node._prev = prv
+        return node
+
+    def _release(self, node: _Node) -> None:
+        """
+        Keeps an unlinked node on the pool, the caller checks there is room for it
+        """
+        node._element = None
+        node._prev = None
+        node._next = self._pool
+        self._pool = node
+        self._pool_size += 1
+
+    @property
+    def pool_size(self) -> int:
+        """
+        Number of removed nodes waiting on the pool for reuse
+        """
+        return self._pool_size
+
+    def clear_pool(self) -> None:
+        """
+        Drops every pooled node
+        """
+        self._pool = None
+        self._pool_size = 0
+
     # List interface
     def push(self, e: Any) -> None:
         """
@@ -148,7 +388,7 @@ class DoubleLinkedList:
         # Handle case where there is already a head node
         if self._head is not None:
             predecessor = self._head
-            new = self._Node(e, nxt=predecessor, prv=None)
+            new = self._new_node(e, predecessor, None)
             predecessor._prev = new
             self._head = new
             self._size += 1
@@ -159,7 +399,7 @@ class DoubleLinkedList:
 
         # Handle case where the list is empty
         elif self._size == 0:
-            new = self._Node(e, nxt=None, prv=None)
+            new = self._new_node(e, None, None)
             self._head = new
             self._size += 1
 
@@ -167,6 +407,9 @@ class DoubleLinkedList:
         else:
             raise Exception('Unknown case')
 
+        if self._index is not None:
+            self._index_add(new)
+
     def append(self, e: Any) -> None:
         """
         Creates a new "tail" at the end of the list with element "e"
@@ -175,21 +418,21 @@ class DoubleLinkedList:
         # Handle case where there is already a tail node
         if self._tail is not None:
             predecessor = self._tail
-            new = self._Node(e, nxt=None, prv=predecessor)
+            new = self._new_node(e, None, predecessor)
             self._tail = new
             self._size += 1
             predecessor._next = new
 
         # Handle case where list isn't empty and doesn't have a tail node yet
         elif self._tail is None and self._size == 1 and self._head:
-            new = self._Node(e, nxt=None, prv=self._head)
+            new = self._new_node(e, None, self._head)
             self._tail = new
             self._size += 1
             self._head._next = new
 
         # Handle case where the list is empty
         elif self._size == 0:
-            new = self._Node(e, nxt=None, prv=None)
+            new = self._new_node(e, None, None)
             self._head = new
             self._size += 1
 
@@ -197,6 +440,91 @@ class DoubleLinkedList:
         else:
             raise Exception(f'Unknown case for append {e}')
 
+        if self._index is not None:
+            self._index_add(new)
+
+    def _chain(self, iterable: Iterable, reverse: bool = False):
+        """
+        Links new nodes for every element of iterable without touching the list, pooled nodes are
+        used first
+        :param iterable: Iterable, elements to be linked
+        :param reverse: if true, every new node is linked before the previous one
+        :returns: tuple (first node, last node, number of nodes) of the new chain
+        """
+        # Handle case where the pool is empty, the constructor is called directly
+        node = self._Node if self._pool is None else self._new_node
+        iterator = iter(iterable)
+        for e in iterator:
+            first = last = node(e, None, None)
+            break
+        else:
+            return None, None, 0
+
+        count = 1
+        if reverse:
+            for e in iterator:
+                new = node(e, first, None)
+                first._prev = new
+                first = new
+                count += 1
+        else:
+            for e in iterator:
+                new = node(e, None, last)
+                last._next = new
+                last = new
+                count += 1
+        return first, last, count
+
+    def extend(self, iterable: Iterable) -> None:
+        """
+        Appends every element of iterable at the end of the list, linking the new nodes in one pass
+        :param iterable: Iterable, elements added in iteration order
+        """
+        first, last, count = self._chain(iterable)
+        if count == 0:
+            return
+        # Handle case where the list is empty, the chain becomes the whole list
+        if self._size == 0:
+            self._head = first
+        # Splice the chain after the current last node (head when there is no tail yet)
+        else:
+            predecessor = self._tail if self._tail is not None else self._head
+            predecessor._next = first
+            first._prev = predecessor
+        self._size += count
+        if self._size > 1:
+            self._tail = last
+
+        if self._index is not None:
+            self._index_chain(first, count)
+
+    def extendleft(self, iterable: Iterable) -> None:
+        """
+        Pushes every element of iterable at the beginning of the list, linking the new nodes in one
+        pass. As with repeated push calls, the elements end up in reverse iteration order
+        :param iterable: Iterable, elements to be pushed
+        """
+        first, last, count = self._chain(iterable, reverse=True)
+        if count == 0:
+            return
+        # Handle case where the list is empty, the chain becomes the whole list
+        if self._size == 0:
+            if count > 1:
+                self._tail = last
+        # Splice the chain before the current head
+        else:
+            successor = self._head
+            successor._prev = last
+            last._next = successor
+            # Handle case where the old head is the last element (new tail)
+            if self._tail is None:
+                self._tail = successor
+        self._head = first
+        self._size += count
+
+        if self._index is not None:
+            self._index_chain(first, count)
+
     def insert_after(self, e: Any, node: _Node) -> None:
         """
         Inserts new element after specified node, if node is last on list, creates new tail
@@ -210,17 +538,20 @@ class DoubleLinkedList:
         # Handle case where specified node is not tail
         elif isinstance(node, self._Node):
             # Handle case where node is head and no tail on the list (size 1)
-            if node is self._head and self._head.next is None and self._size == 1:
+            if node is self._head and self._head._next is None and self._size == 1:
                 self.append(e)
             # Handle regular insert between nodes
             else:
-                fwd = node.next
-                new = self._Node(e, nxt=fwd, prv=node)
+                fwd = node._next
+                new = self._new_node(e, fwd, node)
                 self._size += 1
                 # Reassign node order
                 fwd._prev = new
                 node._next = new
 
+                if self._index is not None:
+                    self._index_add(new)
+
         # Handle unexpected error
         else:
             raise TypeError('Invalid node to insert after')
@@ -237,12 +568,15 @@ class DoubleLinkedList:
 
         # Handle case where specified node is not head
         elif isinstance(node, self._Node):
-            bef = node.prev
-            new = self._Node(e, nxt=node, prv=bef)
+            bef = node._prev
+            new = self._new_node(e, node, bef)
             self._size += 1
             bef._next = new
             node._prev = new
 
+            if self._index is not None:
+                self._index_add(new)
+
         # Handle unexpected error
         else:
             raise Exception('Invalid node to insert before')
@@ -251,126 +585,321 @@ class DoubleLinkedList:
         """
         Returns and deletes the last element of the list
         """
-        if self.tail:
-            e = self.tail.get()
-            # Handle case where there is a new tail
-            if self.tail.prev and self._size > 2:
-                successor = self.tail.prev
-                del self._tail
-                self.tail = successor
-                self._size -= 1
-            # Handle case where the tail is the last element after head
-            if self.tail.prev and self._size == 2:
-                del self._tail
-                self.tail = None
-                self._size -= 1
-            return e
-        elif self.tail is None and self._size == 1 and self.head:
-            # Handle case where head is the only element
-            e = self.head.get()
-            del self._head
-            self.head = None
+        # Handle case where there is a tail node
+        if self._tail is not None:
+            old = self._tail
+            successor = old._prev
+            successor._next = None
+            old._prev = None
+            # Handle case where the new last element is the head (no tail on a single element list)
+            self._tail = None if successor is self._head else successor
+            self._size -= 1
+        # Handle case where head is the only element
+        elif self._size == 1 and self._head is not None:
+            old = self._head
+            self._head = None
             self._size -= 1
-            return e
         else:
             raise ValueError('Linked list is empty')
 
+        if self._index is not None:
+            self._index_discard(old)
+        e = old._element
+        if self._pool_size < self._pool_max:
+            self._release(old)
+        return e
+
     def pull(self) -> _Node.element:
         """
         Returns and deletes the first element of the list
         """
-        if self.head:
-            e = self.head.get()
-            # Handle case where next element is not a tail
-            if self.head.next and self._size > 2:
-                successor = self.head.next
-                successor.prev = None
-                del self._head
-                self.head = successor
-                self._size -= 1
-            # Handle case where next element is a tail (new head on linked list)
-            if self.head.next and self._size == 2:
-                successor = self.head.next
-                successor.prev = None
-                del self._head
-                self._head = successor
-                self._size -= 1
-            # Handle case where head is the only element
-            if self._size == 1:
-                del self._head
-                self._size -= 1
-            return e
+        if self._head is None:
+            raise ValueError('Linked list is empty')
+
+        old = self._head
+        successor = old._next
+        # Handle case where head is the only element
+        if successor is None:
+            self._head = None
+        # Handle case where next element is a tail (new head on a single element list)
+        elif successor is self._tail:
+            successor._prev = None
+            old._next = None
+            self._head = successor
+            self._tail = None
+        # Handle case where next element is not a tail
         else:
+            successor._prev = None
+            old._next = None
+            self._head = successor
+        self._size -= 1
+
+        if self._index is not None:
+            self._index_discard(old)
+        e = old._element
+        if self._pool_size < self._pool_max:
+            self._release(old)
+        return e
+
+    def _unlink(self, node: _Node) -> Any:
+        """
+        Deletes the specified node from the list
+        :param node: Node object to be removed
+        :returns: element of the removed node
+        """
+        if node is self._head:
+            return self.pull()
+        if node is self._tail:
+            return self.pop()
+
+        prv, nxt = node._prev, node._next
+        prv._next = nxt
+        nxt._prev = prv
+        node._prev = node._next = None
+        self._size -= 1
+
+        if self._index is not None:
+            self._index_discard(node)
+        e = node._element
+        if self._pool_size < self._pool_max:
+            self._release(node)
+        return e
+
+    def remove_node(self, node: _Node) -> Any:
+        """
+        Deletes the specified node from the list in O(1) time
+        :param node: Node object on this list
+        :returns: element of the removed node
+        """
+        if not isinstance(node, self._Node):
+            raise TypeError('Invalid node to remove')
+        return self._unlink(node)
+
+    def move_to_front(self, node: _Node) -> None:
+        """
+        Relinks the specified node as the head of the list without allocating a new node
+        :param node: Node object on this list
+        """
+        if not isinstance(node, self._Node):
+            raise TypeError('Invalid node to move')
+        if node is self._head:
+            return
+
+        # Detach node, it has a previous node since it is not the head
+        prv, nxt = node._prev, node._next
+        prv._next = nxt
+        # Handle case where node is tail, the previous node becomes the last element
+        if nxt is None:
+            self._tail = None if prv is self._head else prv
+        else:
+            nxt._prev = prv
+
+        # Attach node before the current head
+        successor = self._head
+        successor._prev = node
+        node._next = successor
+        node._prev = None
+        self._head = node
+        # Handle case where the old head is the last element (new tail)
+        if self._tail is None:
+            self._tail = successor
+
+    def move_to_end(self, node: _Node) -> None:
+        """
+        Relinks the specified node as the tail of the list without allocating a new node
+        :param node: Node object on this list
+        """
+        if not isinstance(node, self._Node):
+            raise TypeError('Invalid node to move')
+        predecessor = self._tail if self._tail is not None else self._head
+        if node is predecessor:
+            return
+
+        # Detach node, it has a next node since it is not the last element
+        prv, nxt = node._prev, node._next
+        nxt._prev = prv
+        if prv is None:
+            self._head = nxt
+        else:
+            prv._next = nxt
+
+        # Attach node after the last element
+        predecessor._next = node
+        node._prev = predecessor
+        node._next = None
+        self._tail = node
+
+    # Chain transfers
+    def _cut(self, start: _Node, end: _Node, count: int) -> None:
+        """
+        Detaches the chain of count nodes from start to end, both on this list
+        """
+        prv, nxt = start._prev, end._next
+        if prv is None:
+            self._head = nxt
+        else:
+            prv._next = nxt
+        if nxt is not None:
+            nxt._prev = prv
+        start._prev = end._next = None
+        self._size -= count
+        # Handle case where one node or none is left, single element lists have no tail
+        if self._size < 2:
+            self._tail = None
+        elif nxt is None:
+            self._tail = prv
+
+        if self._index is not None:
+            for _ in range(count):
+                self._index_discard(start)
+                start = start._next
+
+    def _paste(self, after: Optional[_Node], start: _Node, end: _Node, count: int) -> None:
+        """
+        Links the detached chain of count nodes from start to end after a node of this list
+        :param after: None to link the chain at the front, or Node object on this list
+        """
+        if after is None:
+            nxt = self._head
+            self._head = start
+        else:
+            nxt = after._next
+            after._next = start
+        start._prev = after
+        end._next = nxt
+        if nxt is not None:
+            nxt._prev = end
+        self._size += count
+        # Handle case where the list was empty or had a single node (no tail)
+        if self._size > 1 and (nxt is None or self._tail is None):
+            self._tail = end if nxt is None else nxt
+
+        if self._index is not None:
+            self._index_chain(start, count)
+
+    def splice(self, other: 'DoubleLinkedList', after: Optional[_Node] = None, start: Optional[_Node] = None,
+               end: Optional[_Node] = None, count: Optional[int] = None) -> None:
+        """
+        Moves the nodes from start to end of other after a node of this list. Nodes are relinked in O(1)
+        when count is given, otherwise one pass from start to end counts them
+        :param other: DoubleLinkedList the nodes are taken from
+        :param after: None to move the nodes to the front, or Node object on this list
+        :param start: None for the first node of other, or first Node object of the range
+        :param end: None for the last node of other, or last Node object of the range
+        :param count: None or int, number of nodes from start to end
+        """
+        if other is self:
+            raise ValueError('Cannot splice a list into itself')
+        if not isinstance(other, self.__class__):
+            raise TypeError(f'Cannot move nodes of {type(other).__name__} into {type(self).__name__}')
+        if other._size == 0:
+            return
+        if start is None:
+            start = other._head
+        if end is None:
+            end = other._tail if other._tail is not None else other._head
+        for node in (after, start, end):
+            if node is not None and not isinstance(node, self._Node):
+                raise TypeError('Invalid node to splice')
+
+        if count is None:
+            count = 1
+            cursor = start
+            while cursor is not end:
+                cursor = cursor._next
+                if cursor is None:
+                    raise ValueError('End node does not follow start node')
+                count += 1
+        other._cut(start, end, count)
+        self._paste(after, start, end, count)
+
+    def concat(self, other: 'DoubleLinkedList') -> None:
+        """
+        Moves every node of other to the end of this list in O(1), other is left empty
+        :param other: DoubleLinkedList the nodes are taken from
+        """
+        if other is self:
+            raise ValueError('Cannot concatenate a list to itself')
+        if not isinstance(other, self.__class__):
+            raise TypeError(f'Cannot move nodes of {type(other).__name__} into {type(self).__name__}')
+        if other._size == 0:
+            return
+        start = other._head
+        end = other._tail if other._tail is not None else other._head
+        count = other._size
+        other._reset()
+        self._paste(self._tail if self._tail is not None else self._head, start, end, count)
+
+    def split_at(self, node: _Node) -> 'DoubleLinkedList':
+        """
+        Cuts the list before node, counting the nodes that move in one pass
+        :param node: Node object on this list, first node of the returned list
+        :returns: new list of the same kind with node and the nodes following it
+        """
+        if not isinstance(node, self._Node):
+            raise TypeError('Invalid node to split at')
+        end, count = node, 1
+        while end._next is not None:
+            end = end._next
+            count += 1
+        new = self.__class__(**self._options())
+        self._cut(node, end, count)
+        new._paste(None, node, end, count)
+        return new
+
+    def remove(self, value: Any) -> None:
+        """
+        Deletes the node returned by find(value)
+        :param value: Any, value to be removed
+        """
+        if self._size == 0:
             raise ValueError('Linked list is empty')
+        self._unlink(self.find(value))
 
     def insert_sorted(self, e: Any, ascending: bool = True) -> None:
         """
-        Asumming a sorted list, inserts the element
+        Asumming a sorted list, inserts the element after the ones equal to it
         :param e: element added to the list
         :type e: Any
         :param ascending: true if list was sorted in ascending order, false if descending
         :type ascending: boolean
         """
-        median = self.get_median()
         if len(self) == 0:
             self.push(e)
-        elif ascending:
-            if self.tail and self.tail <= e:
-                self.append(e)
-            elif self.head >= e:
-                self.push(e)
-            elif median == e:
-                self.insert_after(e, median)
-            elif median > e:
-                cursor = median.prev
-                print('Starting 1')
-                while cursor:
-                    if cursor <= e:
-                        self.insert_after(e, cursor)
-                    else:
-                        cursor = cursor.prev
-            elif median < e:
-                cursor = median.next
-                print('Starting 2')
-                while cursor:
-                    if cursor >= e:
-                        self.insert_before(e, cursor)
-                    else:
-                        cursor = cursor.next
+            return
+
+        last = self._tail if self._tail is not None else self._head
+        # Handle case where element goes after the last node
+        if (last._element <= e) if ascending else (e <= last._element):
+            self.append(e)
+        # Handle case where element goes before the head node
+        elif (e < self._head._element) if ascending else (self._head._element < e):
+            self.push(e)
         else:
-            if self.tail and e <= self.tail:
-                self.append(e)
-            elif e >= self.head:
-                self.push(e)
-            elif median == e:
-                self.insert_after(e, median)
-            elif e > median:
-                cursor = median.prev
-                print('Starting 3')
-                while cursor:
-                    if e <= cursor:
-                        self.insert_after(e, cursor)
-                    else:
-                        cursor = cursor.prev
-            elif e < median:
-                cursor = median.next
-                print('Starting 4')
-                while cursor:
-                    if e >= cursor:
-                        self.insert_before(e, cursor)
-                    else:
-                        cursor = cursor.next
+            median = self.get_median()
+            # Handle case where element goes after the median, walk forward to the first greater node
+            if (median._element <= e) if ascending else (e <= median._element):
+                cursor = median._next
+                while (cursor._element <= e) if ascending else (e <= cursor._element):
+                    cursor = cursor._next
+                self.insert_before(e, cursor)
+            # Handle case where element goes before the median, walk back to the first smaller or equal node
+            else:
+                cursor = median._prev
+                while (e < cursor._element) if ascending else (cursor._element < e):
+                    cursor = cursor._prev
+                self.insert_after(e, cursor)
 
     # Getters
     def first(self) -> _Node.element:
-        if self.head:
-            return self.head.get()
+        if self._head is not None:
+            return self._head._element
         else:
             raise ValueError('List is empty or does not have a head')
 
     def last(self) -> _Node.element:
-        if self.tail:
-            return self.tail.get()
+        if self._tail is not None:
+            return self._tail._element
         else:
             raise ValueError('List is empty or does not have a tail')
 
@@ -379,37 +908,318 @@ class DoubleLinkedList:
         Returns the median node of the linked list
         """
         if start is None:
-            start = self.head
-        slow, fast = start, start.next
-        while fast and fast.next:
-            slow = slow.next
-            fast = fast.next.next
+            start = self._head
+        slow, fast = start, start._next
+        while fast is not None and fast._next is not None:
+            slow = slow._next
+            fast = fast._next._next
         return slow
 
     def find(self, value: Any) -> _Node:
         """
         :param value: Any, value to be found inside a DLL node
-        :return: Node object where value is found
+        :return: Node object where value is found. With the index on and duplicated values, the
+            oldest node holding value is returned instead of the first one in list order
         """
         if len(self) == 0:
             raise TypeError('List is empty')
 
-        for x in self:
-            if x.get() == value:
-                return x
+        if self._index is not None:
+            try:
+                bucket = self._index.get(value)
+            except TypeError:
+                # Unhashable values can only be found by scanning
+                bucket = None
+            else:
+                if bucket:
+                    return next(iter(bucket.values()))
+                # Handle case where every element is indexed: value is not on the list
+                if self._unindexed == 0:
+                    raise ValueError('Value not found')
+
+        cursor = self._head
+        while cursor is not None:
+            if cursor._element == value:
+                return cursor
+            cursor = cursor._next
 
         raise ValueError('Value not found')
 
-    # List reversals
-    def reverse(self):
+    def find_all(self, value: Any) -> List[_Node]:
+        """
+        :param value: Any, value to be found inside DLL nodes
+        :return: list of Node objects where value is found
+        """
+        if self._index is not None and self._unindexed == 0:
+            try:
+                return list(self._index.get(value, {}).values())
+            except TypeError:
+                pass
+
+        return [x for x in self if x._element == value]
+
+    # Positional access
+    def _position(self, index: int) -> int:
+        """
+        Normalizes a possibly negative index into a position on the list
+        """
+        if not isinstance(index, int):
+            raise TypeError('List indices must be integers or slices')
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('List index out of range')
+        return index
+
+    def _node_at(self, index: int) -> _Node:
+        """
+        Returns the node at position index, walking from the closest end of the list
+        :param index: int, position between 0 and len(self) - 1
+        """
+        if index < self._size // 2:
+            cursor = self._head
+            for _ in range(index):
+                cursor = cursor._next
+        else:
+            cursor = self._tail if self._tail is not None else self._head
+            for _ in range(self._size - 1 - index):
+                cursor = cursor._prev
+        return cursor
+
+    def _slice_nodes(self, key: slice) -> List[_Node]:
+        """
+        Returns the nodes selected by a slice, walking the list once from the first of them
+        """
+        positions = range(*key.indices(self._size))
+        if not positions:
+            return []
+        nodes = []
+        cursor = self._node_at(positions[0])
+        step = positions.step
+        for _ in positions:
+            nodes.append(cursor)
+            # Handle case where the last selected node was reached
+            if len(nodes) == len(positions):
+                break
+            for _ in range(abs(step)):
+                cursor = cursor._next if step > 0 else cursor._prev
+        return nodes
+
+    def _replace(self, node: _Node, e: Any) -> None:
         """
-        Reverses a linked list in O(n) time
+        Sets the element of node keeping the hash index up to date
         """
-        new = DoubleLinkedList()
-        for x in self:
-            new.push(x)
+        if self._index is not None:
+            self._index_discard(node)
+            node._element = e
+            self._index_add(node)
+        else:
+            node._element = e
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """
+        Returns the element at position key or a new list with the elements selected by a slice
+        """
+        if isinstance(key, slice):
+            return self.__class__((x._element for x in self._slice_nodes(key)), **self._options())
+        return self._node_at(self._position(key))._element
+
+    def __setitem__(self, key: Union[int, slice], value: Any) -> None:
+        """
+        Sets the element at position key. Slices replace the selected elements with the same number
+        of values from an iterable
+        """
+        if isinstance(key, slice):
+            nodes = self._slice_nodes(key)
+            values = list(value)
+            if len(values) != len(nodes):
+                raise ValueError(f'Attempt to assign sequence of size {len(values)} to slice of size {len(nodes)}')
+            for node, e in zip(nodes, values):
+                self._replace(node, e)
+        else:
+            self._replace(self._node_at(self._position(key)), value)
+
+    def __delitem__(self, key: Union[int, slice]) -> None:
+        """
+        Deletes the node at position key or the nodes selected by a slice
+        """
+        if isinstance(key, slice):
+            for node in self._slice_nodes(key):
+                self._unlink(node)
+        else:
+            self._unlink(self._node_at(self._position(key)))
+
+    def insert(self, index: int, e: Any) -> None:
+        """
+        Inserts element before position index, same as list.insert
+        :param index: int, position of the new element, clamped to the list bounds
+        :param e: Any, element inside node's container
+        """
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index == 0:
+            self.push(e)
+        elif index >= self._size:
+            self.append(e)
+        else:
+            self.insert_before(e, self._node_at(index))
+
+    # Bulk operations
+    def _batches(self, chunk: int = CHUNK):
+        """
+        Yields the elements in lists of up to chunk elements
+        """
+        batch = []
+        cursor = self._head
+        while cursor is not None:
+            batch.append(cursor._element)
+            if len(batch) == chunk:
+                yield batch
+                batch = []
+            cursor = cursor._next
+        if batch:
+            yield batch
+
+    def to_numpy(self, dtype=None, chunk: int = CHUNK):
+        """
+        Returns the elements as a NumPy array, copied in batches of chunk elements
+        :param dtype: None or NumPy dtype, None infers it from the elements
+        :param chunk: int, elements copied per batch
+        """
+        np = _numpy()
+        # Handle case where the dtype is unknown, every batch is converted on its own and joined
+        if dtype is None:
+            return np.concatenate([np.asarray(x) for x in self._batches(chunk)] or [np.empty(0)])
+        out = np.empty(self._size, dtype=dtype)
+        start = 0
+        for batch in self._batches(chunk):
+            out[start:start + len(batch)] = batch
+            start += len(batch)
+        return out
+
+    @classmethod
+    def from_numpy(cls, values, chunk: int = CHUNK, **kwargs) -> 'DoubleLinkedList':
+        """
+        Builds a new linked list from a NumPy array, converting chunk elements at a time to Python objects
+        :param values: one dimensional NumPy array
+        :param chunk: int, elements converted per batch
+        :param kwargs: keyword arguments passed to the constructor
+        """
+        lst = cls(**kwargs)
+        for start in range(0, len(values), chunk):
+            lst.extend(values[start:start + chunk].tolist())
+        return lst
+
+    def sum(self, start: Any = 0) -> Any:
+        """
+        Returns start plus the sum of the elements, added in batches by the builtin sum
+        """
+        for batch in self._batches():
+            start = sum(batch, start)
+        return start
+
+    def min(self, key: Optional[Callable] = None) -> Any:
+        """
+        Returns the smallest element, compared in batches by the builtin min
+        """
+        if self._size == 0:
+            raise ValueError('Linked list is empty')
+        return min((min(batch, key=key) for batch in self._batches()), key=key)
+
+    def max(self, key: Optional[Callable] = None) -> Any:
+        """
+        Returns the largest element, compared in batches by the builtin max
+        """
+        if self._size == 0:
+            raise ValueError('Linked list is empty')
+        return max((max(batch, key=key) for batch in self._batches()), key=key)
+
+    def map(self, func: Callable, batch: bool = False, chunk: int = CHUNK) -> 'DoubleLinkedList':
+        """
+        Returns a new list of the same kind with func applied to every element
+        :param func: Callable, applied to each element, or to each batch when batch is true
+        :param batch: if true, func takes a list of up to chunk elements and returns a sequence of the
+            same length, so NumPy ufuncs or other vectorized functions run once per batch
+        :param chunk: int, elements per batch
+        """
+        new = self.__class__(**self._options())
+        for values in self._batches(chunk):
+            if batch:
+                values = func(values)
+                new.extend(values.tolist() if hasattr(values, 'tolist') else values)
+            else:
+                new.extend(map(func, values))
         return new
 
+    def filter_inplace(self, mask: Iterable) -> 'DoubleLinkedList':
+        """
+        Keeps the nodes whose mask value is true and unlinks the rest in one pass
+        :param mask: iterable of booleans with one value per element, such as a NumPy boolean array
+        :returns: the list itself
+        """
+        mask = mask.tolist() if hasattr(mask, 'tolist') else list(mask)
+        if len(mask) != self._size:
+            raise ValueError(f'Mask of size {len(mask)} does not match list of size {self._size}')
+
+        first = last = None
+        kept = 0
+        cursor = self._head
+        for keep in mask:
+            nxt = cursor._next
+            if keep:
+                cursor._prev = last
+                if last is None:
+                    first = cursor
+                else:
+                    last._next = cursor
+                last = cursor
+                kept += 1
+            else:
+                cursor._next = cursor._prev = None
+                if self._index is not None:
+                    self._index_discard(cursor)
+                if self._pool_size < self._pool_max:
+                    self._release(cursor)
+            cursor = nxt
+        if last is not None:
+            last._next = None
+        self._head = first
+        # Handle case where one node is kept, single element lists have no tail
+        self._tail = last if kept > 1 else None
+        self._size = kept
+        return self
+
+    # List reversals
+    def reverse(self) -> 'DoubleLinkedList':
+        """
+        Reverses the list in place in O(n) time swapping the links of every node, no node is allocated
+        :returns: the list itself
+        """
+        # Handle case where there are no links to swap (size 0 or 1)
+        if self._size < 2:
+            return self
+
+        cursor = self._head
+        while cursor is not None:
+            nxt = cursor._next
+            cursor._next = cursor._prev
+            cursor._prev = nxt
+            cursor = nxt
+        self._head, self._tail = self._tail, self._head
+        return self
+
+    def reversed_view(self) -> 'ReversedView':
+        """
+        Returns a view of the list in reverse order in O(1) time, see ReversedView
+        """
+        return ReversedView(self)
+
+    def __reversed__(self):
+        cursor = self._tail if self._tail is not None else self._head
+        while cursor is not None:
+            yield cursor
+            cursor = cursor._prev
+
     def reverse_rec(self, start: _Node):
         """
         Reverses a linked list recursively
@@ -419,217 +1229,371 @@ class DoubleLinkedList:
             raise RecursionError('List is too big, use standard reverse')
         if not isinstance(start, self._Node):
             raise TypeError('Reverse start is not a valid node object')
-        cursor = start.next
+        self._reverse_rec(start)
+
+    def _reverse_rec(self, start: _Node):
+        """
+        Recursive step of reverse_rec, start is already validated
+        """
+        cursor = start._next
         # Handle case where start node is head node and new tail node
-        if cursor and start.prev is None:
-            start.next = None
-            start.prev = cursor
-            self.tail = start
-            self.reverse_rec(cursor)
+        if cursor is not None and start._prev is None:
+            start._next = None
+            start._prev = cursor
+            self._tail = start
+            self._reverse_rec(cursor)
         # Handle regular case where next and prev nodes are swapped
-        elif cursor and start.prev:
-            start.next = start.prev
-            start.prev = cursor
-            self.reverse_rec(cursor)
+        elif cursor is not None:
+            start._next = start._prev
+            start._prev = cursor
+            self._reverse_rec(cursor)
         # Handle base case where node is tail and new head node; recursive loop finished
-        elif cursor is None and start.prev:
-            start.next = start.prev
-            start.prev = None
-            self.head = start
-        # Handle clase where start is the only node on the list
-        elif start.prev is None and start.next is None:
-            pass
-        else:
-            raise Exception('Unknown error')
+        elif start._prev is not None:
+            start._next = start._prev
+            start._prev = None
+            self._head = start
+        # Handle clase where start is the only node on the list, no switch is necessary
 
     # Sorting utilities
-    def _merge(self, l1: Union[None, _Node], l2: Union[None, _Node]) -> _Node:
-        """
-        Merges two ascending *sorted* linked lists
-        :param l1: None or first sublist starting _Node
-        :param l2: None or second sublist starting _Node
-        :returns: merged _Node object
-        """
-        # If a node is none, list is sorted, return the other
-        if l1 is None:
-            # Tail assignment
-            if l2 > self.tail:
-                self.tail = l2
-                return self.tail
-            else:
-                return l2
-        elif l2 is None:
-            # Tail assignment
-            if l1 > self.tail:
-                self.tail = l1
-                return l1
-            else:
-                return l1
-
-        # Compare min values of each list and merge remainder
-        if l1 <= l2:
-            l1.next = self._merge(l1.next, l2)
-            l1.next.prev = l1
-            l1.prev = None
-            return l1
-        else:
-            l2.next = self._merge(l1, l2.next)
-            l2.next.prev = l2
-            l2.prev = None
-            return l2
-
-    def _merge_descending(self, l1: Union[None, _Node], l2: Union[None, _Node]) -> _Node:
-        """
-        Merges two descending *sorted* linked lists
-        :param l1: None or first sublist starting _Node
-        :param l2: None or second sublist starting _Node
-        :returns: Merged _Node object
-        """
-        # If a node is none, list is sorted, return the other
-        if l1 is None:
-            # Tail assignment
-            if l2 < self.tail:
-                self.tail = l2
-                return self.tail
-            else:
-                return l2
-        elif l2 is None:
-            # Tail assignment
-            if l1 < self.tail:
-                self.tail = l1
-                return l1
-            else:
-                return l1
-        # Compare max values of each list and merge remainder
-        if l1 >= l2:
-            l1.next = self._merge_descending(l1.next, l2)
-            l1.next.prev = l1
-            l1.prev = None
-            return l1
-        else:
-            l2.next = self._merge_descending(l1, l2.next)
-            l2.next.prev = l2
-            l2.prev = None
-            return l2
+    @staticmethod
+    def _sort_key(key: Optional[Callable] = None) -> Callable:
+        """
+        Returns a function mapping a node to the value it is sorted by
+        :param key: None or Callable applied to node elements
+        """
+        if key is None:
+            return attrgetter('_element')
+        return lambda node: key(node._element)
 
-    def _inplace_merge(self, l1: _Node, l2: _Node, ascending: bool = True) -> _Node:
+    def _inplace_merge(self, l1: _Node, t1: _Node, l2: _Node, t2: _Node, ascending: bool = True,
+                       key: Optional[Callable] = None) -> Tuple[_Node, _Node]:
         """
-        Merges two linked lists non recursively
+        Merges two sorted chains non recursively by relinking their nodes. The merge is stable: on
+        ties, nodes from the first chain go first
         :param l1: first node of sublist 1
+        :param t1: last node of sublist 1
         :param l2: first node of sublist 2
-        :returns: first node object of the merged linked lists
+        :param t2: last node of sublist 2
+        :param ascending: order of values
+        :param key: Callable mapping a node to its sort value, see _sort_key
+        :returns: tuple with the first and last node objects of the merged chain
         """
-        minimum = l1
-        if ascending:
-            while l1 and l2:
-                # Handle case where elements are unsorted
-                if l2 < l1:
-                    # Point to next l2 element before swap
-                    pointer = l2.next
-                    # Swap
-                    l2.next = l1
-                    l2.prev = l1.prev
-                    if l2.prev:
-                        l2.prev.next = l2
-                    else:
-                        minimum = l2
-                    l1.prev = l2
-                    # Move loop to pointer
-                    if pointer:
-                        l2 = pointer
-                    # Handle case where l2 is the last element
-                    else:
-                        # Tail assignment
-                        while l1.next:
-                            l1 = l1.next
-                        self.tail = l1
-                        break
-                # Handle case where elements are sorted
-                elif l1 <= l2:
-                    # Move to next l1 sorted element
-                    if l1.next:
-                        l1 = l1.next
-                    # Handle case where l1 is the last element
-                    else:
-                        l1.next = l2
-                        l2.prev = l1
-                        # Tail assignment
-                        while l2.next:
-                            l2 = l2.next
-                        self.tail = l2
-                        break
+        if key is None:
+            key = self._sort_key()
+        l1._prev = l2._prev = None
+        k1, k2 = key(l1), key(l2)
+        # Pick the first node so the loop always has a previous node to link to
+        if (k2 < k1) if ascending else (k1 < k2):
+            first = last = l2
+            l2 = l2._next
+            if l2 is None:
+                last._next = l1
+                l1._prev = last
+                return first, t1
+            k2 = key(l2)
         else:
-            while l1 and l2:
-                # Handle case where elements are unsorted
-                if l2 > l1:
-                    # Point to next l2 element before swap
-                    pointer = l2.next
-                    # Swap
-                    l2.next = l1
-                    l2.prev = l1.prev
-                    if l2.prev:
-                        l2.prev.next = l2
-                    else:
-                        minimum = l2
-                    l1.prev = l2
-                    # Move loop to pointer
-                    if pointer:
-                        l2 = pointer
-                    # Handle case where l2 is the last element
-                    else:
-                        # Tail assignment
-                        while l1.next:
-                            l1 = l1.next
-                        self.tail = l1
+            first = last = l1
+            l1 = l1._next
+            if l1 is None:
+                last._next = l2
+                l2._prev = last
+                return first, t2
+            k1 = key(l1)
+
+        while True:
+            # Handle case where the sublist 2 node goes first
+            if (k2 < k1) if ascending else (k1 < k2):
+                last._next = l2
+                l2._prev = last
+                last = l2
+                l2 = l2._next
+                # Handle case where sublist 2 is exhausted, link the rest of sublist 1
+                if l2 is None:
+                    last._next = l1
+                    l1._prev = last
+                    tail = t1
+                    break
+                k2 = key(l2)
+            # Handle case where the sublist 1 node goes first
+            else:
+                last._next = l1
+                l1._prev = last
+                last = l1
+                l1 = l1._next
+                # Handle case where sublist 1 is exhausted, link the rest of sublist 2
+                if l1 is None:
+                    last._next = l2
+                    l2._prev = last
+                    tail = t2
+                    break
+                k1 = key(l1)
+
+        return first, tail
+
+    def _next_run(self, start: _Node, ascending: bool, key: Callable, threshold: int) -> Tuple[_Node, _Node, int, _Node]:
+        """
+        Cuts the longest sorted run starting at start. Strictly reversed runs are relinked in order
+        and runs shorter than threshold are extended with insertion sort
+        :param start: first node of the run
+        :param ascending: order of values
+        :param key: Callable mapping a node to its sort value, see _sort_key
+        :param threshold: int, minimum length of the run
+        :returns: tuple with the first node, last node and length of the run and the node following it
+        """
+        head = tail = start
+        head._prev = None
+        length = 1
+        k_last = key(start)
+        cursor = start._next
+
+        if cursor is not None:
+            k = key(cursor)
+            # Handle case where the run is strictly out of order, relink each node before the head
+            if (k < k_last) if ascending else (k_last < k):
+                while cursor is not None:
+                    k = key(cursor)
+                    if not ((k < k_last) if ascending else (k_last < k)):
                         break
-                # Handle case where elements are sorted
-                elif l1 >= l2:
-                    # Move to next l1 sorted element
-                    if l1.next:
-                        l1 = l1.next
-                    # Handle case where l1 is the last element
-                    else:
-                        l1.next = l2
-                        l2.prev = l1
-                        # Tail assignment
-                        while l2.next:
-                            l2 = l2.next
-                        self.tail = l2
+                    nxt = cursor._next
+                    cursor._next = head
+                    cursor._prev = None
+                    head._prev = cursor
+                    head = cursor
+                    k_last = k
+                    length += 1
+                    cursor = nxt
+            # Handle case where the run is already in order
+            else:
+                while cursor is not None:
+                    k = key(cursor)
+                    if (k < k_last) if ascending else (k_last < k):
                         break
-        return minimum
+                    tail = cursor
+                    k_last = k
+                    length += 1
+                    cursor = cursor._next
+
+        # Extend short runs by inserting the following nodes from the back of the run
+        while length < threshold and cursor is not None:
+            node = cursor
+            cursor = cursor._next
+            k = key(node)
+            position = tail
+            while position is not None and ((k < key(position)) if ascending else (key(position) < k)):
+                position = position._prev
+            # Handle case where node goes before every node of the run
+            if position is None:
+                node._next = head
+                node._prev = None
+                head._prev = node
+                head = node
+            else:
+                node._prev = position
+                # Handle case where node is the new last node of the run
+                if position is tail:
+                    node._next = None
+                    tail = node
+                else:
+                    node._next = position._next
+                    position._next._prev = node
+                position._next = node
+            length += 1
+
+        tail._next = None
+        return head, tail, length, cursor
 
     # Sorting algorithms
-    def _merge_sort(self, start: _Node, size: int, ascending=True, threshold: int = 50) -> Union[None, _Node]:
+    def _merge_sort(self, start: _Node, ascending: bool = True, threshold: int = 16,
+                    key: Optional[Callable] = None) -> Tuple[_Node, _Node]:
         """
-        Returns a new double linked list sorted recursively
-        :param start: linked list pointer
-        :param size: int, keeps track of approximate size of list on recursive calls
-        :param threshold: int, if list size <= threshold, start using insertion sort
+        Sorts the chain starting at start with an iterative natural merge sort. Sorted runs already
+        present in the chain are kept and merged bottom-up, nodes are relinked and never allocated
+        :param start: linked list start
         :param ascending: order of values
-        :returns: starting node of sorted list
+        :param threshold: int, runs shorter than threshold are extended with insertion sort
+        :param key: None or Callable applied to node elements
+        :returns: tuple with the first and last node objects of the sorted chain
         """
-        # Base case condition: no elements to be sorted
-        if start is None or start.next is None:
-            return start
-        # Algorithm: Cut node's links, forcing them to be new lists a, b and sorting them recursively
-        # Get first split list bounds
-        a_head = start
-        upper_bound = self.get_median(start=start)
-        # Cut node's links
-        b_head = upper_bound.next
-        b_head.prev = None
-        upper_bound.next = None
-
-        # Sort new lists recursively or through insertion-sort if size <= threshold and merge
-        if threshold > size:
-            # Sort new sublists with insertion sort
-            lower = self._insertion_sort(a_head, ascending)
-            upper = self._insertion_sort(b_head, ascending)
-        else:
-            lower = self._merge_sort(a_head, int(size / 2), ascending)
-            upper = self._merge_sort(b_head, int(size / 2), ascending)
+        # Handle case where there is no key, nodes are compared by their elements
+        if key is None:
+            return self._merge_runs(start, ascending, threshold)
+
+        # Every node holds its sort value while the sort runs, so key is called once per node
+        saved = []
+        try:
+            cursor = start
+            while cursor is not None:
+                saved.append((cursor, cursor._element))
+                cursor._element = key(cursor._element)
+                cursor = cursor._next
+            try:
+                return self._merge_runs(start, ascending, threshold)
+            except BaseException:
+                # Handle case where sort values do not compare, relink the nodes in their original order
+                last = None
+                for node, _ in saved:
+                    node._prev = last
+                    if last is not None:
+                        last._next = node
+                    last = node
+                last._next = None
+                raise
+        finally:
+            for node, e in saved:
+                node._element = e
+
+    def _merge_runs(self, start: _Node, ascending: bool, threshold: int) -> Tuple[_Node, _Node]:
+        """
+        Merges the natural runs of the chain starting at start by their elements. Pending runs keep
+        the Timsort invariants, every run is longer than the next two together and than the next
+        one, so run lengths shrink geometrically and the sort stays O(n log n)
+        :returns: tuple with the first and last node objects of the sorted chain
+        """
+        key = self._sort_key()
+        # Stack of pending runs [head, tail, length], run lengths shrink towards the top
+        runs = []
 
-        return self._inplace_merge(lower, upper, ascending)
+        def merge_at(i: int) -> None:
+            """
+            Merges the pending runs i and i + 1
+            """
+            first, second = runs[i], runs.pop(i + 1)
+            first[0], first[1] = self._inplace_merge(first[0], first[1], second[0], second[1], ascending, key)
+            first[2] += second[2]
+
+        cursor = start
+        while cursor is not None:
+            head, tail, length, cursor = self._next_run(cursor, ascending, key, threshold)
+            runs.append([head, tail, length])
+            while len(runs) > 1:
+                n = len(runs)
+                # Handle case where a run is not longer than the two above it, merge the smaller neighbour
+                if (n > 2 and runs[-3][2] <= runs[-2][2] + runs[-1][2]
+                        or n > 3 and runs[-4][2] <= runs[-3][2] + runs[-2][2]):
+                    merge_at(-3 if runs[-3][2] < runs[-1][2] else -2)
+                # Handle case where a run is not longer than the one above it
+                elif runs[-2][2] <= runs[-1][2]:
+                    merge_at(-2)
+                else:
+                    break
+
+        # Once the chain is consumed, merge the remaining runs from the top
+        while len(runs) > 1:
+            merge_at(-2)
+        return runs[0][0], runs[0][1]
+
+    def _parallel_sort(self, ascending: bool = True, key: Optional[Callable] = None,
+                       workers: Optional[int] = None) -> Tuple[_Node, _Node]:
+        """
+        Sorts the list splitting it in one chunk of nodes per worker process. Workers only get the
+        elements and return their sorted order, each chunk is relinked in that order and the sorted
+        chunks are merged pairwise with _inplace_merge
+        :param ascending: order of values
+        :param key: None or Callable applied to node elements, it must be picklable
+        :param workers: None or int, number of processes, None for one per CPU
+        :returns: tuple with the first and last node objects of the sorted chain
+        """
+        workers = workers or os.cpu_count() or 1
+        size = -(-self._size // workers)
+        chunks = []
+        cursor = self._head
+        while cursor is not None:
+            nodes = []
+            while cursor is not None and len(nodes) < size:
+                nodes.append(cursor)
+                cursor = cursor._next
+            chunks.append(nodes)
+
+        with ProcessPoolExecutor(len(chunks)) as pool:
+            orders = pool.map(_argsort, ([x._element for x in nodes] for nodes in chunks), repeat(key),
+                              repeat(not ascending))
+            runs = []
+            for nodes, order in zip(chunks, orders):
+                head = last = None
+                for i in order:
+                    node = nodes[i]
+                    node._prev = last
+                    if last is None:
+                        head = node
+                    else:
+                        last._next = node
+                    last = node
+                last._next = None
+                runs.append((head, last))
+
+        key = self._sort_key(key)
+        # Merge neighbouring runs so ties keep their list order
+        while len(runs) > 1:
+            merged = [self._inplace_merge(*runs[i], *runs[i + 1], ascending, key)
+                      for i in range(0, len(runs) - 1, 2)]
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            runs = merged
+        return runs[0]
+
+    @staticmethod
+    def _drain(start: _Node):
+        """
+        Yields the nodes of a chain reading each next link before the node is handed out, so the
+        consumer can relink it
+        """
+        cursor = start
+        while cursor is not None:
+            nxt = cursor._next
+            yield cursor
+            cursor = nxt
+
+    @classmethod
+    def merge_sorted(cls, *lists: 'DoubleLinkedList', key: Optional[Callable] = None, reverse: bool = False,
+                     **kwargs) -> 'DoubleLinkedList':
+        """
+        Merges lists that are already sorted into a new list in O(n log k) time with a heap of the k
+        list fronts. Nodes are moved, not copied, so the merged lists are left empty, unless the merge
+        fails and they keep their nodes. The merge is stable: on ties, nodes from earlier lists go first
+        :param lists: DoubleLinkedList objects sorted by key, in the order given by reverse
+        :param key: None or Callable applied to elements to get the value they are sorted by
+        :param reverse: if true, lists are sorted in descending order
+        :param kwargs: keyword arguments passed to the constructor of the new list
+        """
+        if len({id(lst) for lst in lists}) != len(lists):
+            raise ValueError('The same list cannot be merged twice')
+        for lst in lists:
+            if not isinstance(lst, cls):
+                raise TypeError(f'Cannot merge {type(lst).__name__} into {cls.__name__}')
+            if not lst._movable:
+                raise TypeError(f'Cannot move nodes out of {type(lst).__name__}')
+
+        # Nodes are collected before any link changes, so a failed comparison leaves every list intact
+        chains = [cls._drain(lst._head) for lst in lists if lst._size]
+        nodes = list(heapq.merge(*chains, key=cls._sort_key(key), reverse=reverse))
+        for lst in lists:
+            lst._reset()
+
+        new = cls(**kwargs)
+        last = None
+        for node in nodes:
+            node._prev = last
+            if last is None:
+                new._head = node
+            else:
+                last._next = node
+            last = node
+        if last is not None:
+            last._next = None
+        new._size = len(nodes)
+        # Handle case where one node was merged, single element lists have no tail
+        new._tail = last if len(nodes) > 1 else None
+        if new._index is not None:
+            new._reindex()
+        return new
+
+    @staticmethod
+    def iter_merge_sorted(*lists: 'DoubleLinkedList', key: Optional[Callable] = None, reverse: bool = False):
+        """
+        Lazy variant of merge_sorted, yields the elements of the sorted lists in merged order without
+        changing them
+        """
+        return heapq.merge(*((x._element for x in lst) for lst in lists), key=key, reverse=reverse)
 
     def _insertion_sort(self, start: _Node, ascending=True) -> Union[None, _Node]:
         """
@@ -647,26 +1611,26 @@ class DoubleLinkedList:
 
         head = start
         if ascending:
-            while start:
-                cursor = start.next
+            while start is not None:
+                cursor = start._next
                 # Handle case where next value is already sorted
-                if cursor and cursor.get() >= start.get():
+                if cursor is not None and cursor._element >= start._element:
                     start = cursor
                 # Handle case where next value is not sorted
-                elif cursor and cursor.get() < start.get():
+                elif cursor is not None and cursor._element < start._element:
                     # Get value and swap with sorted node
-                    unsorted = cursor.get()
-                    cursor.element = start.get()
-                    start.element = unsorted
+                    unsorted = cursor._element
+                    cursor._element = start._element
+                    start._element = unsorted
 
                     # Check with previous values
-                    while start.prev and start.element < start.prev.get():
-                        unsorted = start.get()
-                        start.element = start.prev.get()
-                        start.prev.element = unsorted
+                    while start._prev and start._element < start._prev._element:
+                        unsorted = start._element
+                        start._element = start._prev._element
+                        start._prev._element = unsorted
 
                         # Move backwards loop cursor
-                        start = start.prev
+                        start = start._prev
 
                     # Once finished, move outer forward loop cursor
                     start = cursor
@@ -674,26 +1638,26 @@ class DoubleLinkedList:
                 elif cursor is None:
                     break
         elif not ascending:
-            while start:
-                cursor = start.next
+            while start is not None:
+                cursor = start._next
                 # Handle case where next value is already sorted
-                if cursor and cursor.get() <= start.get():
+                if cursor is not None and cursor._element <= start._element:
                     start = cursor
                 # Handle case where next value is not sorted
-                elif cursor and cursor.get() > start.get():
+                elif cursor is not None and cursor._element > start._element:
                     # Get value and swap with sorted node
-                    unsorted = cursor.get()
-                    cursor.element = start.get()
-                    start.element = unsorted
+                    unsorted = cursor._element
+                    cursor._element = start._element
+                    start._element = unsorted
 
                     # Check with previous values
-                    while start.prev and start.element > start.prev.get():
-                        unsorted = start.get()
-                        start.element = start.prev.get()
-                        start.prev.element = unsorted
+                    while start._prev and start._element > start._prev._element:
+                        unsorted = start._element
+                        start._element = start._prev._element
+                        start._prev._element = unsorted
 
                         # Move backwards loop cursor
-                        start = start.prev
+                        start = start._prev
 
                     # Once finished, move outer forward loop cursor
                     start = cursor
@@ -702,10 +1666,131 @@ class DoubleLinkedList:
                     break
         return head
 
-    def sort_values(self, method='merge', ascending=True):
+    def sort_values(self, method='merge', ascending=True, key: Optional[Callable] = None, reverse: bool = False,
+                    workers: Optional[int] = None):
+        """
+        Sorts the list in place
+        :param method: 'merge' for a stable natural merge sort relinking nodes, 'insertion' to swap elements,
+            'parallel' for a stable merge sort of one chunk per process, worth it for millions of elements
+        :param ascending: order of values
+        :param key: None or Callable applied to elements to get the value they are sorted by, merge and
+            parallel only. Parallel sorts need a picklable key, such as a module level function
+        :param reverse: if true, sorts in descending order like sorted(reverse=True)
+        :param workers: None or int, processes used by the parallel method, None for one per CPU
+        """
+        ascending = ascending and not reverse
         if method == 'merge':
-            self.head = self._merge_sort(self.head, len(self), ascending)
+            if self._size > 1:
+                self._head, self._tail = self._merge_sort(self._head, ascending, key=key)
+            return self
+        if method == 'parallel':
+            if self._size > 1:
+                self._head, self._tail = self._parallel_sort(ascending, key, workers)
             return self
         if method == 'insertion':
-            self._insertion_sort(self.head, ascending)
+            if key is not None:
+                raise ValueError('key is only supported by the merge method')
+            self._insertion_sort(self._head, ascending)
+            # Insertion sort swaps elements between nodes
+            if self._index is not None:
+                self._reindex()
             return self
+        raise ValueError(f'Unknown sort method {method}')
+
+
+class ReversedView:
+    """
+    Reversed view over a DoubleLinkedList. Iteration and the end operations run from the tail
+    without touching any node, changes made through the view are made on the list
+    """
+    __slots__ = '_list'
+
+    def __init__(self, lst: DoubleLinkedList):
+        """
+        :param lst: DoubleLinkedList seen in reverse order
+        """
+        self._list = lst
+
+    def __len__(self) -> int:
+        return len(self._list)
+
+    def __iter__(self):
+        return reversed(self._list)
+
+    def __reversed__(self):
+        return iter(self._list)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._list
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Returns the element at position index counted from the tail of the list
+        """
+        lst = self._list
+        return lst._node_at(len(lst) - 1 - lst._position(index))._element
+
+    def reversed_view(self) -> DoubleLinkedList:
+        return self._list
+
+    def push(self, e: Any) -> None:
+        self._list.append(e)
+
+    def append(self, e: Any) -> None:
+        self._list.push(e)
+
+    def extend(self, iterable: Iterable) -> None:
+        self._list.extendleft(iterable)
+
+    def extendleft(self, iterable: Iterable) -> None:
+        self._list.extend(iterable)
+
+    def pull(self) -> Any:
+        return self._list.pop()
+
+    def pop(self) -> Any:
+        return self._list.pull()
+
+    def first(self) -> Any:
+        return self._list.last()
+
+    def last(self) -> Any:
+        return self._list.first()
+
+
+class Stream:
+    """
+    Lazy pipeline over an iterable. filter, map, take and skip chain C level iterators and nothing
+    runs until the stream is iterated or collected, so every element goes through the pipeline in a
+    single pass without intermediate lists
+    """
+    __slots__ = '_iterator'
+
+    def __init__(self, iterable: Iterable):
+        """
+        :param iterable: Iterable, source of the elements
+        """
+        self._iterator = iter(iterable)
+
+    def __iter__(self):
+        return self._iterator
+
+    def filter(self, predicate: Callable) -> 'Stream':
+        return Stream(filter(predicate, self._iterator))
+
+    def map(self, func: Callable) -> 'Stream':
+        return Stream(map(func, self._iterator))
+
+    def take(self, n: int) -> 'Stream':
+        return Stream(islice(self._iterator, n))
+
+    def skip(self, n: int) -> 'Stream':
+        return Stream(islice(self._iterator, n, None))
+
+    def collect(self, cls: type = DoubleLinkedList, **kwargs) -> DoubleLinkedList:
+        """
+        Runs the pipeline into a new linked list
+        :param cls: class of the new list
+        :param kwargs: keyword arguments passed to the constructor
+        """
+        return cls.from_iterable(self._iterator, **kwargs)
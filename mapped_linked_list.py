@@ -0,0 +1,411 @@
+import mmap
+import os
+import pickle
+import struct
+from typing import Any, Iterable, Optional
+
+# Link value used for "no record" on next/prev fields
+NIL = -1
+# Prev value used to mark a record that is on the free list
+FREE = -2
+
+MAGIC = b'DLLM'
+# magic, clean flag, head, tail, free, size, count, heap end, heap generation
+HEADER = struct.Struct('<4sqqqqqqqq')
+HEADER_SIZE = 128
+# element offset in the heap, next record, prev record
+RECORD = struct.Struct('<qqq')
+LINK = struct.Struct('<q')
+# Records allocated when a file is created
+MIN_CAPACITY = 1024
+
+
+class MappedDoubleLinkedList:
+    """
+    Persistent double linked list for data that outgrows memory. Nodes are fixed size records
+    (element offset, next, prev) in a memory-mapped file, elements are pickled on an append-only
+    heap file next to it. Records are referenced by integer handles like ArrayDoubleLinkedList.
+
+    Every change first writes the new records and heap entries and then publishes them with a single
+    write on the forward chain (a next link or the head), so the list read from the head is always
+    consistent. A list that was not closed is repaired on reopen from that chain. compact rewrites
+    both files without the freed records and removed elements
+    """
+    def __init__(self, path: str, array: Optional[Iterable] = None):
+        """
+        :param path: str, records file, created if it does not exist. Elements go to path.heap.N
+        :param array: None or iterable, elements appended to the list in order
+        """
+        self._path = path
+        self._map = None
+        self._heap = None
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'r+b' if exists else 'w+b')
+        if exists:
+            self._load()
+        else:
+            self._create()
+
+        if array is not None:
+            for x in array:
+                self.append(x)
+
+    # Files
+    def _heap_path(self, generation: int) -> str:
+        return f'{self._path}.heap.{generation}'
+
+    def _create(self) -> None:
+        self._file.truncate(HEADER_SIZE + MIN_CAPACITY * RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._head = self._tail = self._free = NIL
+        self._size = self._count = self._heap_end = self._generation = 0
+        self._heap = open(self._heap_path(0), 'w+b')
+        self._write_header(clean=False)
+
+    def _load(self) -> None:
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, clean, head, tail, free, size, count, heap_end, generation = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f'{self._path} is not a mapped linked list file')
+        self._head, self._tail, self._free = head, tail, free
+        self._size, self._count, self._heap_end, self._generation = size, count, heap_end, generation
+        self._heap = open(self._heap_path(generation), 'r+b')
+        # Handle case where the list was not closed, rebuild everything from the forward chain
+        if not clean:
+            self._recover()
+        self._write_header(clean=False)
+
+    def _write_header(self, clean: bool) -> None:
+        HEADER.pack_into(self._map, 0, MAGIC, int(clean), self._head, self._tail, self._free, self._size,
+                         self._count, self._heap_end, self._generation)
+
+    def _recover(self) -> None:
+        """
+        Relinks prev fields, tail, size and the free list following the next links from the head
+        """
+        self._heap_end = os.fstat(self._heap.fileno()).st_size
+        capacity = self.capacity()
+        reached = bytearray(capacity)
+        previous, cursor, size = NIL, self._head, 0
+        while 0 <= cursor < capacity and not reached[cursor]:
+            reached[cursor] = 1
+            LINK.pack_into(self._map, self._record(cursor) + 2 * LINK.size, previous)
+            previous, cursor, size = cursor, self._link(cursor, 1), size + 1
+        # Handle case where the chain ends on a broken link, the last reached record becomes the tail
+        if previous == NIL:
+            self._head = NIL
+        else:
+            LINK.pack_into(self._map, self._record(previous) + LINK.size, NIL)
+        self._tail = previous
+        self._size = size
+        self._count = max(self._count, max((i + 1 for i in range(capacity) if reached[i]), default=0))
+
+        self._free = NIL
+        for handle in range(self._count - 1, -1, -1):
+            if not reached[handle]:
+                RECORD.pack_into(self._map, self._record(handle), NIL, self._free, FREE)
+                self._free = handle
+
+    def flush(self) -> None:
+        """
+        Writes every change to disk
+        """
+        self._heap.flush()
+        os.fsync(self._heap.fileno())
+        self._map.flush()
+
+    def close(self) -> None:
+        if self._map is None:
+            return
+        self._write_header(clean=True)
+        self.flush()
+        self._map.close()
+        self._file.close()
+        self._heap.close()
+        self._map = None
+
+    def __enter__(self) -> 'MappedDoubleLinkedList':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Records
+    @staticmethod
+    def _record(handle: int) -> int:
+        return HEADER_SIZE + handle * RECORD.size
+
+    def _link(self, handle: int, field: int) -> int:
+        """
+        Reads field 0 (element offset), 1 (next) or 2 (prev) of a record
+        """
+        return LINK.unpack_from(self._map, self._record(handle) + field * LINK.size)[0]
+
+    def _set_link(self, handle: int, field: int, value: int) -> None:
+        LINK.pack_into(self._map, self._record(handle) + field * LINK.size, value)
+
+    def capacity(self) -> int:
+        """
+        Returns the number of records the file has room for
+        """
+        return (len(self._map) - HEADER_SIZE) // RECORD.size
+
+    def _grow(self) -> None:
+        capacity = self.capacity() * 2
+        self._map.close()
+        self._file.truncate(HEADER_SIZE + capacity * RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def _store(self, data: bytes) -> int:
+        """
+        Appends a pickled element to the heap
+        :returns: int, offset of the element on the heap
+        """
+        offset = self._heap_end
+        self._heap.seek(offset)
+        self._heap.write(LINK.pack(len(data)))
+        self._heap.write(data)
+        # Elements reach the file before any record referencing them is published
+        self._heap.flush()
+        self._heap_end = offset + LINK.size + len(data)
+        return offset
+
+    def _load_element(self, handle: int) -> bytes:
+        self._heap.seek(self._link(handle, 0))
+        length, = LINK.unpack(self._heap.read(LINK.size))
+        return self._heap.read(length)
+
+    def _allocate(self, data: bytes, nxt: int, prv: int) -> int:
+        """
+        Takes a record from the free list or from the end of the file, not yet linked on the list
+        :returns: int, handle of the new record
+        """
+        offset = self._store(data)
+        if self._free != NIL:
+            handle = self._free
+            self._free = self._link(handle, 1)
+        else:
+            if self._count == self.capacity():
+                self._grow()
+            handle = self._count
+            self._count += 1
+        RECORD.pack_into(self._map, self._record(handle), offset, nxt, prv)
+        self._size += 1
+        return handle
+
+    def _release(self, handle: int) -> Any:
+        """
+        Puts an unlinked record back on the free list
+        :returns: element stored in the record
+        """
+        e = pickle.loads(self._load_element(handle))
+        RECORD.pack_into(self._map, self._record(handle), NIL, self._free, FREE)
+        self._free = handle
+        self._size -= 1
+        self._write_header(clean=False)
+        return e
+
+    def _check(self, handle: int) -> None:
+        if not isinstance(handle, int) or not 0 <= handle < self._count or self._link(handle, 2) == FREE:
+            raise TypeError('Invalid node handle')
+
+    @staticmethod
+    def _dumps(e: Any) -> bytes:
+        return pickle.dumps(e, pickle.HIGHEST_PROTOCOL)
+
+    # Node accessors
+    @property
+    def head(self) -> Optional[int]:
+        return None if self._head == NIL else self._head
+
+    @property
+    def tail(self) -> Optional[int]:
+        return None if self._tail == NIL else self._tail
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        cursor = self._head
+        while cursor != NIL:
+            yield cursor
+            cursor = self._link(cursor, 1)
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def get(self, handle: int) -> Any:
+        self._check(handle)
+        return pickle.loads(self._load_element(handle))
+
+    def next(self, handle: int) -> Optional[int]:
+        self._check(handle)
+        nxt = self._link(handle, 1)
+        return None if nxt == NIL else nxt
+
+    def prev(self, handle: int) -> Optional[int]:
+        self._check(handle)
+        prv = self._link(handle, 2)
+        return None if prv == NIL else prv
+
+    # List interface
+    def push(self, e: Any) -> int:
+        """
+        Creates a new head record at the beginning of the list with element "e"
+        :param e: Any, element stored in the record
+        :returns: int, handle of the new record
+        """
+        handle = self._allocate(self._dumps(e), self._head, NIL)
+        if self._head == NIL:
+            self._tail = handle
+        else:
+            self._set_link(self._head, 2, handle)
+        self._head = handle
+        self._write_header(clean=False)
+        return handle
+
+    def append(self, e: Any) -> int:
+        """
+        Creates a new tail record at the end of the list with element "e"
+        :param e: Any, element stored in the record
+        :returns: int, handle of the new record
+        """
+        handle = self._allocate(self._dumps(e), NIL, self._tail)
+        if self._tail == NIL:
+            self._head = handle
+        else:
+            self._set_link(self._tail, 1, handle)
+        self._tail = handle
+        self._write_header(clean=False)
+        return handle
+
+    def insert_after(self, e: Any, node: int) -> int:
+        """
+        Inserts new element after specified handle, if handle is last on list, creates new tail
+        :param e: Any, element stored in the record
+        :param node: int, handle for position reference in linked list
+        :returns: int, handle of the new record
+        """
+        self._check(node)
+        if node == self._tail:
+            return self.append(e)
+        fwd = self._link(node, 1)
+        handle = self._allocate(self._dumps(e), fwd, node)
+        self._set_link(node, 1, handle)
+        self._set_link(fwd, 2, handle)
+        self._write_header(clean=False)
+        return handle
+
+    def insert_before(self, e: Any, node: int) -> int:
+        """
+        Inserts new element before specified handle, if handle is first on list, creates new head
+        :param e: Any, element stored in the record
+        :param node: int, handle for position reference in linked list
+        :returns: int, handle of the new record
+        """
+        self._check(node)
+        if node == self._head:
+            return self.push(e)
+        bef = self._link(node, 2)
+        handle = self._allocate(self._dumps(e), node, bef)
+        self._set_link(bef, 1, handle)
+        self._set_link(node, 2, handle)
+        self._write_header(clean=False)
+        return handle
+
+    def remove(self, node: int) -> Any:
+        """
+        Unlinks the specified handle from the list and frees its record
+        :param node: int, handle to be removed
+        :returns: element stored in the record
+        """
+        self._check(node)
+        nxt, prv = self._link(node, 1), self._link(node, 2)
+        if prv == NIL:
+            self._head = nxt
+            self._write_header(clean=False)
+        else:
+            self._set_link(prv, 1, nxt)
+        if nxt == NIL:
+            self._tail = prv
+        else:
+            self._set_link(nxt, 2, prv)
+        return self._release(node)
+
+    def pop(self) -> Any:
+        """
+        Returns and deletes the last element of the list
+        """
+        if self._tail == NIL:
+            raise ValueError('Linked list is empty')
+        return self.remove(self._tail)
+
+    def pull(self) -> Any:
+        """
+        Returns and deletes the first element of the list
+        """
+        if self._head == NIL:
+            raise ValueError('Linked list is empty')
+        return self.remove(self._head)
+
+    # Getters
+    def first(self) -> Any:
+        if self._head == NIL:
+            raise ValueError('List is empty or does not have a head')
+        return pickle.loads(self._load_element(self._head))
+
+    def last(self) -> Any:
+        if self._tail == NIL:
+            raise ValueError('List is empty or does not have a tail')
+        return pickle.loads(self._load_element(self._tail))
+
+    def find(self, value: Any) -> int:
+        """
+        :param value: Any, value to be found inside the list
+        :return: int, handle where value is found
+        """
+        if self._size == 0:
+            raise TypeError('List is empty')
+
+        for handle in self:
+            if pickle.loads(self._load_element(handle)) == value:
+                return handle
+
+        raise ValueError('Value not found')
+
+    # Maintenance
+    def compact(self) -> None:
+        """
+        Rewrites the list without freed records and removed elements. The new files are written next
+        to the old ones and swapped in with one rename, so a crash leaves either the old or the new
+        list. Handles change, the new handle of every element is its position
+        """
+        generation = self._generation + 1
+        capacity = max(MIN_CAPACITY, self._size)
+        temporary = self._path + '.compact'
+        with open(temporary, 'w+b') as f, open(self._heap_path(generation), 'w+b') as heap:
+            f.truncate(HEADER_SIZE + capacity * RECORD.size)
+            with mmap.mmap(f.fileno(), 0) as mapped:
+                offset = 0
+                for position, handle in enumerate(self):
+                    data = self._load_element(handle)
+                    heap.write(LINK.pack(len(data)))
+                    heap.write(data)
+                    nxt = position + 1 if position + 1 < self._size else NIL
+                    RECORD.pack_into(mapped, self._record(position), offset, nxt, position - 1)
+                    offset += LINK.size + len(data)
+                last = self._size - 1 if self._size else NIL
+                HEADER.pack_into(mapped, 0, MAGIC, 1, 0 if self._size else NIL, last, NIL, self._size,
+                                 self._size, offset, generation)
+                mapped.flush()
+            heap.flush()
+            os.fsync(heap.fileno())
+
+        old_heap = self._heap_path(self._generation)
+        self._map.close()
+        self._file.close()
+        self._heap.close()
+        os.replace(temporary, self._path)
+        os.remove(old_heap)
+        self._file = open(self._path, 'r+b')
+        self._load()
@@ -0,0 +1,268 @@
+from typing import Any, Callable, Iterable, Optional
+
+
+class PriorityDoubleLinkedList:
+    """
+    Min priority queue kept as a pairing heap of linked nodes. Every node links to its first child
+    and to its siblings in both directions, so push, merge and decrease_key relink a few nodes in
+    O(1) and pop_min pairs the children of the root in O(log n) amortized time. push returns the
+    node holding the element, which is the handle later passed to decrease_key and remove_node.
+    Nodes point to an owner record of their heap, so handles of another heap are rejected in
+    near constant time even after merges. Elements with equal priorities come out in no particular order
+    """
+    class _Owner:
+        """
+        Owner record shared by the nodes of a heap. Merging a heap points its record to the record
+        of the heap it joins, so the moved nodes change owner without being visited
+        """
+        __slots__ = '_heap', '_parent'
+
+        def __init__(self, heap) -> None:
+            self._heap = heap
+            self._parent = None
+
+        def heap(self):
+            """
+            Returns the heap the record leads to, pointing the records on the way to it directly
+            """
+            root = self
+            while root._parent is not None:
+                root = root._parent
+            record = self
+            while record._parent is not None and record._parent is not root:
+                record._parent, record = root, record._parent
+            return root._heap
+
+    class _Node:
+        __slots__ = '_element', '_priority', '_child', '_next', '_prev', '_owner'
+
+        def __init__(self, element: Any, priority: Any, owner=None) -> None:
+            """
+            :param element: Any, element inside container
+            :param priority: Any, value the node is ordered by, lowest first
+            :param owner: None or Owner object of the heap holding the node
+            """
+            self._element = element
+            self._priority = priority
+            self._owner = owner
+            # First child, next sibling and previous sibling, or parent for a first child
+            self._child = None
+            self._next = None
+            self._prev = None
+
+        def __repr__(self):
+            return f'{self._element} ({self._priority})'
+
+        def get(self) -> Any:
+            return self._element
+
+        @property
+        def priority(self) -> Any:
+            return self._priority
+
+    def __init__(self, array: Optional[Iterable] = None, key: Optional[Callable] = None):
+        """
+        :param array: None or iterable, elements pushed to the heap
+        :param key: None or Callable applied to elements to get their priority, None to use the elements
+        """
+        self._key = key
+        self._owner = self._Owner(self)
+        self._root = None
+        self._size = 0
+
+        if array is not None:
+            for e in array:
+                self.push(e)
+
+    @property
+    def key(self) -> Optional[Callable]:
+        return self._key
+
+    def __len__(self) -> int:
+        return self._size
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    # Serialization
+    def _nodes(self):
+        """
+        Yields the nodes of the heap walking the child and sibling links with a stack, in no
+        particular order
+        """
+        stack = [] if self._root is None else [self._root]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node._next is not None:
+                stack.append(node._next)
+            if node._child is not None:
+                stack.append(node._child)
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the heap as a flat sequence of (element, priority) pairs, nodes are never pickled
+        """
+        return {'key': self._key, 'pairs': [(x._element, x._priority) for x in self._nodes()]}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(key=state['key'])
+        for e, priority in state['pairs']:
+            self.push(e, priority)
+
+    def __reduce__(self):
+        return self.__class__, (), self.__getstate__()
+
+    # Heap maintenance
+    @staticmethod
+    def _meld(a: _Node, b: _Node) -> _Node:
+        """
+        Links two roots, the one with the higher priority becomes the first child of the other
+        """
+        if b._priority < a._priority:
+            a, b = b, a
+        child = a._child
+        b._next = child
+        if child is not None:
+            child._prev = b
+        b._prev = a
+        a._child = b
+        return a
+
+    def _pair(self, first: Optional[_Node]) -> Optional[_Node]:
+        """
+        Melds a list of siblings into one root with the two pass pairing: siblings are melded in
+        pairs from left to right, then the pairs are melded from right to left
+        :param first: None or first Node object of the sibling list
+        """
+        pairs = []
+        while first is not None:
+            a = first
+            b = a._next
+            a._prev = a._next = None
+            # Handle case where a is the last sibling, it has no pair
+            if b is None:
+                pairs.append(a)
+                break
+            first = b._next
+            b._prev = b._next = None
+            pairs.append(self._meld(a, b))
+
+        if not pairs:
+            return None
+        root = pairs.pop()
+        while pairs:
+            root = self._meld(pairs.pop(), root)
+        return root
+
+    def _cut(self, node: _Node) -> None:
+        """
+        Unlinks a node other than the root from its parent and siblings, keeping its children
+        """
+        prv, nxt = node._prev, node._next
+        # Handle case where node is a first child, its parent points to the next sibling instead
+        if prv._child is node:
+            prv._child = nxt
+        else:
+            prv._next = nxt
+        if nxt is not None:
+            nxt._prev = prv
+        node._prev = node._next = None
+
+    def _check(self, node: _Node) -> None:
+        if not isinstance(node, self._Node):
+            raise TypeError('Invalid node')
+        # Removed nodes have no owner, nodes of other heaps lead to another heap
+        if node._owner is None or node._owner.heap() is not self:
+            raise ValueError('Node is not on the heap')
+
+    # Heap interface
+    def push(self, e: Any, priority: Any = None) -> _Node:
+        """
+        Adds element "e" to the heap in O(1)
+        :param e: Any, element inside node's container
+        :param priority: None or value the element is ordered by, None to get it from the key
+        :returns: Node object holding e, to be passed to decrease_key or remove_node
+        """
+        if priority is None:
+            priority = e if self._key is None else self._key(e)
+        node = self._Node(e, priority, self._owner)
+        self._root = node if self._root is None else self._meld(self._root, node)
+        self._size += 1
+        return node
+
+    def peek(self) -> Any:
+        """
+        Returns the element with the lowest priority without removing it
+        """
+        if self._root is None:
+            raise ValueError('Heap is empty')
+        return self._root._element
+
+    def pop_min(self) -> Any:
+        """
+        Returns and deletes the element with the lowest priority in O(log n) amortized time
+        """
+        if self._root is None:
+            raise ValueError('Heap is empty')
+        root = self._root
+        self._root = self._pair(root._child)
+        root._child = root._owner = None
+        self._size -= 1
+        return root._element
+
+    def decrease_key(self, node: _Node, priority: Any) -> None:
+        """
+        Lowers the priority of a node in O(1), its subtree is cut and melded with the root
+        :param node: Node object returned by push
+        :param priority: new priority, not higher than the current one
+        """
+        self._check(node)
+        if node._priority < priority:
+            raise ValueError('New priority is higher than the current one')
+        node._priority = priority
+        if node is not self._root:
+            self._cut(node)
+            self._root = self._meld(self._root, node)
+
+    def remove_node(self, node: _Node) -> Any:
+        """
+        Deletes a node from the heap in O(log n) amortized time, such as a cancelled task
+        :param node: Node object returned by push
+        :returns: element of the removed node
+        """
+        self._check(node)
+        if node is self._root:
+            return self.pop_min()
+        self._cut(node)
+        subtree = self._pair(node._child)
+        node._child = node._owner = None
+        if subtree is not None:
+            self._root = self._meld(self._root, subtree)
+        self._size -= 1
+        return node._element
+
+    def merge(self, other: 'PriorityDoubleLinkedList') -> None:
+        """
+        Moves every node of other into this heap in O(1), other is left empty. Node handles of
+        other stay valid on this heap
+        :param other: PriorityDoubleLinkedList object
+        """
+        if not isinstance(other, PriorityDoubleLinkedList):
+            raise TypeError('Only priority lists can be merged')
+        if other is self or other._root is None:
+            return
+        self._root = other._root if self._root is None else self._meld(self._root, other._root)
+        self._size += other._size
+        # The nodes of other now belong to this heap, other starts over with a new owner record
+        other._owner._parent = self._owner
+        other._owner = self._Owner(other)
+        other._root = None
+        other._size = 0
+
+    def drain(self):
+        """
+        Yields the elements in priority order removing each one as it goes
+        """
+        while self._size:
+            yield self.pop_min()
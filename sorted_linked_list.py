@@ -0,0 +1,215 @@
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from indexed_linked_list import IndexedDoubleLinkedList
+from linked_list import DoubleLinkedList
+
+
+class SortedDoubleLinkedList(IndexedDoubleLinkedList):
+    """
+    Double linked list that keeps its elements in ascending order. The skip levels inherited from
+    IndexedDoubleLinkedList are searched by value, so add, bisect and membership run in O(log n)
+    expected time. Elements with equal keys keep their insertion order. With order_stats on, the
+    median and the order statistics close to it are read in O(1)
+    """
+    def __init__(self, array: Optional[Iterable] = None, key: Optional[Callable] = None, index: bool = False,
+                 order_stats: bool = False):
+        """
+        :param array: None or iterable, elements added to the list
+        :param key: None or Callable applied to elements to get the value they are sorted by
+        :param index: if true, keeps a value -> nodes hash index, see DoubleLinkedList
+        :param order_stats: if true, keeps a pointer to the median node, see IndexedDoubleLinkedList
+        """
+        self._key = key
+        super().__init__(index=index, order_stats=order_stats)
+        if array is not None:
+            self.update(array)
+
+    @property
+    def key(self) -> Optional[Callable]:
+        return self._key
+
+    def _options(self) -> dict:
+        return {'key': self._key, 'index': self._index is not None, 'order_stats': self._order_stats}
+
+    def _seek(self, k: Any, right: bool) -> Tuple[DoubleLinkedList._Node, int]:
+        """
+        Finds the last node whose key is lower than k, or lower or equal when right is true
+        :param k: Any, key to search
+        :param right: if true, nodes with key equal to k are skipped
+        :returns: tuple with the node, or the header if there is none, and its position
+        """
+        key = self._key
+        header = self._header
+        cursor, position = header, -1
+        # Skip level lists are indexed from 0 for level 1
+        for level in range(self._level - 1, -1, -1):
+            while True:
+                nxt = cursor._nexts[level]
+                if nxt is None:
+                    break
+                nk = key(nxt._element) if key is not None else nxt._element
+                if (k < nk) if right else not (nk < k):
+                    break
+                position += cursor._widths[level]
+                cursor = nxt
+
+        nxt = self._head if cursor is header else cursor._next
+        while nxt is not None:
+            nk = key(nxt._element) if key is not None else nxt._element
+            if (k < nk) if right else not (nk < k):
+                break
+            cursor = nxt
+            position += 1
+            nxt = nxt._next
+        return cursor, position
+
+    def _keyof(self, value: Any) -> Any:
+        return self._key(value) if self._key is not None else value
+
+    # Sorted interface
+    def add(self, e: Any) -> None:
+        """
+        Inserts element after the ones with an equal key in O(log n) expected time
+        :param e: Any, element inside node's container
+        """
+        node, _ = self._seek(self._keyof(e), right=True)
+        # Handle case where element goes before every node
+        if node is self._header:
+            super().push(e)
+        # Handle case where element goes after every node
+        elif node._next is None:
+            super().append(e)
+        else:
+            super().insert_after(e, node)
+
+    def update(self, iterable: Iterable) -> None:
+        """
+        Adds every element of iterable. Large batches are appended and merged with one natural
+        merge sort pass instead of being added one at a time
+        :param iterable: Iterable, elements to be added
+        """
+        values = list(iterable)
+        if len(values) * 8 > self._size + len(values):
+            values.sort(key=self._key)
+            # Append without skip links, sorting rebuilds them once the list is in order
+            DoubleLinkedList.extend(self, values)
+            super().sort_values(key=self._key)
+        else:
+            for e in values:
+                self.add(e)
+
+    extend = update
+
+    def bisect_left(self, value: Any) -> int:
+        """
+        Returns the position where value would be added before the elements with an equal key
+        """
+        return self._seek(self._keyof(value), right=False)[1] + 1
+
+    def bisect_right(self, value: Any) -> int:
+        """
+        Returns the position where value would be added after the elements with an equal key
+        """
+        return self._seek(self._keyof(value), right=True)[1] + 1
+
+    def irange(self, lo: Any = None, hi: Any = None, inclusive: Tuple[bool, bool] = (True, True),
+               reverse: bool = False) -> Iterator[Any]:
+        """
+        Iterates over the elements between lo and hi, compared through the key function
+        :param lo: None or lower bound, None for no bound
+        :param hi: None or upper bound, None for no bound
+        :param inclusive: pair of booleans, whether each bound is included
+        :param reverse: if true, yields elements from the highest to the lowest
+        """
+        lo_key = None if lo is None else self._keyof(lo)
+        hi_key = None if hi is None else self._keyof(hi)
+        key = self._key
+
+        if reverse:
+            # Start at the last node inside the upper bound and walk back
+            if hi is None:
+                cursor = self._tail if self._tail is not None else self._head
+            else:
+                cursor, _ = self._seek(hi_key, right=inclusive[1])
+                if cursor is self._header:
+                    return
+            while cursor is not None:
+                k = key(cursor._element) if key is not None else cursor._element
+                if lo is not None and ((k < lo_key) if inclusive[0] else not (lo_key < k)):
+                    return
+                yield cursor._element
+                cursor = cursor._prev
+        else:
+            # Start at the first node inside the lower bound and walk forward
+            if lo is None:
+                cursor = self._head
+            else:
+                cursor, _ = self._seek(lo_key, right=not inclusive[0])
+                cursor = self._head if cursor is self._header else cursor._next
+            while cursor is not None:
+                k = key(cursor._element) if key is not None else cursor._element
+                if hi is not None and ((hi_key < k) if inclusive[1] else not (k < hi_key)):
+                    return
+                yield cursor._element
+                cursor = cursor._next
+
+    # Lookups
+    def find(self, value: Any) -> DoubleLinkedList._Node:
+        """
+        :param value: Any, value to be found inside a DLL node
+        :return: first Node object where value is found, searched in O(log n) expected time
+        """
+        if len(self) == 0:
+            raise TypeError('List is empty')
+
+        k = self._keyof(value)
+        cursor, _ = self._seek(k, right=False)
+        cursor = self._head if cursor is self._header else cursor._next
+        # Scan the nodes sharing the key of value
+        while cursor is not None and not (k < self._keyof(cursor._element)):
+            if cursor._element == value:
+                return cursor
+            cursor = cursor._next
+
+        raise ValueError('Value not found')
+
+    # Order statistics
+    def kth(self, k: int) -> Any:
+        """
+        Returns the k-th smallest element, counted from 0. Negative k counts from the largest
+        :param k: int, rank of the element
+        """
+        return self._node_at(self._position(k))._element
+
+    def percentile(self, q: float) -> Any:
+        """
+        Returns the q-th percentile, interpolated between the two closest ranks like
+        statistics.quantiles(method='inclusive'). Interpolation needs numeric elements
+        :param q: float, percentile between 0 and 100
+        """
+        if self._size == 0:
+            raise ValueError('Linked list is empty')
+        if not 0 <= q <= 100:
+            raise ValueError('Percentile must be between 0 and 100')
+        rank = q * (self._size - 1) / 100
+        position = int(rank)
+        node = self._node_at(position)
+        fraction = rank - position
+        # Handle case where the rank falls on an element
+        if fraction == 0:
+            return node._element
+        return node._element + (node._next._element - node._element) * fraction
+
+    def median(self) -> Any:
+        """
+        Returns the median element, the mean of the two middle ones on even sizes like statistics.median
+        """
+        return self.percentile(50)
+
+    # Operations that would break the order
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError('Sorted lists keep their own order, use add')
+
+    push = append = extendleft = insert = insert_after = insert_before = insert_sorted = _unsupported
+    move_to_front = move_to_end = reverse = reverse_rec = sort_values = __setitem__ = _unsupported
+    merge_sorted = splice = concat = _unsupported
@@ -0,0 +1,76 @@
+from array_linked_list import ArrayDoubleLinkedList
+import pytest
+
+
+@pytest.fixture
+def emptylist():
+    return ArrayDoubleLinkedList()
+
+
+@pytest.fixture
+def linkedlist():
+    """
+    Returns an array backed linked list with 50 elements in ascending order
+    """
+    return ArrayDoubleLinkedList(range(50))
+
+
+# -------------- End Tests --------------
+def test_push_append(emptylist):
+    emptylist.push(1)
+    emptylist.append(2)
+    emptylist.push(0)
+    assert [emptylist.get(x) for x in emptylist] == [0, 1, 2]
+
+
+def test_pop_pull(linkedlist):
+    assert linkedlist.pop() == 49
+    assert linkedlist.pull() == 0
+    assert len(linkedlist) == 48
+    assert linkedlist.first() == 1 and linkedlist.last() == 48
+
+
+def test_pull_empty(emptylist):
+    with pytest.raises(ValueError):
+        emptylist.pull()
+
+
+# -------------- Free List Tests --------------
+def test_free_slots_are_reused(linkedlist):
+    for _ in range(10):
+        linkedlist.pull()
+    for x in range(10):
+        linkedlist.append(x)
+    assert linkedlist.capacity() == 50
+
+
+def test_removed_handle_is_invalid(linkedlist):
+    handle = linkedlist.find(10)
+    linkedlist.remove(handle)
+    with pytest.raises(TypeError):
+        linkedlist.get(handle)
+
+
+# -------------- Insert Tests --------------
+def test_insert_after(linkedlist):
+    linkedlist.insert_after(10, linkedlist.head)
+    assert linkedlist.get(linkedlist.next(linkedlist.head)) == 10
+
+
+def test_insert_before(linkedlist):
+    handle = linkedlist.insert_before(-1, linkedlist.tail)
+    assert linkedlist.next(handle) == linkedlist.tail
+
+
+# -------------- Sort Tests --------------
+def test_sort_keeps_handles():
+    lst = ArrayDoubleLinkedList([3, 1, 2], typecode='q')
+    handle = lst.find(3)
+    lst.sort_values()
+    assert [lst.get(x) for x in lst] == [1, 2, 3]
+    assert lst.tail == handle
+
+
+def test_sort_descending(linkedlist):
+    linkedlist.sort_values(ascending=False)
+    assert linkedlist.first() == 49 and linkedlist.last() == 0
@@ -0,0 +1,76 @@
+import asyncio
+
+from async_linked_list import AsyncDequeQueue
+from concurrent_linked_list import Empty, Full
+import pytest
+
+
+# -------------- Queue Tests --------------
+def test_end_operations():
+    async def main():
+        queue = AsyncDequeQueue([1, 2])
+        await queue.push(0)
+        await queue.append(3)
+        return [await queue.pull(), await queue.pop(), len(queue)]
+
+    assert asyncio.run(main()) == [0, 3, 2]
+
+
+def test_nowait_errors():
+    queue = AsyncDequeQueue(maxsize=1)
+    queue.append_nowait(1)
+    with pytest.raises(Full):
+        queue.append_nowait(2)
+    queue.pull_nowait()
+    with pytest.raises(Empty):
+        queue.pop_nowait()
+
+
+def test_consumer_waits():
+    async def main():
+        queue = AsyncDequeQueue()
+        consumer = asyncio.ensure_future(queue.pull())
+        await asyncio.sleep(0)
+        await queue.append('x')
+        return await consumer
+
+    assert asyncio.run(main()) == 'x'
+
+
+def test_backpressure():
+    async def main():
+        queue = AsyncDequeQueue(maxsize=1)
+        await queue.append(1)
+        producer = asyncio.ensure_future(queue.append(2))
+        await asyncio.sleep(0)
+        assert not producer.done()
+        await queue.pull()
+        await producer
+        return await queue.pull()
+
+    assert asyncio.run(main()) == 2
+
+
+# -------------- Batch Tests --------------
+def test_get_many():
+    async def main():
+        queue = AsyncDequeQueue(range(5))
+        return await queue.get_many(3), await queue.get_many(3)
+
+    assert asyncio.run(main()) == ([0, 1, 2], [3, 4])
+
+
+def test_get_many_timeout():
+    async def main():
+        return await AsyncDequeQueue().get_many(3, timeout=0.01)
+
+    assert asyncio.run(main()) == []
+
+
+def test_async_for_drains_closed_queue():
+    async def main():
+        queue = AsyncDequeQueue(range(3))
+        queue.close()
+        return [x async for x in queue]
+
+    assert asyncio.run(main()) == [0, 1, 2]
@@ -0,0 +1,81 @@
+from cache import LFUCache, LRUCache, memoize
+import pytest
+
+
+# -------------- LRU Tests --------------
+def test_lru_get_put():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.info().hits == 1 and cache.info().misses == 1
+
+
+def test_lru_evicts_least_recent():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert 'a' in cache and 'c' in cache
+    assert cache.info().evictions == 1
+
+
+def test_lru_ttl():
+    now = [0]
+    cache = LRUCache(2, ttl=5, timer=lambda: now[0])
+    cache.put('a', 1)
+    now[0] = 5
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_lru_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+# -------------- LFU Tests --------------
+def test_lfu_evicts_least_frequent():
+    cache = LFUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert cache.get('a') == 1 and cache.get('c') == 3
+
+
+def test_lfu_evicts_least_recent_on_tie():
+    cache = LFUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+    assert 'a' not in cache
+
+
+def test_lfu_delete():
+    cache = LFUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('b')
+    cache.delete('a')
+    cache.put('c', 3)
+    cache.put('d', 4)
+    assert 'b' in cache and 'c' not in cache
+
+
+# -------------- Memoize Tests --------------
+def test_memoize():
+    calls = []
+
+    @memoize(maxsize=2)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert calls == [3]
+    assert square.cache_info().hits == 1
@@ -0,0 +1,114 @@
+import threading
+
+from concurrent_linked_list import ConcurrentDoubleLinkedList, Empty, Full
+from linked_list import DoubleLinkedList
+import pytest
+
+
+# -------------- End Tests --------------
+def test_end_operations():
+    lst = ConcurrentDoubleLinkedList(range(5))
+    lst.push(-1)
+    lst.append(5)
+    assert lst.pull() == -1
+    assert lst.pop() == 5
+    assert lst.snapshot() == [0, 1, 2, 3, 4]
+
+
+def test_pull_empty():
+    lst = ConcurrentDoubleLinkedList()
+    with pytest.raises(Empty):
+        lst.pull()
+
+
+def test_pull_timeout():
+    lst = ConcurrentDoubleLinkedList()
+    with pytest.raises(Empty):
+        lst.pop(timeout=0.01)
+
+
+def test_blocking_pull():
+    lst = ConcurrentDoubleLinkedList()
+    timer = threading.Timer(0.05, lst.append, args=(1,))
+    timer.start()
+    assert lst.pull(block=True, timeout=5) == 1
+    timer.join()
+
+
+def test_drain_concurrent():
+    lst = ConcurrentDoubleLinkedList(range(5))
+    assert list(lst.values()) == list(range(5))
+    assert list(lst.drain()) == list(range(5))
+    assert len(lst) == 0
+
+
+# -------------- Capacity Tests --------------
+def test_full():
+    lst = ConcurrentDoubleLinkedList(maxsize=2)
+    lst.append(1)
+    lst.push(0)
+    assert lst.full()
+    with pytest.raises(Full):
+        lst.append(2, block=False)
+    lst.pull()
+    lst.append(2, block=False)
+    assert lst.snapshot() == [1, 2]
+
+
+# -------------- Threading Tests --------------
+def test_producers_consumers():
+    lst = ConcurrentDoubleLinkedList(maxsize=16)
+    consumed = []
+
+    def produce(start):
+        for x in range(start, start + 1000):
+            lst.append(x)
+
+    def consume():
+        for _ in range(1000):
+            consumed.append(lst.pull(block=True, timeout=5))
+
+    threads = [threading.Thread(target=produce, args=(x * 1000,)) for x in range(4)]
+    threads += [threading.Thread(target=consume) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(consumed) == list(range(4000))
+    assert lst.is_empty()
+
+
+def test_remove():
+    lst = ConcurrentDoubleLinkedList(range(5))
+    lst.remove(0)
+    lst.remove(2)
+    assert lst.snapshot() == [1, 3, 4]
+    assert len(lst) == 3
+
+
+def test_merge_sorted_rejected():
+    lst = ConcurrentDoubleLinkedList([2, 4])
+    other = DoubleLinkedList([1, 3])
+    with pytest.raises(TypeError):
+        DoubleLinkedList.merge_sorted(other, lst)
+    assert lst.snapshot() == [2, 4] and [x.get() for x in other] == [1, 3]
+
+
+def test_reads_while_rotating():
+    lst = ConcurrentDoubleLinkedList(range(10))
+    done = threading.Event()
+
+    def rotate():
+        for _ in range(2000):
+            lst.append(lst.pull())
+        done.set()
+
+    thread = threading.Thread(target=rotate)
+    thread.start()
+    while not done.is_set():
+        assert 36 <= lst.sum() <= 45
+        assert lst[-1] in range(10) and lst.get_median().get() in range(10)
+        assert len(list(reversed(lst))) in (9, 10)
+    thread.join()
+    assert sorted(lst.values()) == list(range(10))
+    assert lst.find(3).get() == 3 and 3 in lst
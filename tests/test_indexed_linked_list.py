@@ -0,0 +1,118 @@
+from indexed_linked_list import IndexedDoubleLinkedList
+import pytest
+
+
+@pytest.fixture
+def linkedlist():
+    """
+    Returns an indexed linked list with 1000 elements in ascending order
+    """
+    return IndexedDoubleLinkedList(range(1000))
+
+
+# -------------- Positional Access Tests --------------
+def test_getitem(linkedlist):
+    assert [linkedlist[i] for i in range(0, 1000, 37)] == list(range(0, 1000, 37))
+    assert linkedlist[-1] == 999
+
+
+def test_getitem_out_of_range(linkedlist):
+    with pytest.raises(IndexError):
+        linkedlist[1000]
+
+
+def test_slice(linkedlist):
+    page = linkedlist[500:510]
+    assert [x.get() for x in page] == list(range(500, 510))
+
+
+def test_insert(linkedlist):
+    linkedlist.insert(500, -1)
+    assert linkedlist[500] == -1
+    assert linkedlist[501] == 500
+    assert len(linkedlist) == 1001
+
+
+def test_delitem(linkedlist):
+    del linkedlist[500]
+    assert linkedlist[500] == 501
+    assert len(linkedlist) == 999
+
+
+def test_position_of(linkedlist):
+    node = linkedlist.find(321)
+    assert linkedlist.position_of(node) == 321
+
+
+# -------------- Consistency Tests --------------
+def test_end_operations(linkedlist):
+    linkedlist.push(-1)
+    linkedlist.append(1000)
+    linkedlist.pull()
+    linkedlist.pop()
+    linkedlist.pull()
+    assert [linkedlist[i] for i in (0, 499, 998)] == [1, 500, 999]
+
+
+def test_sort_rebuilds_index(linkedlist):
+    linkedlist.sort_values(reverse=True)
+    assert linkedlist[0] == 999
+    assert linkedlist[999] == 0
+
+
+def test_reverse_rebuilds_index(linkedlist):
+    linkedlist.reverse()
+    assert [linkedlist[i] for i in range(0, 1000, 37)] == [999 - i for i in range(0, 1000, 37)]
+
+
+def test_split_and_concat_rebuild_index(linkedlist):
+    rest = linkedlist.split_at(linkedlist.find(600))
+    assert rest[0] == 600 and linkedlist[599] == 599
+    rest.concat(linkedlist)
+    assert rest[399] == 999 and rest[400] == 0
+
+
+# -------------- Order Statistics Tests --------------
+def test_median_pointer_follows_changes():
+    linkedlist = IndexedDoubleLinkedList(range(10), order_stats=True)
+    assert linkedlist.get_median().get() == 4
+    linkedlist.push(-1)
+    assert linkedlist.get_median().get() == 4
+    linkedlist.append(10)
+    assert linkedlist.get_median().get() == 4
+    linkedlist.insert_after(3.5, linkedlist.find(3))
+    assert linkedlist.get_median().get() == 4
+    linkedlist.pull()
+    linkedlist.pop()
+    assert linkedlist.get_median().get() == 4
+    del linkedlist[5]
+    assert linkedlist.get_median().get() == 3.5
+    linkedlist.move_to_end(linkedlist.head)
+    assert linkedlist.get_median() is linkedlist._node_at((len(linkedlist) - 1) // 2)
+
+
+def test_median_pointer_after_rebuild():
+    linkedlist = IndexedDoubleLinkedList(range(9), order_stats=True)
+    linkedlist.reverse()
+    assert linkedlist.get_median().get() == 4
+    while len(linkedlist):
+        linkedlist.pop()
+    with pytest.raises(ValueError):
+        linkedlist.get_median()
+    linkedlist.append(1)
+    assert linkedlist.get_median().get() == 1
+
+
+@pytest.mark.parametrize('change, expected', [
+    (lambda lst: lst.reverse(), list(range(9, -1, -1))),
+    (lambda lst: lst.sort_values(reverse=True), list(range(9, -1, -1))),
+    (lambda lst: lst.filter_inplace([x % 3 != 0 for x in range(10)]), [1, 2, 4, 5, 7, 8]),
+    (lambda lst: lst.splice(IndexedDoubleLinkedList([20, 21, 22])), [20, 21, 22] + list(range(10))),
+    (lambda lst: lst.concat(IndexedDoubleLinkedList([20, 21, 22])), list(range(10)) + [20, 21, 22]),
+    (lambda lst: lst.extendleft(range(-1, -11, -1)), list(range(-10, 10))),
+])
+def test_median_pointer_after_reorder(change, expected):
+    linkedlist = IndexedDoubleLinkedList(range(10), order_stats=True)
+    change(linkedlist)
+    assert linkedlist.get_median().get() == expected[(len(expected) - 1) // 2]
+    assert [linkedlist[i] for i in range(len(expected))] == expected
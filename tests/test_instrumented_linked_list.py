@@ -0,0 +1,120 @@
+import random
+
+from instrumented_linked_list import InstrumentedDoubleLinkedList
+import pytest
+
+
+@pytest.fixture
+def emptylist():
+    return InstrumentedDoubleLinkedList()
+
+
+@pytest.fixture
+def linkedlist():
+    """
+    Returns an instrumented linked list with 10 elements in ascending order
+    """
+    return InstrumentedDoubleLinkedList(range(10))
+
+
+# -------------- Counter Tests --------------
+def test_end_calls(emptylist):
+    emptylist.push(1)
+    emptylist.append(2)
+    emptylist.append(3)
+    emptylist.append(4)
+    emptylist.pull()
+    emptylist.pop()
+    emptylist.insert_after(5, emptylist.head)
+    emptylist.insert_before(6, emptylist.tail)
+    calls = emptylist.snapshot()['calls']
+    assert (calls['push'], calls['append'], calls['pull'], calls['pop'], calls['insert']) == (1, 3, 1, 1, 2)
+    assert [node.get() for node in emptylist] == [2, 5, 6, 3]
+
+
+def test_end_inserts(linkedlist):
+    # Inserts at the ends are delegated to push and append and counted as such
+    linkedlist.insert_after(10, linkedlist.tail)
+    linkedlist.insert_before(-1, linkedlist.head)
+    calls = linkedlist.snapshot()['calls']
+    assert (calls['push'], calls['append'], calls['insert']) == (1, 1, 0)
+
+
+def test_peak_size(linkedlist):
+    linkedlist.extend(range(5))
+    for _ in range(10):
+        linkedlist.pop()
+    snapshot = linkedlist.snapshot()
+    assert snapshot['size'] == 5
+    assert snapshot['peak_size'] == 15
+
+
+def test_find_traversed(linkedlist):
+    assert linkedlist.find(3).get() == 3
+    with pytest.raises(ValueError):
+        linkedlist.find(42)
+    snapshot = linkedlist.snapshot()
+    assert snapshot['calls']['find'] == 2
+    assert snapshot['traversed']['find'] == 4 + 10
+
+
+def test_get_median_traversed(linkedlist):
+    assert linkedlist.get_median().get() == 4
+    assert linkedlist.snapshot()['traversed']['get_median'] == 13
+
+
+def test_insert_sorted_traversed(linkedlist):
+    linkedlist.insert_sorted(42)
+    linkedlist.insert_sorted(-1)
+    assert linkedlist.snapshot()['traversed']['insert_sorted'] == 0
+    linkedlist.insert_sorted(7.5)
+    assert linkedlist.snapshot()['traversed']['insert_sorted'] > 0
+    assert [node.get() for node in linkedlist] == [-1, 0, 1, 2, 3, 4, 5, 6, 7, 7.5, 8, 9, 42]
+
+
+def test_insert_sorted_walk_counts(linkedlist):
+    # 13 nodes to find the median 4 and 3 forward to 8, then 16 to find the median 5 and 3 back to 1
+    linkedlist.insert_sorted(7.5)
+    linkedlist.insert_sorted(1.5)
+    snapshot = linkedlist.snapshot()
+    assert snapshot['traversed']['insert_sorted'] == 16 + 19
+    assert snapshot['calls']['get_median'] == 0 and snapshot['calls']['insert'] == 0
+
+
+def test_sort_comparisons():
+    values = [random.random() for _ in range(500)]
+    lst = InstrumentedDoubleLinkedList(values)
+    lst.sort_values()
+    snapshot = lst.snapshot()
+    assert [node.get() for node in lst] == sorted(values)
+    assert snapshot['calls']['sort'] == 1
+    assert 0 < snapshot['relinks'] <= snapshot['comparisons']['merge']
+
+    lst = InstrumentedDoubleLinkedList(values[:50])
+    lst.sort_values(method='insertion', ascending=False)
+    assert [node.get() for node in lst] == sorted(values[:50], reverse=True)
+    assert lst.snapshot()['comparisons']['insertion'] > 0
+
+
+def test_reset_stats(linkedlist):
+    linkedlist.find(5)
+    linkedlist.reset_stats()
+    snapshot = linkedlist.snapshot()
+    assert snapshot['calls']['find'] == 0
+    assert snapshot['traversed']['find'] == 0
+    assert snapshot['peak_size'] == 10
+
+
+# -------------- Hook Tests --------------
+def test_hooks(linkedlist):
+    events = []
+    linkedlist.on('find', lambda event, info: events.append((event, info)))
+    linkedlist.on('*', lambda event, info: events.append(event))
+    linkedlist.append(10)
+    linkedlist.find(2)
+    assert events == ['append', ('find', {'traversed': 3, 'size': 11}), 'find']
+
+
+def test_unknown_hook(linkedlist):
+    with pytest.raises(ValueError):
+        linkedlist.on('rotate', print)
@@ -1,4 +1,5 @@
-from data_structures import DoubleLinkedList
+from linked_list import DoubleLinkedList
+import pickle
 import pytest
 
 
@@ -98,10 +99,493 @@ def test_find_value_empty(emptylist):
 
 def test_find_value_not(linkedlist):
     with pytest.raises(ValueError):
-        emptylist.find('This value is not on the list')
+        linkedlist.find('This value is not on the list')
 
 
 # -------------- Insert Tests --------------
 def test_insert_after(linkedlist):
-    linkedlist.insert_after(linkedlist.head, 10)
+    linkedlist.insert_after(10, linkedlist.head)
     assert linkedlist.head.next.get() == 10
+
+
+# -------------- Bulk Load Tests --------------
+def test_init_iterable():
+    """
+    Tests if the constructor accepts any iterable, not only lists
+    """
+    lst = DoubleLinkedList(x for x in range(3))
+    assert [x.get() for x in lst] == [0, 1, 2]
+
+
+def test_from_iterable():
+    lst = DoubleLinkedList.from_iterable(range(10))
+    assert len(lst) == 10
+    assert lst.tail.get() == 9
+
+
+def test_extend(linkedlist):
+    linkedlist.extend(iter([50, 51]))
+    assert len(linkedlist) == 52
+    assert linkedlist.tail.get() == 51
+    assert linkedlist.tail.prev.get() == 50
+
+
+def test_extend_single(emptylist):
+    """
+    Tests if extending an empty list with one element only creates the head node
+    """
+    emptylist.extend([1])
+    assert emptylist.head.get() == 1
+    assert emptylist.tail is None
+
+
+def test_extendleft(linkedlist):
+    linkedlist.extendleft([-1, -2])
+    assert linkedlist.head.get() == -2
+    assert linkedlist.head.next.next.get() == 0
+    assert len(linkedlist) == 52
+
+
+# -------------- Pop/Pull Tests --------------
+def test_pop(linkedlist):
+    assert linkedlist.pop() == 49
+    assert len(linkedlist) == 49
+    assert linkedlist.tail.get() == 48
+    assert linkedlist.tail.next is None
+
+
+def test_pull(linkedlist):
+    assert linkedlist.pull() == 0
+    assert len(linkedlist) == 49
+    assert linkedlist.head.get() == 1
+    assert linkedlist.head.prev is None
+
+
+def test_pop_until_empty(linkedlist):
+    popped = [linkedlist.pop() for _ in range(50)]
+    assert popped == list(range(49, -1, -1))
+    assert linkedlist.is_empty()
+
+
+# -------------- Index Tests --------------
+@pytest.fixture
+def indexedlist():
+    """
+    Returns an indexed linked list with 50 elements in ascending order
+    """
+    return DoubleLinkedList(range(50), index=True)
+
+
+def test_index_find(indexedlist):
+    assert indexedlist.find(49) is indexedlist.tail
+
+
+def test_index_contains(indexedlist):
+    assert 10 in indexedlist
+    assert 50 not in indexedlist
+
+
+def test_index_find_all(indexedlist):
+    indexedlist.append(10)
+    assert [x.get() for x in indexedlist.find_all(10)] == [10, 10]
+
+
+def test_index_pop(indexedlist):
+    indexedlist.pop()
+    assert 49 not in indexedlist
+
+
+def test_index_remove(indexedlist):
+    indexedlist.remove(25)
+    assert 25 not in indexedlist
+    assert len(indexedlist) == 49
+    assert indexedlist.find(24).next.get() == 26
+
+
+def test_index_remove_missing(indexedlist):
+    with pytest.raises(ValueError):
+        indexedlist.remove(50)
+
+
+def test_index_unhashable():
+    """
+    Tests if unhashable elements are left out of the index and still found
+    """
+    lst = DoubleLinkedList([[1], 2], index=True)
+    assert [1] in lst
+    assert lst.find([1]) is lst.head
+
+
+def test_index_element_set_on_node():
+    lst = DoubleLinkedList([1, 2, 3, [4]], index=True)
+    lst.head.element = 7
+    lst.tail.element = 5
+    assert lst.pull() == 7
+    assert lst.pop() == 5
+    assert 1 not in lst and lst._index == {2: {id(lst.head): lst.head}, 3: {id(lst.tail): lst.tail}}
+    assert lst._unindexed == 0
+
+
+# -------------- Move Tests --------------
+def test_move_to_front(linkedlist):
+    linkedlist.move_to_front(linkedlist.tail)
+    assert linkedlist.head.get() == 49
+    assert linkedlist.tail.get() == 48
+    assert len(linkedlist) == 50
+
+
+def test_move_to_end(linkedlist):
+    linkedlist.move_to_end(linkedlist.head)
+    assert linkedlist.tail.get() == 0
+    assert linkedlist.head.get() == 1
+
+
+def test_remove_node(linkedlist):
+    node = linkedlist.head.next
+    assert linkedlist.remove_node(node) == 1
+    assert linkedlist.head.next.get() == 2
+
+
+# -------------- Sort Tests --------------
+def test_sort_merge_large():
+    """
+    Tests if merge sort handles lists far above the recursion limit
+    """
+    values = [(x * 7919) % 20000 for x in range(20000)]
+    lst = DoubleLinkedList(values)
+    lst.sort_values()
+    assert [x.get() for x in lst] == sorted(values)
+    assert lst.tail.get() == 19999
+
+
+def test_sort_merge_descending():
+    lst = DoubleLinkedList([3, 1, 4, 1, 5, 9, 2, 6])
+    lst.sort_values(ascending=False)
+    assert [x.get() for x in lst] == [9, 6, 5, 4, 3, 2, 1, 1]
+    assert lst.tail.prev.get() == 1
+
+
+def test_sort_merge_key_stable():
+    values = [('b', 1), ('a', 2), ('b', 0), ('a', 1)]
+    lst = DoubleLinkedList(values)
+    lst.sort_values(key=lambda x: x[0], reverse=True)
+    assert [x.get() for x in lst] == sorted(values, key=lambda x: x[0], reverse=True)
+
+
+def test_sort_merge_keeps_nodes(linkedlist):
+    """
+    Tests if merge sort relinks the existing nodes instead of creating new ones
+    """
+    node = linkedlist.head
+    linkedlist.sort_values(reverse=True)
+    assert linkedlist.tail is node
+
+
+def test_sort_merge_shrinking_runs():
+    """
+    Tests if runs of decreasing length are merged in O(n log n) and key is called once per node
+    """
+    values = []
+    for length in range(300, 0, -1):
+        values.extend(range(length))
+    calls = []
+    lst = DoubleLinkedList(values)
+    lst.sort_values(key=lambda x: calls.append(x) or x)
+    assert [x.get() for x in lst] == sorted(values)
+    assert len(calls) == len(values)
+
+
+def test_sort_merge_key_error_keeps_list():
+    lst = DoubleLinkedList([3, 1, 'x', 2, 5])
+    with pytest.raises(TypeError):
+        lst.sort_values(key=lambda x: x)
+    assert [x.get() for x in lst] == [3, 1, 'x', 2, 5]
+    assert lst.tail.get() == 5
+
+
+# -------------- Positional Access Tests --------------
+def test_getitem(linkedlist):
+    assert linkedlist[0] == 0
+    assert linkedlist[40] == 40
+    assert linkedlist[-1] == 49
+
+
+def test_getitem_slice(linkedlist):
+    assert [x.get() for x in linkedlist[45::2]] == [45, 47, 49]
+
+
+def test_getitem_slice_keeps_options():
+    lst = DoubleLinkedList(range(10), index=True, pool=4)
+    part = lst[2:5]
+    assert part._options() == lst._options()
+    assert part.find(3) is part.head.next
+
+
+def test_setitem(linkedlist):
+    linkedlist[10] = -10
+    assert linkedlist.find(-10).prev.get() == 9
+
+
+def test_delitem(linkedlist):
+    del linkedlist[:10]
+    assert linkedlist.head.get() == 10
+    assert len(linkedlist) == 40
+
+
+def test_insert_position(linkedlist):
+    linkedlist.insert(-1, 100)
+    assert linkedlist.tail.prev.get() == 100
+
+
+# -------------- Insert Sorted Tests --------------
+def test_insert_sorted(linkedlist):
+    linkedlist.insert_sorted(10)
+    assert linkedlist.find(10).next.get() == 10
+    assert len(linkedlist) == 51
+
+
+def test_insert_sorted_descending(emptylist):
+    for x in [3, 1, 2, 5, 4]:
+        emptylist.insert_sorted(x, ascending=False)
+    assert [x.get() for x in emptylist] == [5, 4, 3, 2, 1]
+
+
+# -------------- Node Pool Tests --------------
+def test_removed_node_is_unlinked(linkedlist):
+    node = linkedlist.find(10)
+    linkedlist.remove_node(node)
+    assert node.next is None and node.prev is None
+    assert linkedlist.find(9).next.get() == 11
+
+
+def test_pool_reuses_nodes():
+    lst = DoubleLinkedList([1, 2, 3], pool=2)
+    old = lst.tail
+    assert lst.pop() == 3
+    assert lst.pool_size == 1
+    lst.append(4)
+    assert lst.tail is old
+    assert lst.pool_size == 0
+    assert [x.get() for x in lst] == [1, 2, 4]
+
+
+def test_pool_is_bounded():
+    lst = DoubleLinkedList(range(10), pool=3)
+    while not lst.is_empty():
+        lst.pull()
+    assert lst.pool_size == 3
+    lst.clear_pool()
+    assert lst.pool_size == 0
+
+
+def test_extend_uses_pool():
+    lst = DoubleLinkedList(range(4), pool=4)
+    nodes = [lst.head, lst.head.next, lst.head.next.next]
+    for _ in range(3):
+        lst.pull()
+    assert lst.pool_size == 3
+    lst.extend('abcde')
+    lst.extendleft('z')
+    assert lst.pool_size == 0
+    assert all(any(node is x for x in lst) for node in nodes)
+    assert [x.get() for x in lst] == ['z', 3, 'a', 'b', 'c', 'd', 'e']
+
+
+# -------------- Reverse Tests --------------
+def test_reverse_in_place(linkedlist):
+    head, tail = linkedlist.head, linkedlist.tail
+    assert linkedlist.reverse() is linkedlist
+    assert linkedlist.head is tail and linkedlist.tail is head
+    assert [x.get() for x in linkedlist] == list(range(49, -1, -1))
+    assert [x.get() for x in reversed(linkedlist)] == list(range(50))
+
+
+def test_reverse_small(emptylist):
+    emptylist.reverse()
+    emptylist.append(1)
+    emptylist.reverse()
+    assert emptylist.head.get() == 1 and emptylist.tail is None
+    emptylist.append(2)
+    emptylist.reverse()
+    assert [x.get() for x in emptylist] == [2, 1]
+    assert emptylist.tail.prev is emptylist.head
+
+
+def test_reversed_view(linkedlist):
+    view = linkedlist.reversed_view()
+    assert len(view) == 50
+    assert view[0] == 49 and view[-1] == 0
+    assert view.first() == 49
+    view.push(50)
+    view.append(-1)
+    assert linkedlist.last() == 50 and linkedlist.first() == -1
+    assert view.pull() == 50
+    assert [x.get() for x in view][:3] == [49, 48, 47]
+    assert view.reversed_view() is linkedlist
+
+
+# -------------- Serialization Tests --------------
+def test_pickle_round_trip(linkedlist):
+    restored = pickle.loads(pickle.dumps(linkedlist))
+    assert [x.get() for x in restored] == list(range(50))
+    assert restored.tail.prev.get() == 48
+
+
+def test_pickle_large_list():
+    lst = DoubleLinkedList(range(100000), index=True)
+    restored = pickle.loads(pickle.dumps(lst))
+    assert len(restored) == 100000
+    assert restored.find(99999) is restored.tail
+
+
+def test_bytes_round_trip(linkedlist):
+    data = linkedlist.to_bytes('q')
+    assert len(data) == 50 * 8
+    assert [x.get() for x in DoubleLinkedList.from_buffer(data, 'q')] == list(range(50))
+
+
+def test_file_round_trip(linkedlist, tmp_path):
+    path = str(tmp_path / 'list.bin')
+    linkedlist.to_file(path, 'd')
+    assert [x.get() for x in DoubleLinkedList.from_file(path, 'd')] == [float(x) for x in range(50)]
+
+
+# -------------- Bulk Operation Tests --------------
+def test_aggregates(linkedlist):
+    assert linkedlist.sum() == sum(range(50))
+    assert linkedlist.min() == 0
+    assert linkedlist.max(key=lambda x: -x) == 0
+
+
+def test_aggregates_empty(emptylist):
+    assert emptylist.sum() == 0
+    with pytest.raises(ValueError):
+        emptylist.min()
+
+
+def test_map(linkedlist):
+    assert [x.get() for x in linkedlist.map(str)][:2] == ['0', '1']
+    doubled = linkedlist.map(lambda batch: [x * 2 for x in batch], batch=True, chunk=7)
+    assert [x.get() for x in doubled] == list(range(0, 100, 2))
+
+
+def test_filter_inplace(linkedlist):
+    linkedlist.filter_inplace([x % 2 == 0 for x in range(50)])
+    assert [x.get() for x in linkedlist] == list(range(0, 50, 2))
+    assert linkedlist.tail.prev.get() == 46
+    with pytest.raises(ValueError):
+        linkedlist.filter_inplace([True])
+
+
+def test_numpy_round_trip(linkedlist):
+    np = pytest.importorskip('numpy')
+    values = linkedlist.to_numpy(dtype=np.int64, chunk=7)
+    assert values.tolist() == list(range(50))
+    linkedlist.filter_inplace(values > 10)
+    assert linkedlist.first() == 11
+    assert [x.get() for x in DoubleLinkedList.from_numpy(values, chunk=7)] == list(range(50))
+
+
+# -------------- Parallel Sort Tests --------------
+def test_sort_parallel(emptylist):
+    values = [(x * 7919) % 101 for x in range(300)]
+    emptylist.extend(values)
+    emptylist.sort_values(method='parallel', workers=3)
+    assert [x.get() for x in emptylist] == sorted(values)
+    assert emptylist.tail.prev.get() == sorted(values)[-2]
+
+
+def test_sort_parallel_stable_reverse(emptylist):
+    values = [(x % 5, x) for x in range(100)]
+    emptylist.extend(values)
+    emptylist.sort_values(method='parallel', workers=4, key=min, reverse=True)
+    assert [x.get() for x in emptylist] == sorted(values, key=min, reverse=True)
+
+
+# -------------- Merge Sorted Tests --------------
+def test_merge_sorted():
+    lists = [DoubleLinkedList(range(start, 30, 3)) for start in range(3)]
+    nodes = {id(x) for lst in lists for x in lst}
+    merged = DoubleLinkedList.merge_sorted(*lists)
+    assert [x.get() for x in merged] == list(range(30))
+    assert {id(x) for x in merged} == nodes
+    assert all(lst.is_empty() for lst in lists)
+    assert merged.tail.get() == 29 and merged.tail.prev.get() == 28
+
+
+def test_merge_sorted_stable_reverse():
+    first = DoubleLinkedList([(2, 'a'), (1, 'a')])
+    second = DoubleLinkedList([(2, 'b'), (0, 'b')])
+    merged = DoubleLinkedList.merge_sorted(first, second, key=lambda x: x[0], reverse=True)
+    assert [x.get() for x in merged] == [(2, 'a'), (2, 'b'), (1, 'a'), (0, 'b')]
+
+
+def test_merge_sorted_failure_keeps_lists():
+    first = DoubleLinkedList([1, 2, 3])
+    second = DoubleLinkedList([2, 'x'])
+    with pytest.raises(TypeError):
+        DoubleLinkedList.merge_sorted(first, second)
+    assert [x.get() for x in first] == [1, 2, 3] and first.tail.get() == 3
+    assert [x.get() for x in second] == [2, 'x'] and len(second) == 2
+
+
+def test_iter_merge_sorted(linkedlist):
+    other = DoubleLinkedList([-1, 25, 100])
+    merged = list(DoubleLinkedList.iter_merge_sorted(linkedlist, other))
+    assert merged == sorted(list(range(50)) + [-1, 25, 100])
+    assert len(linkedlist) == 50
+
+
+# -------------- Chain Transfer Tests --------------
+def test_splice_range(linkedlist):
+    other = DoubleLinkedList(range(100, 110))
+    linkedlist.splice(other, after=linkedlist.find(4), start=other.find(102), end=other.find(104), count=3)
+    assert [x.get() for x in linkedlist][3:9] == [3, 4, 102, 103, 104, 5]
+    assert [x.get() for x in other] == [100, 101, 105, 106, 107, 108, 109]
+    assert len(linkedlist) == 53 and len(other) == 7
+
+
+def test_splice_whole_list_to_front(linkedlist):
+    other = DoubleLinkedList([-2, -1])
+    linkedlist.splice(other)
+    assert linkedlist.first() == -2 and len(linkedlist) == 52
+    assert other.is_empty() and other.tail is None
+
+
+def test_concat(linkedlist):
+    other = DoubleLinkedList(range(50, 60))
+    linkedlist.concat(other)
+    assert [x.get() for x in linkedlist] == list(range(60))
+    assert linkedlist.tail.prev.get() == 58
+    assert other.is_empty()
+
+
+def test_split_at(linkedlist):
+    rest = linkedlist.split_at(linkedlist.find(49))
+    assert [x.get() for x in rest] == [49] and rest.tail is None
+    assert linkedlist.last() == 48 and len(linkedlist) == 49
+
+
+# -------------- Streaming Tests --------------
+def test_values(linkedlist):
+    assert list(linkedlist.values()) == list(range(50))
+
+
+def test_stream_pipeline(linkedlist):
+    stream = linkedlist.stream().filter(lambda x: x % 2).map(lambda x: x * 10).skip(1).take(3)
+    assert list(stream) == [30, 50, 70]
+    assert len(linkedlist) == 50
+
+
+def test_stream_collect(linkedlist):
+    collected = linkedlist.stream().take(2).collect()
+    assert isinstance(collected, DoubleLinkedList)
+    assert [x.get() for x in collected] == [0, 1]
+
+
+def test_drain(linkedlist):
+    drained = linkedlist.stream(drain=True).take(10)
+    assert list(drained) == list(range(10))
+    assert len(linkedlist) == 40 and linkedlist.first() == 10
+    assert list(linkedlist.drain(from_end=True))[:2] == [49, 48]
+    assert linkedlist.is_empty()
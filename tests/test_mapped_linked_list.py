@@ -0,0 +1,69 @@
+from mapped_linked_list import MappedDoubleLinkedList, NIL
+import pytest
+
+
+@pytest.fixture
+def linkedlist(tmp_path):
+    """
+    Returns a mapped linked list with 50 elements in ascending order
+    """
+    lst = MappedDoubleLinkedList(str(tmp_path / 'list.dll'), range(50))
+    yield lst
+    lst.close()
+
+
+# -------------- List Tests --------------
+def test_end_operations(linkedlist):
+    linkedlist.push(-1)
+    linkedlist.append(50)
+    assert linkedlist.pull() == -1
+    assert linkedlist.pop() == 50
+    assert linkedlist.first() == 0 and linkedlist.last() == 49
+
+
+def test_insert_and_remove(linkedlist):
+    handle = linkedlist.find(10)
+    linkedlist.insert_after('after', handle)
+    linkedlist.insert_before('before', handle)
+    assert linkedlist.remove(linkedlist.find(11)) == 11
+    assert [linkedlist.get(x) for x in linkedlist][9:13] == [9, 'before', 10, 'after']
+
+
+def test_freed_records_are_reused(linkedlist):
+    count = linkedlist._count
+    linkedlist.pop()
+    linkedlist.append(99)
+    assert linkedlist._count == count
+
+
+# -------------- Persistence Tests --------------
+def test_reopen(tmp_path):
+    path = str(tmp_path / 'list.dll')
+    with MappedDoubleLinkedList(path, ['a', 'b']) as lst:
+        lst.push({'key': 1})
+    with MappedDoubleLinkedList(path) as lst:
+        assert [lst.get(x) for x in lst] == [{'key': 1}, 'a', 'b']
+
+
+def test_recover_after_crash(tmp_path):
+    path = str(tmp_path / 'list.dll')
+    lst = MappedDoubleLinkedList(path, range(10))
+    # Simulate a crash between publishing a next link and fixing the prev link
+    lst._set_link(lst.find(5), 2, NIL)
+    # Release the files without close, which would mark the list as cleanly closed
+    lst._map.close()
+    lst._file.close()
+    lst._heap.close()
+    reopened = MappedDoubleLinkedList(path)
+    assert reopened.get(reopened.prev(reopened.find(5))) == 4
+    assert len(reopened) == 10
+    reopened.close()
+
+
+def test_compact(linkedlist):
+    for _ in range(10):
+        linkedlist.pull()
+    linkedlist.compact()
+    assert linkedlist._count == 40
+    assert [linkedlist.get(x) for x in linkedlist] == list(range(10, 50))
+    assert linkedlist.head == 0 and linkedlist.tail == 39
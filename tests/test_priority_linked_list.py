@@ -0,0 +1,105 @@
+from priority_linked_list import PriorityDoubleLinkedList
+import pickle
+import pytest
+
+
+@pytest.fixture
+def heap():
+    """
+    Returns a heap with the numbers from 0 to 9 pushed in a scrambled order
+    """
+    return PriorityDoubleLinkedList([7, 2, 9, 0, 5, 3, 8, 1, 6, 4])
+
+
+# -------------- Heap Tests --------------
+def test_pop_min(heap):
+    assert heap.peek() == 0
+    assert list(heap.drain()) == list(range(10))
+    assert heap.is_empty()
+
+
+def test_pop_min_empty():
+    with pytest.raises(ValueError):
+        PriorityDoubleLinkedList().pop_min()
+
+
+def test_key_and_priority():
+    heap = PriorityDoubleLinkedList(['ccc', 'a', 'bb'], key=len)
+    heap.push('dddd', priority=0)
+    assert list(heap.drain()) == ['dddd', 'a', 'bb', 'ccc']
+
+
+def test_merge(heap):
+    other = PriorityDoubleLinkedList([4.5, -1])
+    node = other.push(10)
+    heap.merge(other)
+    assert len(heap) == 13 and len(other) == 0
+    heap.decrease_key(node, -2)
+    assert heap.pop_min() == 10
+    assert heap.pop_min() == -1
+
+
+# -------------- Handle Tests --------------
+def test_decrease_key(heap):
+    node = heap.push('task', 20)
+    heap.pop_min()
+    heap.decrease_key(node, 0.5)
+    assert node.priority == 0.5
+    assert heap.pop_min() == 'task'
+    assert heap.pop_min() == 1
+
+
+def test_decrease_key_higher(heap):
+    node = heap.push(3)
+    with pytest.raises(ValueError):
+        heap.decrease_key(node, 4)
+
+
+def test_remove_node(heap):
+    nodes = [heap.push(x) for x in (2.5, 3.5)]
+    heap.pop_min()
+    assert heap.remove_node(nodes[0]) == 2.5
+    assert list(heap.drain()) == [1, 2, 3, 3.5, 4, 5, 6, 7, 8, 9]
+
+
+def test_removed_node(heap):
+    node = heap.push(-1)
+    heap.pop_min()
+    with pytest.raises(ValueError):
+        heap.decrease_key(node, -2)
+    with pytest.raises(TypeError):
+        heap.remove_node(-1)
+
+
+def test_node_of_another_heap(heap):
+    other = PriorityDoubleLinkedList([1, 2])
+    node = other.push(3)
+    with pytest.raises(ValueError):
+        heap.decrease_key(node, -1)
+    with pytest.raises(ValueError):
+        heap.remove_node(node)
+    assert len(heap) == 10 and list(other.drain()) == [1, 2, 3]
+
+
+def test_node_after_chained_merges(heap):
+    first, second = PriorityDoubleLinkedList(), PriorityDoubleLinkedList()
+    node = first.push(20)
+    second.merge(first)
+    heap.merge(second)
+    first.push(30)
+    with pytest.raises(ValueError):
+        first.decrease_key(node, -1)
+    heap.decrease_key(node, -1)
+    assert heap.pop_min() == 20
+    assert first.pop_min() == 30
+
+
+# -------------- Serialization Tests --------------
+def test_pickle_large_heap():
+    heap = PriorityDoubleLinkedList(range(100000), key=abs)
+    for _ in range(10):
+        heap.pop_min()
+    heap.push('x', -1)
+    restored = pickle.loads(pickle.dumps(heap))
+    assert len(restored) == 99991 and restored.key is abs
+    assert list(restored.drain()) == ['x', *range(10, 100000)]
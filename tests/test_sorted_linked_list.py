@@ -0,0 +1,119 @@
+from sorted_linked_list import SortedDoubleLinkedList
+import pickle
+import pytest
+
+
+@pytest.fixture
+def sortedlist():
+    """
+    Returns a sorted linked list with the even numbers from 0 to 98
+    """
+    return SortedDoubleLinkedList(range(98, -1, -2))
+
+
+# -------------- Add Tests --------------
+def test_init_sorts(sortedlist):
+    assert [x.get() for x in sortedlist] == list(range(0, 100, 2))
+
+
+def test_add(sortedlist):
+    sortedlist.add(51)
+    assert sortedlist.find(51).prev.get() == 50
+    assert sortedlist.find(51).next.get() == 52
+
+
+def test_add_ends(sortedlist):
+    sortedlist.add(-1)
+    sortedlist.add(100)
+    assert sortedlist.head.get() == -1
+    assert sortedlist.tail.get() == 100
+
+
+def test_add_key_stable():
+    lst = SortedDoubleLinkedList(key=lambda x: x[0])
+    for item in [(1, 'a'), (0, 'b'), (1, 'c')]:
+        lst.add(item)
+    assert [x.get() for x in lst] == [(0, 'b'), (1, 'a'), (1, 'c')]
+
+
+def test_append_unsupported(sortedlist):
+    with pytest.raises(TypeError):
+        sortedlist.append(1)
+
+
+# -------------- Search Tests --------------
+def test_bisect(sortedlist):
+    assert sortedlist.bisect_left(10) == 5
+    assert sortedlist.bisect_right(10) == 6
+    assert sortedlist.bisect_left(11) == 6
+
+
+def test_irange(sortedlist):
+    assert list(sortedlist.irange(10, 20)) == [10, 12, 14, 16, 18, 20]
+    assert list(sortedlist.irange(10, 20, inclusive=(False, False))) == [12, 14, 16, 18]
+    assert list(sortedlist.irange(hi=4, reverse=True)) == [4, 2, 0]
+
+
+def test_contains(sortedlist):
+    assert 40 in sortedlist
+    assert 41 not in sortedlist
+
+
+# -------------- Serialization Tests --------------
+def test_pickle_keeps_key():
+    lst = SortedDoubleLinkedList([-3, 1, -2], key=abs)
+    restored = pickle.loads(pickle.dumps(lst))
+    assert restored.key is abs
+    assert [x.get() for x in restored] == [1, -2, -3]
+
+
+# -------------- Order Statistics Tests --------------
+def test_kth(sortedlist):
+    assert sortedlist.kth(0) == 0
+    assert sortedlist.kth(25) == 50
+    assert sortedlist.kth(-1) == 98
+    with pytest.raises(IndexError):
+        sortedlist.kth(50)
+
+
+def test_percentile_and_median():
+    sortedlist = SortedDoubleLinkedList([15, 1, 7, 3], order_stats=True)
+    assert sortedlist.median() == 5
+    assert sortedlist.percentile(0) == 1
+    assert sortedlist.percentile(100) == 15
+    assert sortedlist.percentile(25) == 2.5
+    sortedlist.add(4)
+    assert sortedlist.median() == 4
+    assert sortedlist.get_median().get() == 4
+    with pytest.raises(ValueError):
+        sortedlist.percentile(101)
+
+
+def test_running_median():
+    sortedlist = SortedDoubleLinkedList(order_stats=True)
+    window = []
+    for x in [5, 9, 1, 7, 3, 8, 2, 6]:
+        sortedlist.add(x)
+        window.append(x)
+        if len(window) > 3:
+            sortedlist.remove(window.pop(0))
+        if len(window) == 3:
+            assert sortedlist.median() == sorted(window)[1]
+
+
+def test_order_stats_after_update():
+    sortedlist = SortedDoubleLinkedList([50, 60, 70], order_stats=True)
+    sortedlist.update(range(40))
+    expected = list(range(40)) + [50, 60, 70]
+    assert [sortedlist.kth(k) for k in range(len(expected))] == expected
+    assert sortedlist.median() == 21
+    assert sortedlist.percentile(100) == 70
+    assert sortedlist.get_median().get() == 21
+
+
+def test_slice_keeps_options():
+    sortedlist = SortedDoubleLinkedList(range(10), key=lambda x: -x, index=True, order_stats=True)
+    page = sortedlist[2:6]
+    assert page._options() == sortedlist._options()
+    assert [x.get() for x in page] == [7, 6, 5, 4]
+    assert page.get_median().get() == 6
@@ -0,0 +1,79 @@
+from unrolled_linked_list import UnrolledDoubleLinkedList
+import pickle
+import pytest
+
+
+@pytest.fixture
+def emptylist():
+    return UnrolledDoubleLinkedList(block_size=4)
+
+
+@pytest.fixture
+def linkedlist():
+    """
+    Returns an unrolled linked list with 50 elements in ascending order in blocks of 4
+    """
+    return UnrolledDoubleLinkedList(range(50), block_size=4)
+
+
+# -------------- End Tests --------------
+def test_push_append(emptylist):
+    for x in range(5):
+        emptylist.push(-x)
+        emptylist.append(x)
+    assert list(emptylist) == [-4, -3, -2, -1, 0, 0, 1, 2, 3, 4]
+    assert emptylist.block_count() == 3
+
+
+def test_pop_pull(linkedlist):
+    assert linkedlist.pop() == 49
+    assert linkedlist.pull() == 0
+    assert len(linkedlist) == 48
+    assert linkedlist.first() == 1 and linkedlist.last() == 48
+
+
+def test_pull_empty(emptylist):
+    with pytest.raises(ValueError):
+        emptylist.pull()
+
+
+# -------------- Block Tests --------------
+def test_insert_splits_full_block(linkedlist):
+    blocks = linkedlist.block_count()
+    linkedlist.insert(5, 'x')
+    assert linkedlist.block_count() == blocks + 1
+    assert list(linkedlist[4:7]) == [4, 'x', 5]
+
+
+def test_delete_merges_blocks(linkedlist):
+    for _ in range(3):
+        del linkedlist[44]
+    assert linkedlist.block_count() == 12
+    assert list(linkedlist)[-4:] == [43, 47, 48, 49]
+    assert linkedlist.last() == 49
+
+
+# -------------- Search Tests --------------
+def test_positions(linkedlist):
+    assert linkedlist[30] == 30 and linkedlist[-1] == 49
+    assert linkedlist.find(37) == 37
+    assert linkedlist.get_median() == 24
+    assert 12 in linkedlist and 50 not in linkedlist
+    assert list(reversed(linkedlist))[:2] == [49, 48]
+
+
+def test_remove_and_sort(linkedlist):
+    linkedlist.remove(10)
+    with pytest.raises(ValueError):
+        linkedlist.remove(10)
+    linkedlist.sort_values(reverse=True)
+    assert list(linkedlist)[:3] == [49, 48, 47]
+    assert len(linkedlist) == 49
+
+
+# -------------- Serialization Tests --------------
+def test_pickle_large_list():
+    lst = UnrolledDoubleLinkedList(range(10 ** 6), block_size=16)
+    restored = pickle.loads(pickle.dumps(lst))
+    assert restored.block_size == 16 and len(restored) == 10 ** 6
+    assert list(restored) == list(lst)
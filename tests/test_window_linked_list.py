@@ -0,0 +1,147 @@
+from window_linked_list import WindowDoubleLinkedList
+import math
+import pickle
+import pytest
+
+
+@pytest.fixture
+def window():
+    """
+    Returns a window bounded to 5 elements holding 0 to 9, so 5 to 9 are left
+    """
+    return WindowDoubleLinkedList(range(10), maxlen=5)
+
+
+# -------------- Eviction Tests --------------
+def test_maxlen(window):
+    assert [x.get() for x in window] == [5, 6, 7, 8, 9]
+    window.append(10)
+    assert len(window) == 5
+    assert window.first() == 6
+
+
+def test_full_window_reuses_nodes(window):
+    node = window.head
+    window.append(10)
+    assert window.tail is node
+    assert window.tail.get() == 10
+
+
+def test_on_evict():
+    evicted = []
+    window = WindowDoubleLinkedList(maxlen=2, on_evict=evicted.append)
+    window.extend([1, 2, 3, 4])
+    assert evicted == [1, 2]
+    window.pull()
+    assert evicted == [1, 2]
+
+
+def test_max_age():
+    evicted = []
+    window = WindowDoubleLinkedList(max_age=10, timestamp=lambda x: x[0], value=lambda x: x[1],
+                                    on_evict=evicted.append)
+    window.extend([(0, 5), (4, 1), (9, 7), (12, 3)])
+    assert evicted == [(0, 5)]
+    assert window.expire(20) == 2
+    assert [x.get() for x in window] == [(12, 3)]
+
+
+def test_max_age_needs_timestamp():
+    with pytest.raises(ValueError):
+        WindowDoubleLinkedList(max_age=10)
+
+
+def test_unsupported(window):
+    with pytest.raises(TypeError):
+        window.push(1)
+    with pytest.raises(TypeError):
+        window.pop()
+
+
+# -------------- Aggregate Tests --------------
+def test_aggregates(window):
+    assert window.sum() == 35
+    assert window.mean() == 7
+    assert (window.min(), window.max()) == (5, 9)
+    window.append(0)
+    assert window.sum() == 30
+    assert (window.min(), window.max()) == (0, 9)
+    window.pull()
+    assert window.sum() == 24
+
+
+def test_aggregates_follow_window():
+    window = WindowDoubleLinkedList(maxlen=3)
+    values = [4, 2, 12, 3, 8, 1, 7, 7, 5, 9]
+    for i, x in enumerate(values):
+        window.append(x)
+        current = values[max(0, i - 2):i + 1]
+        assert window.min() == min(current)
+        assert window.max() == max(current)
+        assert window.sum() == sum(current)
+
+
+def test_aggregates_empty():
+    window = WindowDoubleLinkedList(maxlen=3)
+    assert window.sum() == 0
+    with pytest.raises(ValueError):
+        window.min()
+
+
+def test_pickle(window):
+    copy = pickle.loads(pickle.dumps(window))
+    assert copy.maxlen == 5
+    assert copy.max() == 9
+
+
+def test_sum_mixed_magnitudes():
+    window = WindowDoubleLinkedList(maxlen=2)
+    for x in (1e20, 1.0, 1.0):
+        window.append(x)
+    assert window.sum() == 2.0
+    assert window.mean() == 1.0
+    window.extend([0.1] * 10)
+    assert window.sum() == 0.2
+
+
+def test_sum_matches_fsum():
+    window = WindowDoubleLinkedList(maxlen=4)
+    values = [1e16, 1.0, -1e16, 3, 1e-8, 2.5e15, 0.1, 7, 1e100, 1.0, 1.0, 1.0, 1.0]
+    for i, x in enumerate(values):
+        window.append(x)
+        assert window.sum() == math.fsum(values[max(0, i - 3):i + 1])
+
+
+def test_non_numbers():
+    window = WindowDoubleLinkedList(['a', 'c', 'b', 'd'], maxlen=3)
+    assert [x.get() for x in window] == ['c', 'b', 'd']
+    assert (window.min(), window.max()) == ('b', 'd')
+    window.append((1, 2))
+    with pytest.raises(TypeError):
+        window.min()
+
+
+def test_dropped_aggregates_follow_window():
+    window = WindowDoubleLinkedList([3, 1], maxlen=3, value=lambda x: x if isinstance(x, int) else x[0])
+    window.append((4, 'x'))
+    window.extend([2, 7])
+    assert (window.min(), window.max(), window.sum()) == (2, 7, 13)
+
+
+def test_failed_value_keeps_window():
+    window = WindowDoubleLinkedList([1, 2, 3], maxlen=3, value=lambda x: 10 // x)
+    with pytest.raises(ZeroDivisionError):
+        window.append(0)
+    assert [x.get() for x in window] == [1, 2, 3]
+    assert window.sum() == 18
+
+
+def test_max_age_boundary():
+    window = WindowDoubleLinkedList(max_age=10, timestamp=lambda x: x)
+    window.extend([0, 1])
+    window.append(10)
+    assert [x.get() for x in window] == [1, 10]
+    assert window.expire(11) == 1
+    assert window.expire(19.5) == 0
+    with pytest.raises(ValueError):
+        WindowDoubleLinkedList(max_age=0, timestamp=lambda x: x)
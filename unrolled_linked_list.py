@@ -0,0 +1,350 @@
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Optional, Union
+
+
+class UnrolledDoubleLinkedList:
+    """
+    Double linked list of blocks that hold up to block_size elements each. Iteration and searches
+    run over the block lists at C speed and only follow one link per block, and the list needs one
+    node object per block instead of one per element. Full blocks are split in two on insert and
+    blocks that fall under half capacity are merged with the next one on delete. Elements are
+    addressed by position since single elements have no node objects
+    """
+    class _Block:
+        __slots__ = '_items', '_next', '_prev'
+
+        def __init__(self, items: list, nxt, prv) -> None:
+            """
+            :param items: list, elements of the block in list order
+            :param nxt: None or Block object, next in list order
+            :param prv: None or Block object, previous in list order
+            """
+            self._items = items
+            self._next = nxt
+            self._prev = prv
+
+    def __init__(self, array: Optional[Iterable] = None, block_size: int = 64):
+        """
+        :param array: None or iterable, elements appended to the list in order
+        :param block_size: int, maximum number of elements per block
+        """
+        if block_size < 2:
+            raise ValueError('block_size must be at least 2')
+        self._block_size = block_size
+        self._head = None
+        self._tail = None
+        self._size = 0
+        self._blocks = 0
+
+        if array is not None:
+            self.extend(array)
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def block_count(self) -> int:
+        """
+        Returns the number of blocks holding the elements
+        """
+        return self._blocks
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return self.values()
+
+    def _block_items(self):
+        block = self._head
+        while block is not None:
+            yield block._items
+            block = block._next
+
+    def values(self):
+        """
+        Iterates over the elements, the block lists are walked by chain at C speed
+        """
+        return chain.from_iterable(self._block_items())
+
+    def _block_items_reversed(self):
+        block = self._tail
+        while block is not None:
+            yield reversed(block._items)
+            block = block._prev
+
+    def __reversed__(self):
+        return chain.from_iterable(self._block_items_reversed())
+
+    def __contains__(self, value: Any) -> bool:
+        block = self._head
+        while block is not None:
+            if value in block._items:
+                return True
+            block = block._next
+        return False
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    # Serialization
+    def __getstate__(self) -> dict:
+        """
+        Returns the list as a flat sequence of elements, blocks are never pickled
+        """
+        return {'block_size': self._block_size, 'elements': list(self.values())}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(block_size=state['block_size'])
+        self.extend(state['elements'])
+
+    def __reduce__(self):
+        return self.__class__, (), self.__getstate__()
+
+    # Block management
+    def _link_block(self, items: list, after) -> _Block:
+        """
+        Creates a block with items after a block of this list
+        :param after: None to link the block at the front, or Block object on this list
+        """
+        nxt = self._head if after is None else after._next
+        block = self._Block(items, nxt, after)
+        if after is None:
+            self._head = block
+        else:
+            after._next = block
+        if nxt is None:
+            self._tail = block
+        else:
+            nxt._prev = block
+        self._blocks += 1
+        return block
+
+    def _unlink_block(self, block: _Block) -> None:
+        prv, nxt = block._prev, block._next
+        if prv is None:
+            self._head = nxt
+        else:
+            prv._next = nxt
+        if nxt is None:
+            self._tail = prv
+        else:
+            nxt._prev = prv
+        block._next = block._prev = None
+        self._blocks -= 1
+
+    def _rebalance(self, block: _Block) -> None:
+        """
+        Drops block when it is empty or merges it with the next block when both fit in one
+        """
+        items = block._items
+        if not items:
+            self._unlink_block(block)
+        elif len(items) < self._block_size // 2:
+            nxt = block._next
+            if nxt is not None and len(items) + len(nxt._items) <= self._block_size:
+                items.extend(nxt._items)
+                self._unlink_block(nxt)
+
+    def _position(self, index: int) -> int:
+        """
+        Converts a possibly negative index into a position from the head
+        """
+        if not isinstance(index, int):
+            raise TypeError(f'List indices must be integers or slices, not {type(index).__name__}')
+        position = index + self._size if index < 0 else index
+        if not 0 <= position < self._size:
+            raise IndexError('Linked list index out of range')
+        return position
+
+    def _locate(self, position: int):
+        """
+        Returns the block holding position and the offset inside it, walking from the nearer end
+        """
+        if position < self._size // 2:
+            block = self._head
+            while position >= len(block._items):
+                position -= len(block._items)
+                block = block._next
+            return block, position
+        position = self._size - position
+        block = self._tail
+        while position > len(block._items):
+            position -= len(block._items)
+            block = block._prev
+        return block, len(block._items) - position
+
+    # List interface
+    def push(self, e: Any) -> None:
+        """
+        Adds element "e" at the beginning of the list, in a new block when the first one is full
+        """
+        if self._head is None or len(self._head._items) >= self._block_size:
+            self._link_block([], None)
+        self._head._items.insert(0, e)
+        self._size += 1
+
+    def append(self, e: Any) -> None:
+        """
+        Adds element "e" at the end of the list, in a new block when the last one is full
+        """
+        if self._tail is None or len(self._tail._items) >= self._block_size:
+            self._link_block([], self._tail)
+        self._tail._items.append(e)
+        self._size += 1
+
+    def extend(self, iterable: Iterable) -> None:
+        """
+        Appends every element of iterable, filling the last block and then new full blocks
+        """
+        iterator = iter(iterable)
+        block = self._tail
+        if block is not None and len(block._items) < self._block_size:
+            room = self._block_size - len(block._items)
+            before = len(block._items)
+            block._items.extend(islice(iterator, room))
+            self._size += len(block._items) - before
+        while True:
+            items = list(islice(iterator, self._block_size))
+            if not items:
+                return
+            self._link_block(items, self._tail)
+            self._size += len(items)
+
+    def pull(self) -> Any:
+        """
+        Returns and deletes the first element of the list
+        """
+        if self._head is None:
+            raise ValueError('Linked list is empty')
+        block = self._head
+        e = block._items.pop(0)
+        self._size -= 1
+        if not block._items:
+            self._unlink_block(block)
+        return e
+
+    def pop(self) -> Any:
+        """
+        Returns and deletes the last element of the list
+        """
+        if self._tail is None:
+            raise ValueError('Linked list is empty')
+        block = self._tail
+        e = block._items.pop()
+        self._size -= 1
+        if not block._items:
+            self._unlink_block(block)
+        return e
+
+    def insert(self, index: int, e: Any) -> None:
+        """
+        Inserts element before position index, same as list.insert. A full block is split in two
+        :param index: int, position of the new element, clamped to the list bounds
+        :param e: Any, element inserted
+        """
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index == 0:
+            self.push(e)
+        elif index >= self._size:
+            self.append(e)
+        else:
+            block, offset = self._locate(index)
+            # Handle case where the block is full, its second half moves to a new block
+            if len(block._items) >= self._block_size:
+                half = len(block._items) // 2
+                self._link_block(block._items[half:], block)
+                del block._items[half:]
+                if offset > half:
+                    block, offset = block._next, offset - half
+            block._items.insert(offset, e)
+            self._size += 1
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """
+        Returns the element at position key or a new list with the elements selected by a slice
+        """
+        if isinstance(key, slice):
+            return self.__class__(list(self.values())[key], self._block_size)
+        block, offset = self._locate(self._position(key))
+        return block._items[offset]
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        block, offset = self._locate(self._position(key))
+        block._items[offset] = value
+
+    def __delitem__(self, key: int) -> None:
+        block, offset = self._locate(self._position(key))
+        del block._items[offset]
+        self._size -= 1
+        self._rebalance(block)
+
+    def remove(self, value: Any) -> None:
+        """
+        Deletes the first occurrence of value
+        :param value: Any, value to be removed
+        """
+        if self._size == 0:
+            raise ValueError('Linked list is empty')
+        block = self._head
+        while block is not None:
+            if value in block._items:
+                block._items.remove(value)
+                self._size -= 1
+                self._rebalance(block)
+                return
+            block = block._next
+        raise ValueError('Value not found')
+
+    # Getters
+    def first(self) -> Any:
+        if self._head is None:
+            raise ValueError('List is empty or does not have a head')
+        return self._head._items[0]
+
+    def last(self) -> Any:
+        if self._tail is None:
+            raise ValueError('List is empty or does not have a tail')
+        return self._tail._items[-1]
+
+    def get_median(self) -> Any:
+        """
+        Returns the median element of the list, the first of the two middle ones on even sizes
+        """
+        if self._size == 0:
+            raise ValueError('Linked list is empty')
+        block, offset = self._locate((self._size - 1) // 2)
+        return block._items[offset]
+
+    def find(self, value: Any) -> int:
+        """
+        :param value: Any, value to be found inside the list
+        :return: int, position of the first element equal to value
+        """
+        if self._size == 0:
+            raise TypeError('List is empty')
+
+        position = 0
+        block = self._head
+        while block is not None:
+            if value in block._items:
+                return position + block._items.index(value)
+            position += len(block._items)
+            block = block._next
+
+        raise ValueError('Value not found')
+
+    # Sorting
+    def sort_values(self, ascending: bool = True, key: Optional[Callable] = None, reverse: bool = False):
+        """
+        Sorts the list in place and refills it in full blocks
+        :param ascending: order of values
+        :param key: None or Callable applied to elements to get the value they are sorted by
+        :param reverse: if true, sorts in descending order like sorted(reverse=True)
+        """
+        values = sorted(self.values(), key=key, reverse=not ascending or reverse)
+        self._head = self._tail = None
+        self._size = self._blocks = 0
+        self.extend(values)
+        return self
@@ -0,0 +1,241 @@
+import math
+import numbers
+from collections import deque
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Optional
+
+from linked_list import DoubleLinkedList
+
+# Values the running aggregates can add and compare
+NUMBERS = (numbers.Real, Decimal)
+
+
+class WindowDoubleLinkedList(DoubleLinkedList):
+    """
+    Double linked list bounded to a sliding window. Elements are appended at the end and evicted
+    from the head once the window holds more than maxlen elements or once their timestamp is max_age
+    or more behind the newest one, every element is evicted once so append runs in amortized O(1).
+    While every value is a number, the sum, min and max of the window are kept up to date on every
+    change, the sum with exact float partial sums and min and max through monotonic deques, so reading
+    them never walks the list. Once another value is appended they are dropped and computed by walking
+    the list instead. A full window reuses the node it evicts for the new element
+    """
+    def __init__(self, array: Optional[Iterable] = None, maxlen: Optional[int] = None,
+                 max_age: Optional[float] = None, timestamp: Optional[Callable] = None,
+                 value: Optional[Callable] = None, on_evict: Optional[Callable] = None,
+                 index: bool = False, pool: int = 1):
+        """
+        :param array: None or iterable, elements appended to the window in order
+        :param maxlen: None or int, maximum number of elements, None for no size bound
+        :param max_age: None or positive float, elements with a timestamp max_age or more behind the
+            newest one are evicted, None for no age bound
+        :param timestamp: None or Callable mapping an element to its time, needed by max_age
+        :param value: None or Callable mapping an element to the number aggregated, None to aggregate
+            the elements themselves
+        :param on_evict: None or Callable, called with every element evicted by the window bounds
+        :param index: if true, keeps a value -> nodes hash index, see DoubleLinkedList
+        :param pool: int, maximum number of removed nodes kept for reuse, see DoubleLinkedList
+        """
+        if maxlen is not None and maxlen < 1:
+            raise ValueError('maxlen must be None or a positive integer')
+        if max_age is not None and max_age <= 0:
+            raise ValueError('max_age must be None or a positive number')
+        if max_age is not None and timestamp is None:
+            raise ValueError('max_age needs a timestamp function')
+        self._maxlen = maxlen
+        self._max_age = max_age
+        self._timestamp = timestamp
+        self._value = value
+        self._on_evict = on_evict
+        # Running aggregates, elements are numbered by append order to match them with the deques
+        self._aggregated = True
+        self._appended = 0
+        # Sum of the non float values and non overlapping partial sums of the float ones
+        self._total = 0
+        self._partials = []
+        self._mins = deque()
+        self._maxs = deque()
+        super().__init__(index=index, pool=pool)
+        if array is not None:
+            self.extend(array)
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        return self._maxlen
+
+    @property
+    def max_age(self) -> Optional[float]:
+        return self._max_age
+
+    def _options(self) -> dict:
+        return {'maxlen': self._maxlen, 'max_age': self._max_age, 'timestamp': self._timestamp,
+                'value': self._value, 'on_evict': self._on_evict, 'index': self._index is not None,
+                'pool': self._pool_max}
+
+    # Window interface
+    def append(self, e: Any) -> None:
+        """
+        Adds element "e" at the end of the window, evicting the elements that fall out of it
+        """
+        # Value and timestamp are computed first, so a failing function leaves the window as it was
+        v = e if self._value is None else self._value(e)
+        now = None if self._max_age is None else self._timestamp(e)
+        if self._aggregated and not isinstance(v, NUMBERS):
+            self._drop_aggregates()
+
+        # Handle case where the window is full, the evicted node is reused for the new element
+        if self._maxlen is not None and self._size >= self._maxlen:
+            self._evict()
+        super().append(e)
+
+        number = self._appended
+        self._appended += 1
+        if self._aggregated:
+            self._add(v)
+            # Drop the entries the new value hides: they leave the window before it
+            mins, maxs = self._mins, self._maxs
+            while mins and v <= mins[-1][0]:
+                mins.pop()
+            mins.append((v, number))
+            while maxs and v >= maxs[-1][0]:
+                maxs.pop()
+            maxs.append((v, number))
+
+        if now is not None:
+            self.expire(now)
+
+    def extend(self, iterable: Iterable) -> None:
+        """
+        Appends every element of iterable, evicting as it goes
+        """
+        for e in iterable:
+            self.append(e)
+
+    def pull(self) -> Any:
+        """
+        Returns and deletes the oldest element of the window, without calling on_evict
+        """
+        e = super().pull()
+        if not self._aggregated:
+            return e
+        v = e if self._value is None else self._value(e)
+        # Number of the element just removed, the oldest one left is numbered appended - size
+        number = self._appended - self._size - 1
+        self._add(-v)
+        if self._mins[0][1] == number:
+            self._mins.popleft()
+        if self._maxs[0][1] == number:
+            self._maxs.popleft()
+        return e
+
+    def _drop_aggregates(self) -> None:
+        """
+        Stops keeping the running aggregates, used once a value that is not a number is appended
+        """
+        self._aggregated = False
+        self._total = 0
+        self._partials = []
+        self._mins.clear()
+        self._maxs.clear()
+
+    def _values(self) -> Iterable:
+        return self.values() if self._value is None else map(self._value, self.values())
+
+    def _add(self, v: Any) -> None:
+        """
+        Adds v to the running sum. Floats go to the exact partial sums math.fsum uses, so removing
+        a large value gives back the small ones it absorbed, other numbers are added as they are
+        """
+        if not isinstance(v, float):
+            self._total += v
+            return
+        partials = self._partials
+        i = 0
+        for y in partials:
+            if abs(v) < abs(y):
+                v, y = y, v
+            hi = v + y
+            lo = y - (hi - v)
+            if lo:
+                partials[i] = lo
+                i += 1
+            v = hi
+        partials[i:] = [v]
+
+    def _sum(self) -> Any:
+        if not self._aggregated:
+            return sum(self._values())
+        # Handle case where floats were added, the other values join the partials for a single rounding
+        if self._partials:
+            return math.fsum([self._total, *self._partials])
+        return self._total
+
+    def _evict(self) -> None:
+        e = self.pull()
+        if self._on_evict is not None:
+            self._on_evict(e)
+
+    def expire(self, now: float) -> int:
+        """
+        Evicts the elements with a timestamp max_age or more behind now, that is at most now - max_age
+        :param now: float, current time on the same clock as the timestamps
+        :returns: int, number of elements evicted
+        """
+        if self._max_age is None:
+            raise ValueError('Window has no max_age')
+        limit = now - self._max_age
+        evicted = 0
+        while self._size and self._timestamp(self._head._element) <= limit:
+            self._evict()
+            evicted += 1
+        return evicted
+
+    # Running aggregates
+    def sum(self, start: Any = 0) -> Any:
+        """
+        Returns start plus the sum of the window values in O(1)
+        """
+        if not self._aggregated:
+            return sum(self._values(), start)
+        return start + self._sum()
+
+    def mean(self) -> float:
+        if self._size == 0:
+            raise ValueError('Linked list is empty')
+        return self._sum() / self._size
+
+    def min(self, key: Optional[Callable] = None) -> Any:
+        """
+        Returns the smallest window value in O(1) while the values are numbers, or the smallest element by key walking the list
+        """
+        if key is not None:
+            return super().min(key)
+        if self._size == 0:
+            raise ValueError('Linked list is empty')
+        # Handle case where the aggregates were dropped, the values are compared walking the list
+        if not self._aggregated:
+            return min(self._values())
+        return self._mins[0][0]
+
+    def max(self, key: Optional[Callable] = None) -> Any:
+        """
+        Returns the largest window value in O(1) while the values are numbers, or the largest element by key walking the list
+        """
+        if key is not None:
+            return super().max(key)
+        if self._size == 0:
+            raise ValueError('Linked list is empty')
+        # Handle case where the aggregates were dropped, the values are compared walking the list
+        if not self._aggregated:
+            return max(self._values())
+        return self._maxs[0][0]
+
+    # Operations that would break the window order or its aggregates
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError('Windows only append at the end and evict from the head')
+
+    push = extendleft = pop = insert = insert_after = insert_before = insert_sorted = _unsupported
+    remove = remove_node = move_to_front = move_to_end = reverse = reverse_rec = _unsupported
+    sort_values = filter_inplace = __setitem__ = __delitem__ = _unsupported
+    merge_sorted = splice = concat = split_at = _cut = _reset = _unsupported
+    _movable = False